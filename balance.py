@@ -0,0 +1,270 @@
+"""
+balance.py - Matrice d'équilibrage de "L'Héritage des Cendres"
+Simule chaque combinaison voie x arme x armure x ennemi avec le vrai moteur de
+combat (combat.resolve, sans affichage), répartie sur plusieurs processus, et
+écrit les résultats dans un fichier binaire en colonnes : un en-tête JSON suivi
+des tableaux bruts (module array), lisible sans aucune dépendance.
+
+Usage :
+    python balance.py --fights 1000 --seed 1 --output balance.bin
+    python balance.py --read balance.bin
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import combat
+from player import Player
+from item import ItemCatalog, Weapon, Armor
+from enemy import EnemyCatalog
+from rng import GameRandom
+from simulator import PATHS, BALANCE_ENEMIES
+
+
+# Signature des fichiers de résultats, suivie de la taille de l'en-tête JSON
+MAGIC = b"CENDRES\x01"
+HEADER_SIZE = struct.Struct("<I")
+
+# Colonnes du fichier : (nom, code de type du module array)
+COLUMNS = (
+    ("path", "B"), # Index dans la liste "path" de l'en-tête
+    ("weapon", "B"), # Index dans la liste "weapon" ("" = sans arme)
+    ("armor", "B"), # Index dans la liste "armor" ("" = sans armure)
+    ("enemy", "B"), # Index dans la liste "enemy" ("CLÉ:variante")
+    ("win_rate", "d"),
+    ("mean_rounds", "d"),
+    ("mean_damage_taken", "d")
+)
+
+# Combats simulés par combinaison par défaut
+DEFAULT_FIGHTS = 500
+
+
+# ============================================================================
+# CÔTÉ WORKER (exécuté dans les processus enfants)
+# ============================================================================
+
+def _simulate_group(path, weapon_id, armor_id, enemies, fights, seed):
+    """
+    Simule une voie et un équipement contre une liste d'ennemis
+
+    Args:
+        path (str): Voie du joueur
+        weapon_id (str): Arme équipée (None = aucune)
+        armor_id (str): Armure équipée (None = aucune)
+        enemies (list): Couples (clé du catalogue, variante)
+        fights (int): Combats par ennemi
+        seed (str): Graine du groupe (None = aléatoire)
+
+    Returns:
+        list[tuple]: (victoires, rounds cumulés, dégâts subis cumulés) par ennemi
+    """
+    rng = GameRandom(seed)
+    player = Player("Équilibrage", rng=rng)
+    player.choose_path(path)
+    for item_id in (weapon_id, armor_id):
+        if item_id is not None:
+            player.add_item(item_id, ItemCatalog.get_item(item_id))
+    if weapon_id is not None:
+        player.equip_weapon(weapon_id)
+    if armor_id is not None:
+        player.equip_armor(armor_id)
+    max_health = player.max_health
+
+    results = []
+    for enemy_type, variant in enemies:
+        wins = rounds = damage_taken = 0
+        for _ in range(fights):
+            player.health = max_health
+            enemy = EnemyCatalog.create_enemy(enemy_type, variant)
+            enemy.rng = rng
+            log = combat.resolve(player, enemy)
+            wins += log.victory
+            rounds += len(log.rounds)
+            damage_taken += max_health - player.health
+            EnemyCatalog.release(enemy)
+        results.append((wins, rounds, damage_taken))
+    return results
+
+
+# ============================================================================
+# MATRICE
+# ============================================================================
+
+def get_equipment():
+    """
+    Retourne les armes et armures du catalogue
+
+    Returns:
+        tuple: (ids des armes, ids des armures), chacun précédé de None (aucun)
+    """
+    items = ItemCatalog.get_prototypes()
+    weapons = [None] + [item_id for item_id, item in items.items() if isinstance(item, Weapon)]
+    armors = [None] + [item_id for item_id, item in items.items() if isinstance(item, Armor)]
+    return weapons, armors
+
+
+def run_matrix(fights=DEFAULT_FIGHTS, seed=None, workers=None, paths=PATHS, enemies=BALANCE_ENEMIES):
+    """
+    Simule toute la matrice voie x arme x armure x ennemi
+
+    Chaque groupe (voie, arme, armure) est une tâche du pool de processus, avec
+    sa propre graine : les résultats ne dépendent pas du nombre de workers.
+
+    Args:
+        fights (int): Combats par combinaison
+        seed (int, optional): Graine de base (résultats reproductibles)
+        workers (int, optional): Nombre de processus (par défaut : un par cœur)
+        paths (iterable): Voies à évaluer
+        enemies (iterable): Couples (clé du catalogue, variante)
+
+    Returns:
+        tuple: (en-tête, colonnes) au format de write_results()
+    """
+    weapons, armors = get_equipment()
+    enemies = list(enemies)
+    groups = [
+        (path, weapon_id, armor_id)
+        for path in paths
+        for weapon_id in weapons
+        for armor_id in armors
+    ]
+
+    columns = {name: array(typecode) for name, typecode in COLUMNS}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_simulate_group, path, weapon_id, armor_id, enemies, fights,
+                            None if seed is None else f"{seed}:{index}")
+            for index, (path, weapon_id, armor_id) in enumerate(groups)
+        ]
+        for (path, weapon_id, armor_id), future in zip(groups, futures):
+            for enemy_index, (wins, rounds, damage_taken) in enumerate(future.result()):
+                columns["path"].append(paths.index(path))
+                columns["weapon"].append(weapons.index(weapon_id))
+                columns["armor"].append(armors.index(armor_id))
+                columns["enemy"].append(enemy_index)
+                columns["win_rate"].append(wins / fights)
+                columns["mean_rounds"].append(rounds / fights)
+                columns["mean_damage_taken"].append(damage_taken / fights)
+
+    header = {
+        "fights": fights,
+        "seed": seed,
+        "rows": len(columns["path"]),
+        "labels": {
+            "path": list(paths),
+            "weapon": [weapon_id or "" for weapon_id in weapons],
+            "armor": [armor_id or "" for armor_id in armors],
+            "enemy": [f"{enemy_type}:{variant}" for enemy_type, variant in enemies]
+        }
+    }
+    return header, columns
+
+
+# ============================================================================
+# FICHIER EN COLONNES
+# ============================================================================
+
+def write_results(path, header, columns):
+    """
+    Écrit les résultats : signature, taille de l'en-tête, en-tête JSON, colonnes
+
+    L'en-tête décrit chaque colonne (type, position et taille en octets) ; les
+    colonnes sont les octets bruts des tableaux, dans l'ordre de l'hôte.
+
+    Args:
+        path (str): Fichier de sortie
+        header (dict): Métadonnées (combats, graine, libellés...)
+        columns (dict): Nom de colonne -> array
+    """
+    header = dict(header, byteorder=sys.byteorder, columns=[])
+    offset = 0
+    for name, typecode in COLUMNS:
+        size = len(columns[name]) * columns[name].itemsize
+        header["columns"].append({"name": name, "type": typecode, "offset": offset, "size": size})
+        offset += size
+    encoded = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(HEADER_SIZE.pack(len(encoded)))
+        file.write(encoded)
+        for name, _ in COLUMNS:
+            columns[name].tofile(file)
+
+
+def read_results(path):
+    """
+    Lit un fichier écrit par write_results()
+
+    Returns:
+        tuple: (en-tête, colonnes) avec colonnes : nom -> array
+
+    Raises:
+        ValueError: Si le fichier n'est pas un fichier de résultats
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Fichier de résultats invalide: {path}")
+        (size,) = HEADER_SIZE.unpack(file.read(HEADER_SIZE.size))
+        header = json.loads(file.read(size).decode("utf-8"))
+        data = file.read()
+
+    columns = {}
+    for column in header["columns"]:
+        start = column["offset"]
+        values = array(column["type"])
+        values.frombytes(data[start:start + column["size"]])
+        if header["byteorder"] != sys.byteorder:
+            values.byteswap()
+        columns[column["name"]] = values
+    return header, columns
+
+
+def format_results(header, columns):
+    """Retourne une ligne de résumé par combinaison"""
+    labels = header["labels"]
+    lines = []
+    for row in range(header["rows"]):
+        weapon = labels["weapon"][columns["weapon"][row]] or "aucune"
+        armor = labels["armor"][columns["armor"][row]] or "aucune"
+        lines.append(
+            f"{labels['path'][columns['path'][row]]:<6} {weapon:<22} {armor:<16} "
+            f"{labels['enemy'][columns['enemy'][row]]:<22} "
+            f"victoire {columns['win_rate'][row] * 100:6.2f}%  "
+            f"rounds {columns['mean_rounds'][row]:6.2f}  "
+            f"dégâts subis {columns['mean_damage_taken'][row]:6.2f}"
+        )
+    return lines
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Matrice d'équilibrage Ashes of Alderwood")
+    parser.add_argument("--fights", type=int, default=DEFAULT_FIGHTS, help="Combats par combinaison")
+    parser.add_argument("--seed", type=int, default=None, help="Graine (résultats reproductibles)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : un par cœur)")
+    parser.add_argument("--output", default="balance.bin", help="Fichier de résultats")
+    parser.add_argument("--read", metavar="FICHIER", help="Affiche un fichier de résultats existant")
+    args = parser.parse_args()
+
+    if args.read:
+        for line in format_results(*read_results(args.read)):
+            print(line)
+        return
+
+    start = time.perf_counter()
+    header, columns = run_matrix(args.fights, args.seed, args.workers)
+    write_results(args.output, header, columns)
+    print(f"{header['rows']} combinaisons x {args.fights} combats en "
+          f"{time.perf_counter() - start:.1f} s ({os.cpu_count()} cœurs) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
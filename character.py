@@ -1,10 +1,15 @@
 # Define the Character class for NPCs
 
+from rng import DEFAULT_RNG
+
 class Character:
     """
     Classe pour les Personnages Non Joueurs (PNJ)
     """
     
+    # Générateur aléatoire des déplacements (remplacé par celui du jeu)
+    rng = DEFAULT_RNG
+    
     def __init__(self, name, description, current_room, dialogue_lines, character_type="NEUTRE", quest_related=None):
         self.name = name
         self.description = description
@@ -14,6 +19,7 @@ class Character:
         self.quest_related = quest_related # Quête associée au PNJ
         self.dialogue_index = 0 # Index pour le cycle de dialogue
         self.has_met = False # Si le joueur a déjà rencontré ce PNJ
+        self.character_id = None # Clé du catalogue de PNJ
         
     def __str__(self):
         return f"{self.name} - {self.description}"
@@ -34,22 +40,37 @@ class Character:
     
     def move(self, available_rooms):
         """Déplace le PNJ aléatoirement dans une pièce adjacente"""
-        import random
+        new_room = self.choose_destination()
+        if new_room:
+            self.move_to(new_room)
+            return True
+        return False
+    
+    def choose_destination(self, rng=None):
+        """
+        Tire au sort la pièce adjacente où le PNJ va se déplacer (ou None)
+        
+        Args:
+            rng (GameRandom, optional): Générateur de la partie (par défaut self.rng)
+        """
+        rng = rng or self.rng
         
         # 30% de chance de se déplacer
-        if random.random() < 0.3:
+        if rng.chance(0.3):
             possible_exits = list(self.current_room.exits.keys())
             if possible_exits:
-                direction = random.choice(possible_exits)
-                new_room = self.current_room.exits[direction]
-                if new_room:
-                    # Retirer de l'ancienne pièce et ajouter à la nouvelle
-                    if self.name in self.current_room.characters:
-                        del self.current_room.characters[self.name]
-                    self.current_room = new_room
-                    new_room.characters[self.name] = self
-                    return True
-        return False
+                direction = rng.pick(possible_exits)
+                return self.current_room.exits[direction]
+        return None
+    
+    def move_to(self, new_room):
+        """Retire le PNJ de sa pièce actuelle et l'ajoute à la nouvelle"""
+        # Les pièces rangent les PNJ par leur clé de catalogue (ex: "morgrath")
+        key = self.character_id or self.name
+        if key in self.current_room.characters:
+            del self.current_room.characters[key]
+        self.current_room = new_room
+        new_room.characters[key] = self
 
 # Catalogue de PNJ prédéfinis
 def create_characters():
@@ -209,14 +230,25 @@ def get_character(character_name):
             original.character_type, 
             original.quest_related
         )
+        new_character.character_id = character_name
         return new_character
     return None
 
 def move_all_characters(rooms):
-    """Déplace tous les PNJ dans toutes les pièces"""
+    """
+    Déplace tous les PNJ dans toutes les pièces
+    
+    Args:
+        rooms: Les pièces du jeu (itérable ou dictionnaire). Si c'est un World
+            de session, seules les pièces réellement modifiées par un
+            déplacement sont copiées.
+    """
     moved_characters = []
+    world = rooms if hasattr(rooms, "edit") else None
+    if hasattr(rooms, "values"):
+        rooms = rooms.values()
     
-    for room in rooms:
+    for room in list(rooms):
         characters_to_move = list(room.characters.items()) # Copie pour éviter les modifications pendant l'itération
         
         for char_name, character in characters_to_move:
@@ -224,7 +256,19 @@ def move_all_characters(rooms):
             if character.character_type in ["MENTOR", "BOSS"]:
                 continue
                 
-            if character.move(rooms):
-                moved_characters.append(character.name)
+            new_room = character.choose_destination()
+            if not new_room:
+                continue
+            
+            if world is not None:
+                # Copier les deux pièces avant de les modifier
+                room = world.edit(room)
+                character = room.characters.get(char_name)
+                if character is None:
+                    continue
+                new_room = world.edit(new_room)
+            
+            character.move_to(new_room)
+            moved_characters.append(character.name)
     
     return moved_characters
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+combat.py - Moteur de résolution des combats pour "L'Héritage des Cendres"
+Le combat est résolu sans aucun affichage : chaque round produit un
+enregistrement compact (dégâts, critique, esquive, attaque spéciale, changement
+de phase...) ajouté au journal du combat. Le texte n'est produit que par
+render(), quand un joueur regarde ; simulations et sessions serveur peuvent
+s'en passer.
+"""
+
+from scheduler import TimerWheel
+from horde import Horde
+from modifiers import EXPIRED_TEXT
+from player import BURN_DAMAGE_TYPE
+
+
+# Texte des effets appliqués par le planificateur en début de round
+EFFECT_TEXTS = {
+    "POISON": " {name} - ☠ Poison: -{value} PV",
+    "BURN": " {name} - 🔥 Brûlure: -{value} PV",
+    "STUN": " {name} - 😵 Étourdi",
+    "REGEN": "🩹 {name} régénère {value} PV."
+}
+
+# Texte des effets des attaques spéciales des boss (valeur retournée par apply_special_effect)
+SPECIAL_EFFECT_TEXTS = {
+    "POISON": "☠ Vous êtes empoisonné : -{value} PV par round !",
+    "BURN": "🔥 Vous prenez feu : -{value} PV par round !",
+    "STUN": "😵 Vous êtes étourdi : vous perdrez votre prochaine attaque !",
+    "DRAIN": "🩸 {name} absorbe {value} PV !",
+    "HEAL_50": "🩹 {name} régénère {value} PV."
+}
+
+
+class CombatRound:
+    """Enregistrement d'un round de combat"""
+
+    __slots__ = (
+        "number", "effects", "player_effects", "expired", "player_health", "enemy_health", "enemy_phase",
+        "damage", "critical", "burn", "dealt",
+        "enemy_damage", "dodged", "special", "effect_value", "phase", "attackers"
+    )
+
+    def __init__(self, number, effects):
+        self.number = number
+        self.effects = effects # Couples (effet, valeur) appliqués en début de round
+        self.player_effects = () # Effets de statut subis par le joueur en début de round
+        self.expired = () # Effets temporaires du joueur expirés en début de round
+        # PV et phase au début du round (None si le round s'arrête aux effets)
+        self.player_health = None
+        self.enemy_health = None
+        self.enemy_phase = None
+        # Attaque du joueur (damage None : le joueur, étourdi, n'a pas attaqué)
+        self.damage = None
+        self.critical = False
+        self.burn = 0 # Dégâts de brûlure magique inclus dans damage
+        self.dealt = None # Dégâts annoncés (amplifiés par le pouvoir caché)
+        # Riposte de l'ennemi (enemy_damage None : l'ennemi n'a pas attaqué)
+        self.enemy_damage = None # Dégâts subis par le joueur
+        self.dodged = False
+        self.special = None # Attaque spéciale utilisée (dict du boss)
+        self.effect_value = 0 # Valeur de l'effet de l'attaque spéciale (0 : sans effet)
+        self.phase = None # Phase de l'ennemi après son attaque
+        self.attackers = 1 # Nombre d'attaquants (membres en vie d'une horde)
+
+
+class CombatLog:
+    """Journal d'un combat : participants, rounds et issue"""
+
+    def __init__(self, player, enemy, multiplier=1):
+        """
+        Args:
+            player (Player): Le joueur
+            enemy (Enemy): L'ennemi
+            multiplier (int): Multiplicateur du pouvoir caché (1 = inactif)
+        """
+        self.player = player
+        self.enemy = enemy
+        self.multiplier = multiplier
+        self.rounds = []
+        self.victory = False
+
+    def __len__(self):
+        return len(self.rounds)
+
+
+def resolve(player, enemy, multiplier=1):
+    """
+    Résout un combat jusqu'à la mort d'un des deux adversaires
+
+    Les effets de statut, la régénération et les recharges de l'ennemi sont
+    déclenchés par un planificateur de rounds ; les effets des attaques
+    spéciales des boss s'appliquent au joueur (poison, brûlure, étourdissement)
+    ou au boss (drain, soin). Rien n'est affiché.
+
+    Args:
+        player (Player): Le joueur
+        enemy (Enemy): L'ennemi
+        multiplier (int): Multiplicateur du pouvoir caché (1 = inactif)
+
+    Returns:
+        CombatLog: Le journal du combat
+    """
+    if isinstance(enemy, Horde):
+        return resolve_horde(player, enemy)
+    
+    log = CombatLog(player, enemy, multiplier)
+    rounds = log.rounds
+    # Planificateur des rounds : effets de statut, régénération, recharges
+    timers = TimerWheel()
+    enemy.schedule_round_events(timers)
+    number = 1
+    while player.health > 0 and enemy.is_alive():
+        # Événements arrivés à échéance ce round
+        timers.advance()
+        record = CombatRound(number, enemy.collect_round_effects())
+        rounds.append(record)
+        # Chaque round compte comme un tour pour les effets temporaires du joueur
+        if player.modifiers.heap:
+            record.expired = player.tick_modifiers()
+        if not enemy.is_alive():
+            break
+
+        # Effets infligés au joueur par les attaques spéciales des rounds précédents
+        stunned = False
+        if player.is_poisoned or player.is_burning or player.is_stunned:
+            record.player_effects = tuple(player.process_status_effects())
+            stunned = ("STUN", 0) in record.player_effects
+            if not player.is_alive():
+                break
+
+        record.player_health = player.health
+        record.enemy_health = enemy.health
+        record.enemy_phase = getattr(enemy, "phase", None)
+
+        # Tour du joueur (perdu s'il est étourdi)
+        if not stunned:
+            damage, record.critical, record.burn = player.roll_attack()
+            record.damage = record.dealt = damage
+            if multiplier != 1:
+                # Le pouvoir caché remplace les dégâts normaux par des dégâts amplifiés :
+                # type de la voie et de l'arme, brûlure en dégâts de feu
+                burn = int(record.burn * multiplier)
+                record.dealt = int((damage - record.burn) * multiplier) + burn
+                enemy.take_damage(record.dealt - burn, player.get_combat_stats().damage_type)
+                if burn:
+                    enemy.take_damage(burn, BURN_DAMAGE_TYPE)
+            else:
+                player.deal_damage(enemy, damage, record.burn)
+
+            if not enemy.is_alive():
+                break
+
+        # Tour de l'ennemi
+        taken = player.defend(enemy.calculate_damage())
+        record.enemy_damage = taken
+        record.dodged = taken == 0
+        record.special = enemy.last_special
+        if record.special is not None:
+            record.effect_value = enemy.apply_special_effect(player, taken)
+        record.phase = getattr(enemy, "phase", None)
+
+        if not player.is_alive():
+            break
+
+        number += 1
+    enemy.clear_round_events()
+    player.clear_status_effects()
+
+    log.victory = not enemy.is_alive()
+    return log
+
+
+def resolve_horde(player, horde):
+    """
+    Résout un combat contre une horde
+
+    Chaque round, les effets de statut de toute la horde sont traités en une
+    passe, le joueur frappe le premier membre en vie (la brûlure magique touche
+    toute la horde) puis chaque membre en vie attaque.
+
+    Args:
+        player (Player): Le joueur
+        horde (Horde): La horde
+
+    Returns:
+        CombatLog: Le journal du combat (dodged : nombre d'attaques esquivées)
+    """
+    log = CombatLog(player, horde)
+    rounds = log.rounds
+    number = 1
+    while player.health > 0 and horde.is_alive():
+        record = CombatRound(number, tuple(horde.process_status_effects()))
+        rounds.append(record)
+        if player.modifiers.heap:
+            record.expired = player.tick_modifiers()
+        if not horde.is_alive():
+            break
+
+        record.player_health = player.health
+        record.enemy_health = horde.total_health()
+
+        # Tour du joueur : coup sur le premier membre, brûlure de zone
+        damage, record.critical, record.burn = player.roll_attack()
+        damage_type = player.get_combat_stats().damage_type
+        horde.take_damage(horde.first_alive(), damage - record.burn, damage_type)
+        if record.burn:
+            horde.area_damage(record.burn, BURN_DAMAGE_TYPE)
+        record.damage = record.dealt = damage
+
+        if not horde.is_alive():
+            break
+
+        # Tour de la horde
+        taken = dodged = 0
+        attacks = horde.attack()
+        for enemy_damage in attacks:
+            damage_taken = player.defend(enemy_damage)
+            taken += damage_taken
+            dodged += damage_taken == 0
+            if not player.is_alive():
+                break
+        record.enemy_damage = taken
+        record.dodged = dodged
+        record.attackers = len(attacks)
+
+        if not player.is_alive():
+            break
+
+        number += 1
+
+    log.victory = not horde.is_alive()
+    return log
+
+
+def render(log, output, show_phase=False):
+    """
+    Écrit le déroulé d'un combat à partir de son journal
+
+    Args:
+        log (CombatLog): Journal produit par resolve()
+        output (OutputSink): Sortie texte
+        show_phase (bool): Affiche la phase de l'ennemi à chaque round
+    """
+    for record in log.rounds:
+        render_round(log, record, output, show_phase)
+
+
+def render_round(log, record, output, show_phase=False):
+    """Écrit un round du combat (voir render)"""
+    player = log.player
+    enemy = log.enemy
+    for effect, value in record.effects:
+        output.print(EFFECT_TEXTS[effect].format(name=enemy.name, value=value))
+    for effect, value in record.player_effects:
+        output.print(EFFECT_TEXTS[effect].format(name=player.name, value=value))
+    for stat, amount, source in record.expired:
+        output.print(EXPIRED_TEXT.format(source=source or stat, amount=amount, stat=stat))
+    if record.player_health is None:
+        return
+
+    output.print(f"\n--- Round {record.number} ---")
+    output.print(f"{player.name}: {record.player_health}/{player.max_health} PV")
+    if log.multiplier != 1:
+        output.print("⭐ POUVOIR CACHÉ ACTIF ⭐")
+    # Une horde affiche ses PV cumulés
+    max_health = sum(enemy.max_health) if isinstance(enemy, Horde) else enemy.max_health
+    status = f"{enemy.name}: {record.enemy_health}/{max_health} PV"
+    if show_phase:
+        status += f" (Phase {record.enemy_phase})"
+    output.print(status)
+
+    # Tour du joueur
+    if record.critical:
+        output.print("⭐ Coup critique !")
+    if record.burn:
+        output.print(f"🔥 Brûlure magique ! +{record.burn} dégâts")
+    if record.damage is None:
+        output.print("😵 Vous êtes étourdi et perdez votre attaque !")
+    elif log.multiplier != 1:
+        output.print(f"🌟 HÉRITAGE DES CENDRES ! 🌟")
+        output.print(f"Vous infligez {record.dealt} dégâts DÉVASTATEURS à {enemy.name} !")
+    else:
+        output.print(f"🗡️ Vous infligez {record.dealt} dégâts à {enemy.name} !")
+    if record.enemy_damage is None:
+        return
+
+    # Tour de l'ennemi
+    if record.phase is not None:
+        for phase in range(record.enemy_phase + 1, record.phase + 1):
+            for line in enemy.get_phase_description(phase):
+                output.print(line)
+    special = record.special
+    if special is not None:
+        output.print(f"\n💥 {enemy.name} utilise {special['name']} !")
+        if "description" in special:
+            output.print(f" {special['description']}")
+        if special.get("effect"):
+            output.print(f" Effet: {special['effect']}")
+    if record.attackers > 1:
+        output.print(f"{record.attackers} ennemis attaquent ! 💨 Esquives : {record.dodged}")
+    elif record.dodged:
+        output.print("💨 Vous esquivez l'attaque !")
+    output.print(f"{enemy.name} vous inflige {record.enemy_damage} dégâts !")
+    if record.effect_value:
+        output.print(SPECIAL_EFFECT_TEXTS[special["effect"]].format(name=enemy.name, value=record.effect_value))
@@ -9,9 +9,10 @@ class Command:
         help_string (str): The help string.
         action (function): The action to execute when the command is called.
         number_of_parameters (int): The number of parameters expected by the command.
+        aliases (tuple): The other words that trigger the command.
 
     Methods:
-        __init__(self, command_word, help_string, action, number_of_parameters) : The constructor.
+        __init__(self, command_word, help_string, action, number_of_parameters, aliases) : The constructor.
         __str__(self) : The string representation of the command.
 
     Examples:
@@ -30,13 +31,103 @@ class Command:
     """
 
     # The constructor.
-    def __init__(self, command_word, help_string, action, number_of_parameters):
+    def __init__(self, command_word, help_string, action, number_of_parameters, aliases=()):
         self.command_word = command_word
         self.help_string = help_string
         self.action = action
         self.number_of_parameters = number_of_parameters
+        self.aliases = tuple(aliases)
     
     # The string representation of the command.
     def __str__(self):
+        if self.aliases:
+            return self.command_word \
+                    + " (" + ", ".join(self.aliases) + ")" \
+                    + self.help_string
         return self.command_word \
-                + self.help_string
\ No newline at end of file
+                + self.help_string
+
+
+class CommandRegistry:
+    """
+    This class holds the commands of the game and resolves the words typed by the player.
+    The lookup table is compiled once: every command word, every alias and every
+    unambiguous prefix of them maps directly to its Command.
+
+    Attributes:
+        commands (dict): The canonical command word -> Command.
+        table (dict): The compiled lookup table, word -> Command.
+
+    Examples:
+
+    >>> registry = CommandRegistry()
+    >>> registry.register(Command("look", " - Observer la pièce", None, 0, ("observer",)))
+    >>> registry.register(Command("take", " - Prendre un objet", None, 1, ("prendre",)))
+    >>> registry.register(Command("talk", " - Parler à un PNJ", None, 1, ("parler",)))
+    >>> registry.compile()
+    >>> registry.resolve("observer").command_word
+    'look'
+    >>> registry.resolve("ta") is None
+    True
+    >>> registry.resolve("tak").command_word
+    'take'
+
+    """
+
+    def __init__(self):
+        self.commands = {}
+        self.table = {}
+
+    def register(self, command):
+        """Add a command (the table must be compiled again afterwards)."""
+        self.commands[command.command_word] = command
+
+    def compile(self):
+        """Build the lookup table from the words, aliases and unique prefixes."""
+        table = {}
+        prefixes = {}
+        for command in self.commands.values():
+            for word in (command.command_word,) + command.aliases:
+                table[word] = command
+                for length in range(1, len(word)):
+                    prefixes.setdefault(word[:length], set()).add(command)
+        # A prefix is kept only if it designates a single command and is not a full word.
+        for prefix, candidates in prefixes.items():
+            if len(candidates) == 1 and prefix not in table:
+                table[prefix] = next(iter(candidates))
+        self.table = table
+
+    def resolve(self, word):
+        """Return the Command matching a typed word, or None."""
+        return self.table.get(word)
+
+    def get_help_lines(self):
+        """Return one help line per command, generated from the registry."""
+        lines = []
+        for command in self.commands.values():
+            usage = command.command_word
+            if command.number_of_parameters:
+                usage += " <...>" * command.number_of_parameters
+            if command.aliases:
+                usage += " (" + ", ".join(command.aliases) + ")"
+            lines.append(usage + command.help_string)
+        return lines
+
+    # Mapping-like access on the canonical commands.
+    def __contains__(self, word):
+        return word in self.table
+
+    def __getitem__(self, word):
+        return self.table[word]
+
+    def __len__(self):
+        return len(self.commands)
+
+    def keys(self):
+        return self.commands.keys()
+
+    def values(self):
+        return self.commands.values()
+
+    def items(self):
+        return self.commands.items()
\ No newline at end of file
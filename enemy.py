@@ -2,18 +2,60 @@
 enemy.py - Système d'ennemis, de combat et de gestion des monstres pour "L'Héritage des Cendres"
 """
 
-import random
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from operator import attrgetter
+from types import MappingProxyType
 
+from loot import LootCatalog
+from rng import DEFAULT_RNG
+from sampling import AliasTable
 
-class Enemy(ABC):
-    """Classe abstraite de base pour tous les ennemis"""
+
+# Types de dégâts, dans l'ordre des colonnes des tables de multiplicateurs
+DAMAGE_TYPES = ("PHYSICAL", "MAGICAL", "FIRE", "ICE", "LIGHTNING")
+DAMAGE_TYPE_INDEX = {damage_type: index for index, damage_type in enumerate(DAMAGE_TYPES)}
+
+
+def build_multiplier_table(resistance, weakness):
+    """
+    Calcule le multiplicateur de dégâts de chaque type
+    
+    Args:
+        resistance (dict): Résistances aux types de dégâts
+        weakness (dict): Faiblesses aux types de dégâts
+        
+    Returns:
+        tuple: Multiplicateurs indexés comme DAMAGE_TYPES
+    """
+    table = []
+    for damage_type in DAMAGE_TYPES:
+        multiplier = 1.0
+        if damage_type in resistance:
+            multiplier *= (1 - resistance[damage_type])
+        if damage_type in weakness:
+            multiplier *= (1 + weakness[damage_type])
+        table.append(multiplier)
+    return tuple(table)
+
+
+class EnemyTemplate:
+    """
+    Données fixes d'une variante d'ennemi, partagées par toutes ses instances.
+    Construites une fois au chargement du module ; les dictionnaires sont figés
+    pour qu'aucune instance ne modifie le modèle des autres.
+    """
+    
+    __slots__ = (
+        "name", "health", "damage", "enemy_type", "experience", "gold_range",
+        "resistance", "weakness", "damage_multipliers", "regeneration",
+        "phase_health", "phase_triggers", "special_attacks"
+    )
     
-    def __init__(self, name, health, damage, enemy_type, experience=0, 
-                 gold_range=(0, 0), resistance=None, weakness=None):
+    def __init__(self, name, health, damage, enemy_type, experience=0,
+                 gold_range=(0, 0), resistance=None, weakness=None, regeneration=0,
+                 phase_health=0, phase_triggers=(), special_attacks=()):
         """
-        Initialise un ennemi
-        
         Args:
             name (str): Nom de l'ennemi
             health (int): Points de vie maximum
@@ -23,16 +65,78 @@ class Enemy(ABC):
             gold_range (tuple): Plage d'or donné (min, max)
             resistance (dict): Résistances aux types de dégâts
             weakness (dict): Faiblesses aux types de dégâts
+            regeneration (int): PV régénérés par round
+            phase_health (float): Part des PV sous laquelle un boss passe en phase 2
+            phase_triggers (tuple): Seuils de PV des phases suivantes (Morgrath)
+            special_attacks (list): Attaques spéciales d'un boss ("weight" : poids du tirage, 1 par défaut)
         """
         self.name = name
         self.health = health
-        self.max_health = health
-        self.base_damage = damage
+        self.damage = damage
         self.enemy_type = enemy_type
         self.experience = experience
-        self.gold_range = gold_range
-        self.resistance = resistance or {}
-        self.weakness = weakness or {}
+        self.gold_range = tuple(gold_range)
+        self.resistance = MappingProxyType(dict(resistance or {}))
+        self.weakness = MappingProxyType(dict(weakness or {}))
+        # Multiplicateurs de dégâts par type (indexés comme DAMAGE_TYPES)
+        self.damage_multipliers = build_multiplier_table(self.resistance, self.weakness)
+        self.regeneration = regeneration
+        self.phase_health = int(health * phase_health)
+        self.phase_triggers = tuple(phase_triggers)
+        self.special_attacks = tuple(MappingProxyType(dict(special)) for special in special_attacks)
+
+
+def template_field(field):
+    """Attribut en lecture seule lu dans le modèle de l'ennemi"""
+    return property(attrgetter("template." + field))
+
+
+class Enemy(ABC):
+    """
+    Classe abstraite de base pour tous les ennemis
+    
+    Une instance ne contient que l'état de combat (PV, statuts, planificateur) ;
+    nom, butin, résistances... sont lus dans son EnemyTemplate.
+    """
+    
+    __slots__ = (
+        "template", "catalog_key", "variant",
+        "health", "max_health", "base_damage",
+        "is_stunned", "is_poisoned", "poison_damage", "poison_duration",
+        "is_burning", "burn_damage", "burn_duration",
+        "rng", "timers", "status_timer", "round_effects", "last_special"
+    )
+    
+    name = template_field("name")
+    enemy_type = template_field("enemy_type")
+    experience = template_field("experience")
+    gold_range = template_field("gold_range")
+    resistance = template_field("resistance")
+    weakness = template_field("weakness")
+    damage_multipliers = template_field("damage_multipliers")
+    regeneration = template_field("regeneration")
+    
+    def __init__(self, template):
+        """
+        Initialise un ennemi
+        
+        Args:
+            template (EnemyTemplate): Modèle de la variante
+        """
+        self.template = template
+        
+        # Identifiants stables, définis par EnemyCatalog (pour les sauvegardes)
+        self.catalog_key = None
+        self.variant = None
+        
+        self.reset()
+    
+    def reset(self):
+        """Remet l'ennemi dans l'état de son modèle (création ou sortie du pool)"""
+        template = self.template
+        self.health = template.health
+        self.max_health = template.health
+        self.base_damage = template.damage
         
         # État de combat
         self.is_stunned = False
@@ -43,6 +147,16 @@ class Enemy(ABC):
         self.burn_damage = 0
         self.burn_duration = 0
         
+        # Générateur aléatoire des jets de combat (remplacé par celui du jeu)
+        self.rng = DEFAULT_RNG
+        # Planificateur des rounds du combat en cours (None hors combat)
+        self.timers = None
+        self.status_timer = None
+        # Effets appliqués par le planificateur depuis le dernier relevé (None hors combat)
+        self.round_effects = None
+        # Dernière attaque spéciale utilisée (None après une attaque normale)
+        self.last_special = None
+        
     def __str__(self):
         """Représentation textuelle de l'ennemi"""
         health_percent = (self.health / self.max_health) * 100
@@ -70,12 +184,8 @@ class Enemy(ABC):
             tuple: (dégâts réels, était critique)
         """
         # Appliquer résistances/faiblesses
-        multiplier = 1.0
-        
-        if damage_type in self.resistance:
-            multiplier *= (1 - self.resistance[damage_type])
-        if damage_type in self.weakness:
-            multiplier *= (1 + self.weakness[damage_type])
+        index = DAMAGE_TYPE_INDEX.get(damage_type)
+        multiplier = self.damage_multipliers[index] if index is not None else 1.0
             
         actual_damage = int(damage * multiplier)
         
@@ -108,27 +218,75 @@ class Enemy(ABC):
             self.burn_duration = duration
         elif effect_type == "STUN":
             self.is_stunned = True
+        if self.timers is not None and self.status_timer is None:
+            self.status_timer = self.timers.every(1, self.tick_status_effects)
+    
+    def schedule_round_events(self, timers):
+        """
+        Enregistre les événements de round de l'ennemi pour un combat
+        
+        Args:
+            timers (TimerWheel): Planificateur des rounds du combat
+        """
+        self.timers = timers
+        self.status_timer = None
+        self.round_effects = []
+        if self.is_poisoned or self.is_burning or self.is_stunned:
+            self.status_timer = timers.every(1, self.tick_status_effects)
+    
+    def clear_round_events(self):
+        """Détache l'ennemi du planificateur à la fin du combat"""
+        self.timers = None
+        self.status_timer = None
+        self.round_effects = None
+    
+    def collect_round_effects(self):
+        """
+        Relève les effets appliqués par le planificateur depuis le dernier appel
+        
+        Returns:
+            tuple: Couples (effet, valeur), ex. ("POISON", 3) ou ("REGEN", 2)
+        """
+        effects = self.round_effects
+        if not effects:
+            return ()
+        self.round_effects = []
+        return tuple(effects)
+    
+    def tick_status_effects(self):
+        """Applique les effets de statut d'un round (appelé par le planificateur)"""
+        self.round_effects.extend(self.process_status_effects())
+        if self.health < 0:
+            self.health = 0
+        if not (self.is_poisoned or self.is_burning or self.is_stunned):
+            self.timers.cancel(self.status_timer)
+            self.status_timer = None
     
     def process_status_effects(self):
-        """Traite les effets de statut au début du tour"""
+        """
+        Traite les effets de statut au début du tour
+        
+        Returns:
+            list: Couples (effet, valeur) des effets appliqués
+        """
         effects = []
         
         if self.is_poisoned and self.poison_duration > 0:
             self.health -= self.poison_damage
             self.poison_duration -= 1
-            effects.append(f"☠ Poison: -{self.poison_damage} PV")
+            effects.append(("POISON", self.poison_damage))
             if self.poison_duration <= 0:
                 self.is_poisoned = False
                 
         if self.is_burning and self.burn_duration > 0:
             self.health -= self.burn_damage
             self.burn_duration -= 1
-            effects.append(f"🔥 Brûlure: -{self.burn_damage} PV")
+            effects.append(("BURN", self.burn_damage))
             if self.burn_duration <= 0:
                 self.is_burning = False
                 
         if self.is_stunned:
-            effects.append("😵 Étourdi")
+            effects.append(("STUN", 0))
             self.is_stunned = False # Stun dure 1 tour
             
         return effects
@@ -142,12 +300,19 @@ class Enemy(ABC):
         """Retourne la description de l'attaque"""
         pass
     
+    def get_phase_description(self, phase):
+        """Retourne les lignes annonçant le passage à une phase (boss uniquement)"""
+        return []
+    
     def drop_loot(self):
-        """Génère le butin de l'ennemi"""
-        gold = random.randint(self.gold_range[0], self.gold_range[1])
+        """Génère le butin de l'ennemi (objets selon sa table, et la phase atteinte pour un boss)"""
+        gold = self.rng.between(self.gold_range[0], self.gold_range[1])
+        table = LootCatalog.get_table(self.catalog_key, self.variant)
+        drops = table.roll(self.rng, getattr(self, "phase", 1)) if table is not None else ()
         return {
             "gold": gold,
-            "experience": self.experience
+            "experience": self.experience,
+            "items": LootCatalog.create_items(drops)
         }
     
     def get_full_info(self):
@@ -181,32 +346,29 @@ class Enemy(ABC):
 class Goblin(Enemy):
     """Gobelin - Ennemi faible mais nombreux"""
     
-    def __init__(self, variant="normal"):
-        variants = {
+    __slots__ = ()
+    
+    # Variantes : nom, PV, dégâts, XP, or
+    VARIANTS = {
+        variant: EnemyTemplate(name, health, damage, "GOBELIN", exp, gold_range,
+                               weakness={"FIRE": 0.25})
+        for variant, (name, health, damage, exp, gold_range) in {
             "normal": ("Gobelin", 20, 4, 10, (1, 5)),
             "archer": ("Gobelin Archer", 15, 5, 12, (2, 6)),
             "brute": ("Gobelin Brute", 30, 6, 15, (3, 8))
-        }
-        
-        name, health, damage, exp, gold_range = variants.get(variant, variants["normal"])
-        
-        super().__init__(
-            name=name,
-            health=health,
-            damage=damage,
-            enemy_type="GOBELIN",
-            experience=exp,
-            gold_range=gold_range,
-            weakness={"FIRE": 0.25}
-        )
+        }.items()
+    }
+    
+    def __init__(self, variant="normal"):
+        super().__init__(self.VARIANTS.get(variant, self.VARIANTS["normal"]))
     
     def calculate_damage(self):
         """Les gobelins ont des attaques imprévisibles"""
-        damage = random.randint(self.base_damage - 2, self.base_damage + 3)
+        damage = self.rng.between(self.base_damage - 2, self.base_damage + 3)
         # 20% chance de coup faible, 10% chance de coup fort
-        if random.random() < 0.2:
+        if self.rng.chance(0.2):
             damage = max(1, damage - 3)
-        elif random.random() < 0.1:
+        elif self.rng.chance(0.1):
             damage += 4
         return max(1, damage)
     
@@ -218,37 +380,34 @@ class Goblin(Enemy):
             f"{self.name} mord sauvagement !",
             f"{self.name} attaque avec un couteau tordu !"
         ]
-        return random.choice(attacks)
+        return self.rng.pick(attacks)
 
 
 class Orc(Enemy):
     """Orc - Ennemi équilibré et résistant"""
     
-    def __init__(self, rank="soldat"):
-        ranks = {
+    __slots__ = ()
+    
+    # Rangs : nom, PV, dégâts, XP, or
+    VARIANTS = {
+        rank: EnemyTemplate(name, health, damage, "ORC", exp, gold_range,
+                            resistance={"PHYSICAL": 0.15},
+                            weakness={"MAGICAL": 0.20})
+        for rank, (name, health, damage, exp, gold_range) in {
             "soldat": ("Orc Soldat", 40, 8, 25, (5, 15)),
             "berserker": ("Orc Berserker", 35, 10, 30, (8, 20)),
             "chef": ("Orc Chef", 60, 12, 40, (15, 30))
-        }
-        
-        name, health, damage, exp, gold_range = ranks.get(rank, ranks["soldat"])
-        
-        super().__init__(
-            name=name,
-            health=health,
-            damage=damage,
-            enemy_type="ORC",
-            experience=exp,
-            gold_range=gold_range,
-            resistance={"PHYSICAL": 0.15},
-            weakness={"MAGICAL": 0.20}
-        )
+        }.items()
+    }
+    
+    def __init__(self, rank="soldat"):
+        super().__init__(self.VARIANTS.get(rank, self.VARIANTS["soldat"]))
     
     def calculate_damage(self):
         """Les orcs ont des attaques puissantes et stables"""
-        damage = random.randint(self.base_damage - 1, self.base_damage + 2)
+        damage = self.rng.between(self.base_damage - 1, self.base_damage + 2)
         # Les berserkers ont 25% de chance de coup enragé
-        if "berserker" in self.name.lower() and random.random() < 0.25:
+        if "berserker" in self.name.lower() and self.rng.chance(0.25):
             damage = int(damage * 1.5)
         return max(1, damage)
     
@@ -266,43 +425,39 @@ class Orc(Enemy):
                 f"{self.name} frappe avec discipline martiale !",
                 f"{self.name} exécute une attaque tournoyante !"
             ]
-        return random.choice(attacks)
+        return self.rng.pick(attacks)
 
 
 class Troll(Enemy):
     """Troll - Lent mais très résistant, régénère des PV"""
     
-    def __init__(self, variant="caverne"):
-        variants = {
+    __slots__ = ()
+    
+    # Variantes : nom, PV, dégâts, XP, or
+    VARIANTS = {
+        variant: EnemyTemplate(name, health, damage, "TROLL", exp, gold_range,
+                               resistance={"PHYSICAL": 0.25, "MAGICAL": 0.10},
+                               weakness={"FIRE": 0.50},
+                               regeneration=3)
+        for variant, (name, health, damage, exp, gold_range) in {
             "caverne": ("Troll des Cavernes", 60, 10, 50, (20, 40)),
             "des_forets": ("Troll des Forêts", 55, 12, 60, (25, 45)),
             "des_montagnes": ("Troll des Montagnes", 70, 15, 80, (30, 60))
-        }
-        
-        name, health, damage, exp, gold_range = variants.get(variant, variants["caverne"])
-        
-        super().__init__(
-            name=name,
-            health=health,
-            damage=damage,
-            enemy_type="TROLL",
-            experience=exp,
-            gold_range=gold_range,
-            resistance={"PHYSICAL": 0.25, "MAGICAL": 0.10},
-            weakness={"FIRE": 0.50}
-        )
-        
-        self.regeneration = 3
+        }.items()
+    }
+    
+    def __init__(self, variant="caverne"):
+        super().__init__(self.VARIANTS.get(variant, self.VARIANTS["caverne"]))
     
     def calculate_damage(self):
         """Les trolls frappent lentement mais fort"""
         # 30% chance de rater à cause de la lenteur
-        if random.random() < 0.3:
+        if self.rng.chance(0.3):
             return 0
         
-        damage = random.randint(self.base_damage, self.base_damage + 5)
+        damage = self.rng.between(self.base_damage, self.base_damage + 5)
         # 15% chance de coup écrasant
-        if random.random() < 0.15:
+        if self.rng.chance(0.15):
             damage = int(damage * 1.8)
         return max(1, damage)
     
@@ -314,7 +469,18 @@ class Troll(Enemy):
             f"{self.name} lance un rocher !",
             f"{self.name} tente de vous écraser !"
         ]
-        return random.choice(attacks)
+        return self.rng.pick(attacks)
+    
+    def schedule_round_events(self, timers):
+        """Le troll régénère à chaque round du combat"""
+        super().schedule_round_events(timers)
+        timers.every(1, self.tick_regeneration)
+    
+    def tick_regeneration(self):
+        """Régénération d'un round (appelé par le planificateur)"""
+        healed = self.regenerate()
+        if healed:
+            self.round_effects.append(("REGEN", healed))
     
     def regenerate(self):
         """Le troll régénère des PV chaque tour"""
@@ -325,63 +491,211 @@ class Troll(Enemy):
         return 0
 
 
+# ============================================================================
+# COMPORTEMENT DES BOSS
+# ============================================================================
+
+# Effets des attaques spéciales sur le joueur : (dégâts par round, durée en rounds)
+SPECIAL_POISON = (3, 3)
+SPECIAL_BURN = (5, 2)
+# PV rendus au boss par l'effet "HEAL_50"
+SPECIAL_HEAL = 50
+
+
+def poison_player(boss, player, damage_taken):
+    """POISON : le joueur touché est empoisonné"""
+    if not damage_taken:
+        return 0
+    player.apply_status_effect("POISON", *SPECIAL_POISON)
+    return SPECIAL_POISON[0]
+
+
+def burn_player(boss, player, damage_taken):
+    """BURN : le joueur touché prend feu"""
+    if not damage_taken:
+        return 0
+    player.apply_status_effect("BURN", *SPECIAL_BURN)
+    return SPECIAL_BURN[0]
+
+
+def stun_player(boss, player, damage_taken):
+    """STUN : le joueur touché perd sa prochaine attaque"""
+    if not damage_taken:
+        return 0
+    player.apply_status_effect("STUN")
+    return 1
+
+
+def drain_player(boss, player, damage_taken):
+    """DRAIN : le boss récupère les PV qu'il vient d'infliger"""
+    return boss.heal(damage_taken)
+
+
+def heal_boss(boss, player, damage_taken):
+    """HEAL_50 : le boss régénère SPECIAL_HEAL PV, même si l'attaque est esquivée"""
+    return boss.heal(SPECIAL_HEAL)
+
+
+# Effet d'une attaque spéciale -> fonction (boss, joueur, dégâts subis) -> valeur affichée (0 : sans effet)
+SPECIAL_EFFECTS = {
+    "POISON": poison_player,
+    "BURN": burn_player,
+    "STUN": stun_player,
+    "DRAIN": drain_player,
+    "HEAL_50": heal_boss
+}
+
+
+class BossTable:
+    """
+    Comportement d'un boss compilé en tables, partagé par ses instances
+
+    La phase se lit par recherche dichotomique dans les seuils de PV ; chaque
+    phase a sa ligne d'attaque normale (dégâts min/max, multiplicateur, chance
+    d'attaque spéciale) et les attaques spéciales sont tirées dans une table
+    d'alias. Un round de boss coûte ainsi autant qu'un round d'ennemi ordinaire.
+    """
+
+    __slots__ = ("thresholds", "phases", "specials", "special_cooldown")
+
+    def __init__(self, thresholds, phases, special_attacks, special_cooldown):
+        """
+        Args:
+            thresholds (iterable): Seuils de PV (atteindre un seuil fait passer à la phase suivante)
+            phases (iterable): Par phase (1, 2...) : (dégâts min, dégâts max, multiplicateur, chance de spéciale)
+            special_attacks (sequence): Attaques spéciales (dicts du modèle)
+            special_cooldown (int): Attaques normales entre deux attaques spéciales
+        """
+        self.thresholds = tuple(sorted(thresholds))
+        self.phases = tuple(phases)
+        self.specials = None
+        if special_attacks:
+            weights = [special.get("weight", 1) for special in special_attacks]
+            self.specials = AliasTable(special_attacks, weights)
+        self.special_cooldown = special_cooldown
+
+    def phase_for(self, health):
+        """Phase correspondant aux PV (1 + nombre de seuils atteints)"""
+        return len(self.thresholds) - bisect_left(self.thresholds, health) + 1
+
+
 class Boss(Enemy):
     """Boss - Ennemi spécial avec phases et attaques spéciales"""
     
-    def __init__(self, name, health, damage, phase_health=0.5, special_attacks=None):
-        super().__init__(
-            name=name,
-            health=health,
-            damage=damage,
-            enemy_type="BOSS",
-            experience=200,
-            gold_range=(100, 200),
-            resistance={"PHYSICAL": 0.20, "MAGICAL": 0.20}
+    __slots__ = ("phase", "special_cooldown", "enraged", "table")
+    
+    phase_health = template_field("phase_health")
+    phase_triggers = template_field("phase_triggers")
+    special_attacks = template_field("special_attacks")
+    
+    # Tables compilées, par modèle (voir get_table)
+    tables = {}
+    
+    @classmethod
+    def build_table(cls, template):
+        """Phase 2 (enragé, dégâts x1.5) sous phase_health ; spéciale à 30%, recharge de 3"""
+        damage = template.damage
+        phases = (
+            (damage - 2, damage + 4, 1.0, 0.3),
+            (damage - 2, damage + 4, 1.5, 0.3)
         )
-        
-        self.max_health = health
-        self.phase_health = int(health * phase_health)
+        return BossTable((template.phase_health,), phases, template.special_attacks, 3)
+    
+    @classmethod
+    def get_table(cls, template):
+        """Table du modèle, compilée au premier boss créé"""
+        table = cls.tables.get(template)
+        if table is None:
+            table = cls.tables[template] = cls.build_table(template)
+        return table
+    
+    def reset(self):
+        """Remet le boss en phase 1, sans recharge en cours"""
+        super().reset()
         self.phase = 1
-        self.special_attacks = special_attacks or []
         self.special_cooldown = 0
         self.enraged = False
+        self.table = self.get_table(self.template)
     
     def calculate_damage(self):
-        """Les boss ont des attaques variées"""
-        # Vérifier la phase
-        if self.health <= self.phase_health and self.phase == 1:
-            self.phase = 2
+        """Attaque selon la ligne de la phase courante, ou attaque spéciale"""
+        self.last_special = None
+        table = self.table
+        
+        # Les phases ne font qu'avancer (même si le boss se soigne)
+        phase = table.phase_for(self.health)
+        if phase > self.phase:
+            self.phase = phase
             self.enraged = True
-            print(f"\n⚡ {self.name} entre en phase 2 ! Il est enragé ! ⚡")
+        low, high, multiplier, special_chance = table.phases[self.phase - 1]
         
         # Attaque spéciale si disponible
-        if self.special_attacks and self.special_cooldown <= 0 and random.random() < 0.3:
-            self.special_cooldown = 3
+        if table.specials is not None and self.special_cooldown <= 0 and self.rng.chance(special_chance):
+            self.start_special_cooldown(table.special_cooldown)
             return self.use_special_attack()
         
-        # Attaque normale avec bonus si enragé
-        damage = random.randint(self.base_damage - 2, self.base_damage + 4)
-        if self.enraged:
-            damage = int(damage * 1.5)
-            
-        self.special_cooldown = max(0, self.special_cooldown - 1)
+        damage = int(self.rng.between(low, high) * multiplier)
+        self.cool_down()
         return max(1, damage)
     
-    def use_special_attack(self):
-        """Utilise une attaque spéciale"""
-        special = random.choice(self.special_attacks)
-        damage = special["damage"]
-        effect = special.get("effect")
+    def heal(self, amount):
+        """Rend des PV au boss (sans dépasser le maximum) ; retourne les PV rendus"""
+        old_health = self.health
+        self.health = min(self.max_health, self.health + amount)
+        return self.health - old_health
+    
+    def apply_special_effect(self, player, damage_taken):
+        """
+        Applique l'effet de la dernière attaque spéciale
         
-        print(f"\n💥 {self.name} utilise {special['name']} !")
-        if "description" in special:
-            print(f" {special['description']}")
-            
-        # Appliquer les effets spéciaux
-        if effect:
-            print(f" Effet: {effect}")
+        Args:
+            player (Player): Cible de l'attaque
+            damage_taken (int): Dégâts subis par le joueur (0 : attaque esquivée)
             
-        return damage
+        Returns:
+            int: Valeur de l'effet (PV rendus, dégâts par round...), 0 s'il n'a rien fait
+        """
+        special = self.last_special
+        handler = SPECIAL_EFFECTS.get(special.get("effect")) if special is not None else None
+        if handler is None:
+            return 0
+        return handler(self, player, damage_taken)
+    
+    def schedule_round_events(self, timers):
+        """Une recharge en cours au début du combat se termine par le planificateur"""
+        super().schedule_round_events(timers)
+        if self.special_cooldown > 0:
+            timers.schedule(self.special_cooldown + 1, self.end_special_cooldown)
+    
+    def start_special_cooldown(self, rounds):
+        """
+        Bloque les attaques spéciales pendant `rounds` attaques normales
+        
+        En combat, la fin de la recharge est planifiée sur le planificateur des
+        rounds ; sinon, le compteur est décrémenté à chaque attaque normale.
+        """
+        self.special_cooldown = rounds
+        if self.timers is not None:
+            self.timers.schedule(rounds + 1, self.end_special_cooldown)
+    
+    def cool_down(self):
+        """Décrémente la recharge après une attaque normale (hors planificateur)"""
+        if self.timers is None:
+            self.special_cooldown = max(0, self.special_cooldown - 1)
+    
+    def end_special_cooldown(self):
+        """Fin de la recharge (appelé par le planificateur)"""
+        self.special_cooldown = 0
+    
+    def use_special_attack(self):
+        """Utilise une attaque spéciale (retenue dans last_special pour l'affichage)"""
+        special = self.table.specials.sample(self.rng)
+        self.last_special = special
+        return special["damage"]
+    
+    def get_phase_description(self, phase):
+        """Annonce du passage en phase 2"""
+        return [f"\n⚡ {self.name} entre en phase 2 ! Il est enragé ! ⚡"]
     
     def get_attack_description(self):
         """Description des attaques de boss"""
@@ -397,18 +711,32 @@ class Boss(Enemy):
                 f"{self.name} utilise sa force écrasante !",
                 f"{self.name} montre pourquoi il est le chef !"
             ]
-        return random.choice(attacks)
+        return self.rng.pick(attacks)
 
 
 # ============================================================================
 # BOSS SPÉCIFIQUES DU JEU
 # ============================================================================
 
+# Résistances communes à tous les boss
+BOSS_RESISTANCE = {"PHYSICAL": 0.20, "MAGICAL": 0.20}
+
+
 class ChefGobelin(Boss):
     """Boss des Gobelins - Acte 3"""
     
-    def __init__(self):
-        special_attacks = [
+    __slots__ = ()
+    
+    TEMPLATE = EnemyTemplate(
+        name="Grok le Chef Gobelin",
+        health=80,
+        damage=10,
+        enemy_type="BOSS",
+        experience=100,
+        gold_range=(50, 100),
+        resistance=BOSS_RESISTANCE,
+        phase_health=0.4,
+        special_attacks=[
             {
                 "name": "Appel des Renforts",
                 "damage": 5,
@@ -426,24 +754,28 @@ class ChefGobelin(Boss):
                 "effect": "STUN"
             }
         ]
-        
-        super().__init__(
-            name="Grok le Chef Gobelin",
-            health=80,
-            damage=10,
-            phase_health=0.4,
-            special_attacks=special_attacks
-        )
-        
-        self.gold_range = (50, 100)
-        self.experience = 100
+    )
+    
+    def __init__(self):
+        super().__init__(self.TEMPLATE)
 
 
 class ChefTroll(Boss):
     """Boss des Trolls - Acte 5"""
     
-    def __init__(self):
-        special_attacks = [
+    __slots__ = ()
+    
+    TEMPLATE = EnemyTemplate(
+        name="Borog le Chef Troll",
+        health=120,
+        damage=18,
+        enemy_type="BOSS",
+        experience=200,
+        gold_range=(150, 250),
+        resistance=BOSS_RESISTANCE,
+        regeneration=5,
+        phase_health=0.3,
+        special_attacks=[
             {
                 "name": "Écrasement de Montagne",
                 "damage": 25,
@@ -461,25 +793,28 @@ class ChefTroll(Boss):
                 "description": "Un énorme rocher est lancé avec précision !"
             }
         ]
-        
-        super().__init__(
-            name="Borog le Chef Troll",
-            health=120,
-            damage=18,
-            phase_health=0.3,
-            special_attacks=special_attacks
-        )
-        
-        self.gold_range = (150, 250)
-        self.experience = 200
-        self.regeneration = 5
+    )
+    
+    def __init__(self):
+        super().__init__(self.TEMPLATE)
 
 
 class Morgrath(Boss):
     """Boss Final - Roi Démon - L'antagoniste principal du jeu"""
     
-    def __init__(self):
-        special_attacks = [
+    __slots__ = ()
+    
+    TEMPLATE = EnemyTemplate(
+        name="Morgrath, le Roi Démon",
+        health=250,
+        damage=28,
+        enemy_type="BOSS",
+        experience=500,
+        gold_range=(500, 1000),
+        resistance=BOSS_RESISTANCE,
+        phase_health=0.5,
+        phase_triggers=(200, 150, 100),
+        special_attacks=[
             {
                 "name": "Vague de Corruption",
                 "damage": 20,
@@ -511,55 +846,38 @@ class Morgrath(Boss):
                 "effect": "POISON"
             }
         ]
-        
-        super().__init__(
-            name="Morgrath, le Roi Démon",
-            health=250,
-            damage=28,
-            phase_health=0.5,
-            special_attacks=special_attacks
-        )
-        
-        self.max_health = 250
-        self.gold_range = (500, 1000)
-        self.experience = 500
-        self.phase = 1
-        self.phase_triggers = [200, 150, 100]
-        self.enrage_threshold = 150
+    )
     
-    def calculate_damage(self):
-        """Morgrath a plusieurs phases avec des attaques de plus en plus puissantes"""
-        # Vérifier les changements de phase
-        for i, trigger in enumerate(self.phase_triggers):
-            if self.health <= trigger and self.phase < i + 2:
-                self.phase = i + 2
-                print(f"\n" + "="*60)
-                print(f"⚡ PHASE {self.phase} - MORGRATH INTENSIFIE SON ATTAQUE ! ⚡")
-                print("="*60)
-                # Augmenter les dégâts à chaque phase
-                self.base_damage += 8
-                
-                # Messages spéciaux par phase
-                if self.phase == 2:
-                    print("Morgrath: Enfin, un adversaire qui mérite mon attention !")
-                elif self.phase == 3:
-                    print("Morgrath: Tu oses me défier dans mon propre domaine ?!")
-                elif self.phase == 4:
-                    print("Morgrath: Prépare-toi à connaître la véritable puissance !")
-        
-        # Chance d'attaque spéciale augmente selon la phase
-        special_chance = 0.3 + (self.phase * 0.1)
-        
-        if self.special_attacks and self.special_cooldown <= 0 and random.random() < special_chance:
-            self.special_cooldown = 2
-            return self.use_special_attack()
-        
-        # Attaque normale avec bonus de phase
-        damage = random.randint(self.base_damage - 3, self.base_damage + 8)
-        damage = int(damage * (1 + (self.phase - 1) * 0.25))
-        
-        self.special_cooldown = max(0, self.special_cooldown - 1)
-        return max(1, damage)
+    def __init__(self):
+        super().__init__(self.TEMPLATE)
+    
+    @classmethod
+    def build_table(cls, template):
+        """
+        Une phase par seuil de phase_triggers : chaque phase ajoute 8 aux dégâts
+        de base, 25% au multiplicateur et 10% à la chance d'attaque spéciale
+        """
+        phases = []
+        for phase in range(1, len(template.phase_triggers) + 2):
+            damage = template.damage + 8 * (phase - 1)
+            phases.append((damage - 3, damage + 8, 1 + (phase - 1) * 0.25, 0.3 + (phase * 0.1)))
+        return BossTable(template.phase_triggers, phases, template.special_attacks, 2)
+    
+    def get_phase_description(self, phase):
+        """Annonce d'une nouvelle phase de Morgrath"""
+        lines = [
+            "\n" + "="*60,
+            f"⚡ PHASE {phase} - MORGRATH INTENSIFIE SON ATTAQUE ! ⚡",
+            "="*60
+        ]
+        # Messages spéciaux par phase
+        if phase == 2:
+            lines.append("Morgrath: Enfin, un adversaire qui mérite mon attention !")
+        elif phase == 3:
+            lines.append("Morgrath: Tu oses me défier dans mon propre domaine ?!")
+        elif phase == 4:
+            lines.append("Morgrath: Prépare-toi à connaître la véritable puissance !")
+        return lines
     
     def get_attack_description(self):
         """Description des attaques de Morgrath selon sa phase"""
@@ -590,7 +908,7 @@ class Morgrath(Boss):
                 f"{self.name} vous fixe avec ses yeux rouges enflammés !",
                 f"{self.name} commence à révéler sa véritable nature !"
             ]
-        return random.choice(attacks)
+        return self.rng.pick(attacks)
     
     def get_full_info(self):
         """Informations détaillées sur Morgrath"""
@@ -607,13 +925,29 @@ class Morgrath(Boss):
 # CATALOGUE D'ENNEMIS
 # ============================================================================
 
+# Nombre maximum d'ennemis libérés gardés par variante
+POOL_SIZE = 64
+
+
 class EnemyCatalog:
     """Catalogue central de tous les ennemis du jeu"""
     
+    ENEMY_CLASSES = {
+        "GOBELIN": Goblin,
+        "ORC": Orc,
+        "TROLL": Troll,
+        "CHEF_GOBELIN": ChefGobelin,
+        "CHEF_TROLL": ChefTroll,
+        "MORGRATH": Morgrath
+    }
+    
+    # Ennemis vaincus prêts à être réutilisés : (type, variante) -> liste
+    pool = {}
+    
     @staticmethod
     def create_enemy(enemy_type, variant="normal"):
         """
-        Crée une instance d'ennemi
+        Crée une instance d'ennemi (ou réutilise un ennemi libéré du même type)
         
         Args:
             enemy_type (str): Type d'ennemi ("GOBELIN", "ORC", "TROLL", "BOSS")
@@ -622,26 +956,38 @@ class EnemyCatalog:
         Returns:
             Enemy: Instance de l'ennemi
         """
-        enemy_classes = {
-            "GOBELIN": Goblin,
-            "ORC": Orc,
-            "TROLL": Troll,
-            "CHEF_GOBELIN": ChefGobelin,
-            "CHEF_TROLL": ChefTroll,
-            "MORGRATH": Morgrath
-        }
-        
-        if enemy_type in enemy_classes:
-            if enemy_type == "GOBELIN":
-                return Goblin(variant)
-            elif enemy_type == "ORC":
-                return Orc(variant)
-            elif enemy_type == "TROLL":
-                return Troll(variant)
-            else:
-                return enemy_classes[enemy_type]()
+        free = EnemyCatalog.pool.get((enemy_type, variant))
+        if free:
+            enemy = free.pop()
+            enemy.reset()
+            return enemy
+        
+        enemy_class = EnemyCatalog.ENEMY_CLASSES.get(enemy_type)
+        if enemy_class is None:
+            return None
+        if enemy_class in (Goblin, Orc, Troll):
+            enemy = enemy_class(variant)
+        else:
+            enemy = enemy_class()
+        enemy.catalog_key = enemy_type
+        enemy.variant = variant
+        return enemy
+    
+    @staticmethod
+    def release(enemy):
+        """
+        Rend un ennemi vaincu au catalogue pour un prochain create_enemy
+        (l'ennemi ne doit plus être référencé ailleurs)
         
-        return None
+        Args:
+            enemy (Enemy): L'ennemi retiré du jeu (les hordes sont ignorées)
+        """
+        if not isinstance(enemy, Enemy) or enemy.catalog_key is None:
+            return
+        free = EnemyCatalog.pool.setdefault((enemy.catalog_key, enemy.variant), [])
+        if len(free) < POOL_SIZE:
+            enemy.clear_round_events()
+            free.append(enemy)
     
     @staticmethod
     def get_enemy_info(enemy_type):
@@ -60,3 +60,4 @@ class GameGUI(tk.Tk):
 
         command = self.game.commands[cmd]
         command.action(self.game, list_of_words, command.number_of_parameters)
+        self.game.output.flush()
@@ -0,0 +1,316 @@
+"""
+horde.py - Hordes d'ennemis pour "L'Héritage des Cendres"
+Une horde regroupe de nombreux ennemis d'une même classe (ex: 50 gobelins de
+variantes diverses) sous forme de tableaux parallèles : PV, dégâts, poison,
+brûlure, étourdissement. Dégâts groupés, attaques de zone et effets de statut
+sont appliqués en une passe sur les tableaux, sans un objet Enemy par monstre.
+"""
+
+import copy
+from array import array
+from collections import Counter
+
+from enemy import EnemyCatalog, DAMAGE_TYPE_INDEX
+from loot import LootCatalog
+from rng import DEFAULT_RNG
+
+
+# Colonnes d'état d'une horde, dans l'ordre des sauvegardes
+HORDE_FIELDS = (
+    "health", "max_health", "base_damage",
+    "poison_damage", "poison_duration", "burn_damage", "burn_duration", "stunned"
+)
+
+
+class Horde:
+    """
+    Groupe d'ennemis d'une même classe stocké en tableaux parallèles
+
+    Les règles sont celles des ennemis isolés : résistances de la variante,
+    process_status_effects() pour le poison, la brûlure et l'étourdissement,
+    régénération des trolls, calculate_damage() de la classe pour les attaques.
+
+    Examples:
+
+    >>> horde = Horde("GOBELIN", ["normal"] * 3 + ["brute"])
+    >>> len(horde), horde.count_alive(), horde.health.tolist()
+    (4, 4, [20, 20, 20, 30])
+    >>> horde.area_damage(8, "FIRE")
+    40
+    >>> horde.apply_status_effect("POISON", 3, 2)
+    >>> horde.process_status_effects()
+    [('POISON', 12)]
+    >>> horde.health.tolist()
+    [7, 7, 7, 17]
+    """
+
+    def __init__(self, enemy_type, variants, name=None):
+        """
+        Args:
+            enemy_type (str): Clé de EnemyCatalog d'un ennemi à variantes ("GOBELIN", "ORC", "TROLL")
+            variants (list): Variante de chaque membre de la horde
+            name (str, optional): Nom affiché (par défaut : "Horde de <ennemi>")
+        """
+        enemy_class = EnemyCatalog.ENEMY_CLASSES.get(enemy_type)
+        if enemy_class is None or not hasattr(enemy_class, "VARIANTS"):
+            raise ValueError(f"Pas de horde possible pour l'ennemi: {enemy_type}")
+        if not variants:
+            raise ValueError("Une horde doit compter au moins un ennemi.")
+
+        self.catalog_key = enemy_type
+        self.variants = tuple(variants)
+        self.rng = DEFAULT_RNG
+
+        # Un ennemi par variante présente, utilisé comme modèle et pour les jets d'attaque
+        self.members = {}
+        kinds = []
+        for variant in self.variants:
+            if variant not in self.members:
+                self.members[variant] = enemy_class(variant)
+            kinds.append(self.members[variant])
+        self.kinds = kinds # Ennemi modèle de chaque membre (partagé par variante)
+        self.name = name or f"Horde de {kinds[0].name}"
+
+        count = len(kinds)
+        self.health = array("l", [enemy.max_health for enemy in kinds])
+        self.max_health = array("l", self.health)
+        self.base_damage = array("l", [enemy.base_damage for enemy in kinds])
+        self.poison_damage = array("l", [0]) * count
+        self.poison_duration = array("l", [0]) * count
+        self.burn_damage = array("l", [0]) * count
+        self.burn_duration = array("l", [0]) * count
+        self.stunned = array("b", [0]) * count
+
+    def __copy__(self):
+        """Copie indépendante (les tableaux ne sont pas partagés)"""
+        horde = object.__new__(Horde)
+        horde.__dict__.update(self.__dict__)
+        for field in HORDE_FIELDS:
+            setattr(horde, field, copy.copy(getattr(self, field)))
+        return horde
+
+    def __len__(self):
+        return len(self.health)
+
+    def __str__(self):
+        """Représentation textuelle de la horde"""
+        return (f"{self.name} ({self.count_alive()}/{len(self)} debout, "
+                f"{self.total_health()}/{sum(self.max_health)} PV)")
+
+    def is_alive(self):
+        """Vérifie s'il reste au moins un membre en vie"""
+        return any(self.health)
+
+    def count_alive(self):
+        """Nombre de membres en vie"""
+        return len(self.health) - self.health.count(0)
+
+    def total_health(self):
+        """PV cumulés des membres"""
+        return sum(self.health)
+
+    def first_alive(self):
+        """Index du premier membre en vie (-1 si la horde est vaincue)"""
+        for index, health in enumerate(self.health):
+            if health > 0:
+                return index
+        return -1
+
+    def take_damage(self, index, damage, damage_type="PHYSICAL"):
+        """
+        Inflige des dégâts à un membre (règle de Enemy.take_damage)
+
+        Returns:
+            int: Dégâts réellement subis (0 si le membre était déjà mort)
+        """
+        health = self.health[index]
+        if health <= 0:
+            return 0
+        type_index = DAMAGE_TYPE_INDEX.get(damage_type)
+        multiplier = self.kinds[index].damage_multipliers[type_index] if type_index is not None else 1.0
+        actual_damage = max(1, int(damage * multiplier))
+        self.health[index] = max(0, health - actual_damage)
+        return actual_damage
+
+    def take_damage_batch(self, indices, damages, damage_type="PHYSICAL"):
+        """
+        Inflige des dégâts à plusieurs membres en une passe
+
+        Args:
+            indices (iterable): Index des membres touchés
+            damages (iterable): Dégâts de base de chaque coup
+            damage_type (str): Type de dégâts
+
+        Returns:
+            int: Total des dégâts réellement subis
+        """
+        type_index = DAMAGE_TYPE_INDEX.get(damage_type)
+        health = self.health
+        kinds = self.kinds
+        total = 0
+        for index, damage in zip(indices, damages):
+            current = health[index]
+            if current <= 0:
+                continue
+            if type_index is not None:
+                damage = damage * kinds[index].damage_multipliers[type_index]
+            actual_damage = max(1, int(damage))
+            health[index] = max(0, current - actual_damage)
+            total += actual_damage
+        return total
+
+    def area_damage(self, damage, damage_type="PHYSICAL"):
+        """
+        Attaque de zone : les mêmes dégâts de base frappent tous les membres en vie
+
+        Returns:
+            int: Total des dégâts réellement subis
+        """
+        type_index = DAMAGE_TYPE_INDEX.get(damage_type)
+        # Dégâts réels par variante, calculés une fois
+        hits = {
+            variant: max(1, int(damage * (enemy.damage_multipliers[type_index]
+                                          if type_index is not None else 1.0)))
+            for variant, enemy in self.members.items()
+        }
+        health = self.health
+        total = 0
+        for index, variant in enumerate(self.variants):
+            current = health[index]
+            if current > 0:
+                actual_damage = hits[variant]
+                health[index] = max(0, current - actual_damage)
+                total += actual_damage
+        return total
+
+    def apply_status_effect(self, effect_type, power, duration, indices=None):
+        """
+        Applique un effet de statut (à toute la horde si indices est None)
+
+        Args:
+            effect_type (str): "POISON", "BURN" ou "STUN"
+            power (int): Dégâts par round
+            duration (int): Durée en rounds
+            indices (iterable, optional): Membres touchés
+        """
+        if indices is None:
+            indices = range(len(self))
+        for index in indices:
+            if self.health[index] <= 0:
+                continue
+            if effect_type == "POISON":
+                self.poison_damage[index] = power
+                self.poison_duration[index] = duration
+            elif effect_type == "BURN":
+                self.burn_damage[index] = power
+                self.burn_duration[index] = duration
+            elif effect_type == "STUN":
+                self.stunned[index] = 1
+
+    def process_status_effects(self):
+        """
+        Traite les effets de statut de tous les membres en une passe (poison,
+        brûlure, étourdissement, puis régénération des trolls)
+
+        Returns:
+            list: Couples (effet, total sur la horde), ex. [("POISON", 12)]
+        """
+        health = self.health
+        poison_damage, poison_duration = self.poison_damage, self.poison_duration
+        burn_damage, burn_duration = self.burn_damage, self.burn_duration
+        stunned = self.stunned
+        poisoned = burned = stuns = 0
+
+        for index in range(len(health)):
+            current = health[index]
+            if current <= 0:
+                continue
+            if poison_duration[index] > 0:
+                current -= poison_damage[index]
+                poisoned += poison_damage[index]
+                poison_duration[index] -= 1
+            if burn_duration[index] > 0:
+                current -= burn_damage[index]
+                burned += burn_damage[index]
+                burn_duration[index] -= 1
+            if stunned[index]:
+                stuns += 1
+                stunned[index] = 0 # Stun dure 1 tour
+            health[index] = max(0, current)
+
+        effects = []
+        if poisoned:
+            effects.append(("POISON", poisoned))
+        if burned:
+            effects.append(("BURN", burned))
+        if stuns:
+            effects.append(("STUN", stuns))
+        healed = self.regenerate()
+        if healed:
+            effects.append(("REGEN", healed))
+        return effects
+
+    def regenerate(self):
+        """Régénération des membres blessés (trolls) ; retourne le total soigné"""
+        max_health = self.max_health
+        health = self.health
+        healed = 0
+        for index, enemy in enumerate(self.kinds):
+            regeneration = enemy.regeneration
+            current = health[index]
+            if regeneration and 0 < current < max_health[index]:
+                new_health = min(max_health[index], current + regeneration)
+                healed += new_health - current
+                health[index] = new_health
+        return healed
+
+    def attack(self):
+        """
+        Dégâts bruts de l'attaque de chaque membre en vie
+
+        Les jets suivent calculate_damage() de la classe : l'ennemi modèle de
+        la variante sert de curseur, sans créer d'objet par membre.
+
+        Returns:
+            list[int]: Dégâts de chaque attaquant
+        """
+        damages = []
+        for index, health in enumerate(self.health):
+            if health <= 0:
+                continue
+            enemy = self.kinds[index]
+            enemy.rng = self.rng
+            enemy.health = health
+            enemy.base_damage = self.base_damage[index]
+            damages.append(enemy.calculate_damage())
+        return damages
+
+    def drop_loot(self):
+        """Génère le butin cumulé de la horde (objets tirés en masse, par variante)"""
+        gold = experience = 0
+        for enemy in self.kinds:
+            gold += self.rng.between(enemy.gold_range[0], enemy.gold_range[1])
+            experience += enemy.experience
+        drops = Counter()
+        for variant, kills in Counter(self.variants).items():
+            table = LootCatalog.get_table(self.catalog_key, variant)
+            if table is not None:
+                drops += table.roll_many(self.rng, kills)
+        return {
+            "gold": gold,
+            "experience": experience,
+            "items": LootCatalog.create_items(drops.items())
+        }
+
+    def dump_state(self):
+        """Colonnes d'état (listes d'entiers, dans l'ordre de HORDE_FIELDS)"""
+        return tuple(tuple(getattr(self, field)) for field in HORDE_FIELDS)
+
+    @staticmethod
+    def load_state(enemy_type, variants, state, name=None):
+        """Recrée une horde depuis dump_state()"""
+        horde = Horde(enemy_type, variants, name)
+        for field, values in zip(HORDE_FIELDS, state):
+            column = getattr(horde, field)
+            column[:] = array(column.typecode, values)
+        return horde
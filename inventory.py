@@ -0,0 +1,205 @@
+"""
+inventory.py - Inventaires du joueur et des pièces pour "L'Héritage des Cendres"
+Un inventaire associe un nom à un objet, comme un dictionnaire, mais empile les
+consommables identiques, tient des index par type d'objet et par type d'arme et
+met à jour le poids et la valeur totaux à chaque ajout ou retrait : aucune
+opération ne reparcourt tout l'inventaire.
+"""
+
+from types import MappingProxyType
+
+
+# Types d'objets empilables : deux exemplaires de la même entrée du catalogue
+# partagent une ligne de l'inventaire (count = nombre d'exemplaires)
+STACKABLE_TYPES = frozenset({"CONSUMABLE"})
+
+
+class Inventory:
+    """
+    Objets rangés par nom, avec piles, index et totaux incrémentaux
+
+    Les entrées sont des objets (Item) ou de simples descriptions (str, objets
+    de décor des pièces), qui ne pèsent rien et ne valent rien.
+
+    Examples:
+
+    >>> from item import ItemCatalog
+    >>> inventory = Inventory()
+    >>> inventory.add("potion_soin", ItemCatalog.get_item("potion_soin"))
+    'potion_soin'
+    >>> inventory.add("potion_soin", ItemCatalog.get_item("potion_soin"))
+    'potion_soin'
+    >>> inventory.add("arc", ItemCatalog.get_item("arc_dentrainement"))
+    'arc'
+    >>> inventory.add("arc", ItemCatalog.get_item("arc_dentrainement"))
+    'arc2'
+    >>> inventory.count("potion_soin"), len(inventory)
+    (2, 3)
+    >>> sorted(inventory.by_weapon_type("ARC"))
+    ['arc', 'arc2']
+    >>> inventory.remove("potion_soin").count, inventory.count("potion_soin")
+    (1, 1)
+    """
+
+    __slots__ = ("entries", "types", "weapon_types", "total_weight", "total_value")
+
+    def __init__(self, entries=None):
+        """
+        Args:
+            entries (dict, optional): Contenu initial (nom -> objet ou description)
+        """
+        self.entries = {} # Nom -> objet (ou description)
+        self.types = {} # Type d'objet -> {nom: objet}
+        self.weapon_types = {} # Type d'arme -> {nom: arme}
+        self.total_weight = 0 # Poids cumulé (piles comprises)
+        self.total_value = 0 # Valeur cumulée (piles comprises)
+        if entries:
+            for name, item in entries.items():
+                self.add(name, item)
+
+    # Lecture, comme un dictionnaire nom -> objet
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __getitem__(self, name):
+        return self.entries[name]
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, name, default=None):
+        return self.entries.get(name, default)
+
+    def keys(self):
+        return self.entries.keys()
+
+    def values(self):
+        return self.entries.values()
+
+    def items(self):
+        return self.entries.items()
+
+    def count(self, name):
+        """Nombre d'exemplaires rangés sous ce nom (0 si absent)"""
+        item = self.entries.get(name)
+        if item is None:
+            return 0
+        return getattr(item, "count", 1)
+
+    def by_type(self, item_type):
+        """Objets d'un type ("WEAPON", "CONSUMABLE"...) : vue nom -> objet"""
+        return MappingProxyType(self.types.get(item_type, {}))
+
+    def by_weapon_type(self, weapon_type):
+        """Armes d'un type ("ARC", "EPEE", "BATON"...) : vue nom -> arme"""
+        return MappingProxyType(self.weapon_types.get(weapon_type, {}))
+
+    # Modifications (les index et les totaux suivent)
+
+    def add(self, name, item):
+        """
+        Range un objet
+
+        Un consommable de la même entrée du catalogue qu'un objet déjà rangé
+        sous ce nom rejoint sa pile ; sinon, un nom déjà pris reçoit un suffixe
+        ("arc", "arc2"...) au lieu d'écraser l'objet existant.
+
+        Returns:
+            str: Nom sous lequel l'objet est rangé
+        """
+        current = self.entries.get(name)
+        if current is not None:
+            if self._stacks_with(current, item):
+                current.count += item.count
+                self._account(item, 1)
+                return name
+            name = self._free_name(name)
+
+        self.entries[name] = item
+        if not isinstance(item, str):
+            self.types.setdefault(item.item_type, {})[name] = item
+            weapon_type = getattr(item, "weapon_type", None)
+            if weapon_type is not None:
+                self.weapon_types.setdefault(weapon_type, {})[name] = item
+        self._account(item, 1)
+        return name
+
+    def remove(self, name):
+        """
+        Retire un exemplaire
+
+        Returns:
+            L'objet retiré (un exemplaire détaché de sa pile), None si absent
+        """
+        item = self.entries.get(name)
+        if item is None:
+            return None
+        if getattr(item, "count", 1) > 1:
+            single = item.clone()
+            single.count = 1
+            item.count -= 1
+            self._account(single, -1)
+            return single
+        return self.pop(name)
+
+    def pop(self, name, *default):
+        """Retire toute l'entrée (pile comprise), comme dict.pop"""
+        if name not in self.entries:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        item = self.entries.pop(name)
+        if not isinstance(item, str):
+            self._unindex(self.types, item.item_type, name)
+            weapon_type = getattr(item, "weapon_type", None)
+            if weapon_type is not None:
+                self._unindex(self.weapon_types, weapon_type, name)
+        self._account(item, -1)
+        return item
+
+    def clear(self):
+        """Vide l'inventaire"""
+        self.entries.clear()
+        self.types.clear()
+        self.weapon_types.clear()
+        self.total_weight = 0
+        self.total_value = 0
+
+    def copy(self):
+        """Copie indépendante (objets clonés, descriptions partagées)"""
+        return Inventory({
+            name: item if isinstance(item, str) else item.clone()
+            for name, item in self.entries.items()
+        })
+
+    def _account(self, item, sign):
+        """Ajoute (sign=1) ou retire (sign=-1) un objet des totaux"""
+        if isinstance(item, str):
+            return
+        self.total_weight += sign * item.weight * item.count
+        self.total_value += sign * item.value * item.count
+
+    def _stacks_with(self, current, item):
+        """Vrai si item peut rejoindre la pile de current"""
+        return (not isinstance(current, str) and not isinstance(item, str)
+                and current.item_type in STACKABLE_TYPES
+                and current.spec is item.spec)
+
+    def _free_name(self, name):
+        """Premier nom libre de la forme nom2, nom3..."""
+        suffix = 2
+        while f"{name}{suffix}" in self.entries:
+            suffix += 1
+        return f"{name}{suffix}"
+
+    @staticmethod
+    def _unindex(index, key, name):
+        """Retire un nom d'un index (et la clé si elle devient vide)"""
+        names = index[key]
+        del names[name]
+        if not names:
+            del index[key]
@@ -2,47 +2,138 @@
 item.py - Système d'objets, d'équipement et de consommables pour "L'Héritage des Cendres"
 """
 
-import random
+from operator import attrgetter
+from types import MappingProxyType
 
-class Item:
-    """Classe de base pour tous les objets du jeu"""
+
+# Caractéristiques propres à un type d'objet (None pour les autres types)
+ITEM_STAT_FIELDS = (
+    # Armes
+    "damage_bonus", "weapon_type", "magic_bonus", "critical_chance", "damage_type",
+    # Armures
+    "defense_bonus", "armor_type", "dodge_penalty", "magic_resistance",
+    # Consommables
+    "effect_type", "effect_power", "duration",
+    # Objets clés et de quête
+    "use_location", "quest_name"
+)
+
+
+class ItemSpec:
+    """
+    Données fixes d'un objet, partagées par toutes ses copies.
+    Une seule ItemSpec par entrée du catalogue : les objets du jeu n'en gardent
+    qu'une référence, plus leur petit état modifiable (voir Item). Elle n'est
+    plus modifiée une fois le catalogue construit.
+    """
     
-    def __init__(self, name, description, item_type, value=0, weight=0):
+    __slots__ = ("item_id", "name", "description", "item_type", "value", "weight") + ITEM_STAT_FIELDS
+    
+    def __init__(self, name, description, item_type, value=0, weight=0, **stats):
         """
-        Initialise un objet
-        
         Args:
             name (str): Nom de l'objet
             description (str): Description de l'objet
-            item_type (str): Type d'objet ("WEAPON", "ARMOR", "CONSUMABLE", "KEY", "MISC")
+            item_type (str): Type d'objet ("WEAPON", "ARMOR", "CONSUMABLE", "KEY", "QUEST", "MISC")
             value (int): Valeur en pièces d'or
-            weight (float): Poids en unités (pour système de portage)
+            weight (float): Poids en unités
+            **stats: Caractéristiques propres au type (voir ITEM_STAT_FIELDS)
         """
+        self.item_id = None # Clé du catalogue, définie par ItemCatalog
         self.name = name
         self.description = description
         self.item_type = item_type
         self.value = value
         self.weight = weight
+        for field in ITEM_STAT_FIELDS:
+            setattr(self, field, None)
+        for field, stat in stats.items():
+            setattr(self, field, stat)
+
+
+def spec_field(field):
+    """Attribut en lecture seule lu dans la spec de l'objet"""
+    return property(attrgetter("spec." + field))
+
+
+class Item:
+    """
+    Classe de base pour tous les objets du jeu
+    
+    Une instance ne contient que sa spec (partagée) et son état propre : nombre
+    d'exemplaires empilés et usure. Nom, description, caractéristiques... sont
+    lus dans la spec.
+    """
+    
+    __slots__ = ("spec", "count", "durability")
+    
+    item_id = spec_field("item_id")
+    name = spec_field("name")
+    description = spec_field("description")
+    item_type = spec_field("item_type")
+    value = spec_field("value")
+    weight = spec_field("weight")
+    
+    def __init__(self, name, description, item_type, value=0, weight=0, **stats):
+        """
+        Initialise un objet
+        
+        Args:
+            name (str): Nom de l'objet
+            description (str): Description de l'objet
+            item_type (str): Type d'objet ("WEAPON", "ARMOR", "CONSUMABLE", "KEY", "MISC")
+            value (int): Valeur en pièces d'or
+            weight (float): Poids en unités (pour système de portage)
+            **stats: Caractéristiques propres au type (voir ItemSpec)
+        """
+        self.spec = ItemSpec(name, description, item_type, value, weight, **stats)
+        self.count = 1 # Exemplaires empilés
+        self.durability = None # Usure (None = inusable)
+    
+    @classmethod
+    def from_spec(cls, spec):
+        """Crée un objet neuf à partir d'une spec existante (sans la copier)"""
+        item = object.__new__(cls)
+        item.spec = spec
+        item.count = 1
+        item.durability = None
+        return item
         
     def __str__(self):
         """Représentation textuelle de l'objet"""
         return f"{self.name}: {self.description}"
+    
+    def clone(self):
+        """Copie de l'objet : même spec, état propre copié"""
+        item = self.from_spec(self.spec)
+        item.count = self.count
+        item.durability = self.durability
+        return item
         
     def get_full_info(self):
         """Retourne des informations détaillées sur l'objet"""
-        info = f"=== {self.name.upper()} ===\n"
-        info += f"Description: {self.description}\n"
-        info += f"Type: {self.item_type}\n"
-        info += f"Valeur: {self.value} pièces d'or\n"
-        info += f"Poids: {self.weight} unités\n"
+        spec = self.spec
+        info = f"=== {spec.name.upper()} ===\n"
+        info += f"Description: {spec.description}\n"
+        info += f"Type: {spec.item_type}\n"
+        info += f"Valeur: {spec.value} pièces d'or\n"
+        info += f"Poids: {spec.weight} unités\n"
         return info
 
 
 class Weapon(Item):
     """Classe pour les armes"""
     
+    __slots__ = ()
+    
+    damage_bonus = spec_field("damage_bonus")
+    weapon_type = spec_field("weapon_type")
+    magic_bonus = spec_field("magic_bonus")
+    critical_chance = spec_field("critical_chance")
+    damage_type = spec_field("damage_type")
+    
     def __init__(self, name, description, damage_bonus, weapon_type, 
-                 magic_bonus=0, critical_chance=5, value=0, weight=1.0):
+                 magic_bonus=0, critical_chance=5, value=0, weight=1.0, damage_type=None):
         """
         Initialise une arme
         
@@ -55,31 +146,48 @@ class Weapon(Item):
             critical_chance (int): Pourcentage de chance de coup critique
             value (int): Valeur en pièces d'or
             weight (float): Poids
+            damage_type (str, optional): Type des dégâts infligés (par défaut
+                "MAGICAL" pour les bâtons, "PHYSICAL" sinon)
         """
-        super().__init__(name, description, "WEAPON", value, weight)
-        self.damage_bonus = damage_bonus
-        self.weapon_type = weapon_type
-        self.magic_bonus = magic_bonus
-        self.critical_chance = critical_chance
+        if damage_type is None:
+            damage_type = "MAGICAL" if weapon_type == "BATON" else "PHYSICAL"
+        super().__init__(name, description, "WEAPON", value, weight,
+                         damage_bonus=damage_bonus, weapon_type=weapon_type,
+                         magic_bonus=magic_bonus, critical_chance=critical_chance,
+                         damage_type=damage_type)
         
     def get_full_info(self):
         """Informations détaillées de l'arme"""
+        spec = self.spec
         info = super().get_full_info()
-        info += f"Bonus dégâts: +{self.damage_bonus}\n"
-        info += f"Type d'arme: {self.weapon_type}\n"
-        if self.magic_bonus > 0:
-            info += f"Bonus magique: +{self.magic_bonus}\n"
-        info += f"Chance critique: {self.critical_chance}%\n"
+        info += f"Bonus dégâts: +{spec.damage_bonus}\n"
+        info += f"Type d'arme: {spec.weapon_type}\n"
+        info += f"Type de dégâts: {spec.damage_type}\n"
+        if spec.magic_bonus > 0:
+            info += f"Bonus magique: +{spec.magic_bonus}\n"
+        info += f"Chance critique: {spec.critical_chance}%\n"
         return info
         
-    def calculate_critical(self):
-        """Détermine si l'attaque est critique"""
-        return random.randint(1, 100) <= self.critical_chance
+    def calculate_critical(self, rng):
+        """
+        Détermine si l'attaque est critique
+        
+        Args:
+            rng (GameRandom): Générateur aléatoire de la partie
+        """
+        return rng.percent(self.critical_chance)
 
 
 class Armor(Item):
     """Classe pour les armures"""
     
+    __slots__ = ()
+    
+    defense_bonus = spec_field("defense_bonus")
+    armor_type = spec_field("armor_type")
+    dodge_penalty = spec_field("dodge_penalty")
+    magic_resistance = spec_field("magic_resistance")
+    
     def __init__(self, name, description, defense_bonus, armor_type,
                  dodge_penalty=0, magic_resistance=0, value=0, weight=2.0):
         """
@@ -95,27 +203,32 @@ class Armor(Item):
             value (int): Valeur en pièces d'or
             weight (float): Poids
         """
-        super().__init__(name, description, "ARMOR", value, weight)
-        self.defense_bonus = defense_bonus
-        self.armor_type = armor_type
-        self.dodge_penalty = dodge_penalty
-        self.magic_resistance = magic_resistance
+        super().__init__(name, description, "ARMOR", value, weight,
+                         defense_bonus=defense_bonus, armor_type=armor_type,
+                         dodge_penalty=dodge_penalty, magic_resistance=magic_resistance)
         
     def get_full_info(self):
         """Informations détaillées de l'armure"""
+        spec = self.spec
         info = super().get_full_info()
-        info += f"Bonus défense: +{self.defense_bonus}\n"
-        info += f"Type d'armure: {self.armor_type}\n"
-        if self.dodge_penalty > 0:
-            info += f"Malus esquive: -{self.dodge_penalty}%\n"
-        if self.magic_resistance > 0:
-            info += f"Résistance magique: +{self.magic_resistance}\n"
+        info += f"Bonus défense: +{spec.defense_bonus}\n"
+        info += f"Type d'armure: {spec.armor_type}\n"
+        if spec.dodge_penalty > 0:
+            info += f"Malus esquive: -{spec.dodge_penalty}%\n"
+        if spec.magic_resistance > 0:
+            info += f"Résistance magique: +{spec.magic_resistance}\n"
         return info
 
 
 class Consumable(Item):
     """Classe pour les objets consommables (potions, etc.)"""
     
+    __slots__ = ()
+    
+    effect_type = spec_field("effect_type")
+    effect_power = spec_field("effect_power")
+    duration = spec_field("duration")
+    
     def __init__(self, name, description, effect_type, effect_power, 
                  duration=0, value=0, weight=0.5):
         """
@@ -131,18 +244,17 @@ class Consumable(Item):
             value (int): Valeur en pièces d'or
             weight (float): Poids
         """
-        super().__init__(name, description, "CONSUMABLE", value, weight)
-        self.effect_type = effect_type
-        self.effect_power = effect_power
-        self.duration = duration
+        super().__init__(name, description, "CONSUMABLE", value, weight,
+                         effect_type=effect_type, effect_power=effect_power, duration=duration)
         
     def get_full_info(self):
         """Informations détaillées du consommable"""
+        spec = self.spec
         info = super().get_full_info()
         info += f"Effet: {self.get_effect_name()}\n"
-        info += f"Puissance: {self.effect_power}\n"
-        if self.duration > 0:
-            info += f"Durée: {self.duration} tours\n"
+        info += f"Puissance: {spec.effect_power}\n"
+        if spec.duration > 0:
+            info += f"Durée: {spec.duration} tours\n"
         return info
         
     def get_effect_name(self):
@@ -162,6 +274,10 @@ class Consumable(Item):
 class KeyItem(Item):
     """Classe pour les objets clés (quêtes, progression)"""
     
+    __slots__ = ("used",)
+    
+    use_location = spec_field("use_location")
+    
     def __init__(self, name, description, use_location=None, value=0, weight=0.1):
         """
         Initialise un objet clé
@@ -173,15 +289,27 @@ class KeyItem(Item):
             value (int): Valeur en pièces d'or
             weight (float): Poids
         """
-        super().__init__(name, description, "KEY", value, weight)
-        self.use_location = use_location
+        super().__init__(name, description, "KEY", value, weight, use_location=use_location)
         self.used = False
+    
+    @classmethod
+    def from_spec(cls, spec):
+        """Crée un objet clé neuf (non utilisé) à partir d'une spec existante"""
+        item = super().from_spec(spec)
+        item.used = False
+        return item
+    
+    def clone(self):
+        """Copie de l'objet clé, état d'utilisation compris"""
+        item = super().clone()
+        item.used = self.used
+        return item
         
     def get_full_info(self):
         """Informations détaillées de l'objet clé"""
         info = super().get_full_info()
-        if self.use_location:
-            info += f"Utilisable à: {self.use_location}\n"
+        if self.spec.use_location:
+            info += f"Utilisable à: {self.spec.use_location}\n"
         info += f"État: {'Utilisé' if self.used else 'Non utilisé'}\n"
         return info
 
@@ -189,6 +317,10 @@ class KeyItem(Item):
 class QuestItem(Item):
     """Classe pour les objets de quête"""
     
+    __slots__ = ()
+    
+    quest_name = spec_field("quest_name")
+    
     def __init__(self, name, description, quest_name, value=0, weight=0.5):
         """
         Initialise un objet de quête
@@ -200,13 +332,12 @@ class QuestItem(Item):
             value (int): Valeur en pièces d'or
             weight (float): Poids
         """
-        super().__init__(name, description, "QUEST", value, weight)
-        self.quest_name = quest_name
+        super().__init__(name, description, "QUEST", value, weight, quest_name=quest_name)
         
     def get_full_info(self):
         """Informations détaillées de l'objet de quête"""
         info = super().get_full_info()
-        info += f"Quête associée: {self.quest_name}\n"
+        info += f"Quête associée: {self.spec.quest_name}\n"
         return info
 
 
@@ -217,6 +348,9 @@ class QuestItem(Item):
 class ItemCatalog:
     """Catalogue central de tous les objets du jeu"""
     
+    # Prototypes construits au premier accès (voir get_prototypes)
+    prototypes = None
+    
     @staticmethod
     def create_items():
         """Crée et retourne le catalogue d'objets"""
@@ -301,7 +435,8 @@ class ItemCatalog:
             magic_bonus=5,
             critical_chance=20,
             value=200,
-            weight=1.0
+            weight=1.0,
+            damage_type="FIRE"
         )
         
         catalog["epee_barbe_de_pierre"] = Weapon(
@@ -524,8 +659,27 @@ class ItemCatalog:
             weight=0.5
         )
         
+        # Identifiant stable de chaque objet (clé du catalogue)
+        for item_id, item in catalog.items():
+            item.spec.item_id = item_id
+        
         return catalog
     
+    @staticmethod
+    def get_prototypes():
+        """
+        Retourne le registre des prototypes, construit une seule fois par processus
+        
+        Les prototypes sont partagés : ne jamais les modifier ni les donner au
+        joueur (utiliser get_item, qui en retourne une copie).
+        
+        Returns:
+            MappingProxyType: id du catalogue -> Item (lecture seule)
+        """
+        if ItemCatalog.prototypes is None:
+            ItemCatalog.prototypes = MappingProxyType(ItemCatalog.create_items())
+        return ItemCatalog.prototypes
+    
     @staticmethod
     def get_item(item_name):
         """
@@ -535,39 +689,23 @@ class ItemCatalog:
             item_name (str): Nom de l'objet dans le catalogue
             
         Returns:
-            Item: Une nouvelle instance de l'objet
+            Item: Une nouvelle instance de l'objet (None si l'objet est inconnu)
+        """
+        prototype = ItemCatalog.get_prototypes().get(item_name)
+        if prototype is None:
+            return None
+        return prototype.clone()
+    
+    @staticmethod
+    def get_items(item_names):
         """
-        catalog = ItemCatalog.create_items()
+        Retourne des copies de plusieurs objets en un appel (butin, récompenses)
         
-        if item_name in catalog:
-            # Pour les objets simples, on retourne une nouvelle instance
-            original = catalog[item_name]
+        Args:
+            item_names (iterable): Noms des objets dans le catalogue (répétitions permises)
             
-            # Recréer l'objet selon son type
-            if isinstance(original, Weapon):
-                return Weapon(
-                    name=original.name,
-                    description=original.description,
-                    damage_bonus=original.damage_bonus,
-                    weapon_type=original.weapon_type,
-                    magic_bonus=original.magic_bonus,
-                    critical_chance=original.critical_chance,
-                    value=original.value,
-                    weight=original.weight
-                )
-            elif isinstance(original, Armor):
-                return Armor(
-                    name=original.name,
-                    description=original.description,
-                    defense_bonus=original.defense_bonus,
-                    armor_type=original.armor_type,
-                    dodge_penalty=original.dodge_penalty,
-                    magic_resistance=original.magic_resistance,
-                    value=original.value,
-                    weight=original.weight
-                )
-            elif isinstance(original, Consumable):
-                return Consumable(
-                    name=original.name,
-                    description=original.description,
-                    effect_type=o
\ No newline at end of file
+        Returns:
+            list: Nouvelles instances, dans l'ordre (les noms inconnus sont ignorés)
+        """
+        prototypes = ItemCatalog.get_prototypes()
+        return [prototypes[item_name].clone() for item_name in item_names if item_name in prototypes]
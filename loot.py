@@ -0,0 +1,218 @@
+"""
+loot.py - Tables de butin pour "L'Héritage des Cendres"
+Chaque type d'ennemi (et au besoin chaque variante) a une table pondérée
+d'objets du catalogue, avec des quantités et, pour les boss, des objets qui ne
+tombent qu'à partir d'une phase donnée. Les tables sont compilées une fois en
+tables d'alias : un tirage coûte un seul nombre aléatoire, et roll_many() tire
+le butin de milliers d'ennemis d'un coup pour les simulations.
+"""
+
+from bisect import bisect_right
+from collections import Counter
+
+from item import ItemCatalog
+from sampling import AliasTable
+
+
+# Tables de butin : (clé de EnemyCatalog, variante) -> (tirages par ennemi, entrées)
+# La variante None sert de table par défaut pour toutes les variantes du type.
+# Entrée : (objet du catalogue ou None = rien, poids, (quantité min, max), phase minimale)
+LOOT_TABLES = {
+    ("GOBELIN", None): (1, (
+        (None, 60, (1, 1), 1),
+        ("potion_soin", 25, (1, 1), 1),
+        ("torche", 10, (1, 1), 1),
+        ("cordes", 5, (1, 1), 1)
+    )),
+    ("GOBELIN", "archer"): (1, (
+        (None, 60, (1, 1), 1),
+        ("potion_soin", 20, (1, 1), 1),
+        ("potion_dexterite", 12, (1, 1), 1),
+        ("arc_dentrainement", 8, (1, 1), 1)
+    )),
+    ("ORC", None): (1, (
+        (None, 55, (1, 1), 1),
+        ("potion_soin", 25, (1, 2), 1),
+        ("potion_force", 12, (1, 1), 1),
+        ("epee_dentrainement", 5, (1, 1), 1),
+        ("cotte_mailles", 3, (1, 1), 1)
+    )),
+    ("ORC", "chef"): (2, (
+        (None, 45, (1, 1), 1),
+        ("potion_soin", 30, (1, 2), 1),
+        ("potion_force", 15, (1, 1), 1),
+        ("cotte_mailles", 7, (1, 1), 1),
+        ("epee_garde_royale", 3, (1, 1), 1)
+    )),
+    ("TROLL", None): (1, (
+        (None, 50, (1, 1), 1),
+        ("potion_soin_majeure", 15, (1, 1), 1),
+        ("antidote", 20, (1, 2), 1),
+        ("pioche", 10, (1, 1), 1),
+        ("plaque_acier", 5, (1, 1), 1)
+    )),
+    ("CHEF_GOBELIN", None): (2, (
+        (None, 30, (1, 1), 1),
+        ("potion_soin", 40, (1, 2), 1),
+        ("potion_force", 20, (1, 1), 1),
+        ("armure_cuir", 10, (1, 1), 1),
+        # Poussé dans ses retranchements, le chef sort ses meilleures pièces
+        ("arc_long_elfique", 8, (1, 1), 2),
+        ("epee_garde_royale", 8, (1, 1), 2)
+    )),
+    ("CHEF_TROLL", None): (2, (
+        (None, 30, (1, 1), 1),
+        ("potion_soin_majeure", 35, (1, 2), 1),
+        ("antidote", 20, (1, 2), 1),
+        ("plaque_acier", 10, (1, 1), 1),
+        ("epee_barbe_de_pierre", 10, (1, 1), 2),
+        ("baton_ancien_sage", 6, (1, 1), 2)
+    )),
+    ("MORGRATH", None): (3, (
+        (None, 20, (1, 1), 1),
+        ("potion_soin_majeure", 40, (1, 3), 1),
+        ("potion_intelligence", 15, (1, 1), 2),
+        ("tunique_elfique", 10, (1, 1), 3),
+        ("arc_cendres", 6, (1, 1), 4),
+        ("grimoire_ardenwein", 6, (1, 1), 4)
+    ))
+}
+
+
+class LootTable:
+    """
+    Table de butin compilée : une table d'alias par palier de phase
+
+    Les entrées disponibles à une phase sont celles dont la phase minimale est
+    atteinte ; chaque palier distinct a sa propre table d'alias, choisie par
+    bisection sur la phase du boss (1 pour les ennemis ordinaires).
+
+    Examples:
+
+    >>> from rng import GameRandom
+    >>> table = LootTable([(None, 3, (1, 1), 1), ("potion_soin", 1, (1, 2), 1),
+    ...                    ("arc_cendres", 1, (1, 1), 2)])
+    >>> len(table.table_for(1)), len(table.table_for(4))
+    (2, 3)
+    >>> totals = table.roll_many(GameRandom(1), 10000)
+    >>> sorted(totals), 3500 < totals["potion_soin"] < 4000
+    (['potion_soin'], True)
+    """
+
+    __slots__ = ("rolls", "thresholds", "tables")
+
+    def __init__(self, entries, rolls=1):
+        """
+        Args:
+            entries (iterable): (objet ou None, poids, (quantité min, max), phase minimale)
+            rolls (int): Tirages par ennemi vaincu
+
+        Raises:
+            ValueError: Si un objet est inconnu du catalogue ou si aucune entrée n'est de phase 1
+        """
+        entries = tuple(entries)
+        prototypes = ItemCatalog.get_prototypes()
+        for item_id, _, _, _ in entries:
+            if item_id is not None and item_id not in prototypes:
+                raise ValueError(f"Objet de butin inconnu: {item_id}")
+        thresholds = sorted({min_phase for _, _, _, min_phase in entries})
+        if not thresholds or thresholds[0] > 1:
+            raise ValueError("Une table de butin demande au moins une entrée de phase 1.")
+
+        tables = []
+        for phase in thresholds:
+            available = [entry for entry in entries if entry[3] <= phase]
+            tables.append(AliasTable(available, [entry[1] for entry in available]))
+
+        self.rolls = rolls
+        self.thresholds = tuple(thresholds)
+        self.tables = tuple(tables)
+
+    def table_for(self, phase):
+        """Table d'alias des entrées disponibles à cette phase"""
+        return self.tables[max(bisect_right(self.thresholds, phase) - 1, 0)]
+
+    def roll(self, rng, phase=1):
+        """
+        Tire le butin d'un ennemi
+
+        Args:
+            rng (GameRandom): Générateur aléatoire
+            phase (int): Phase atteinte par le boss (1 pour un ennemi ordinaire)
+
+        Returns:
+            list[tuple]: Couples (objet du catalogue, quantité), sans les tirages "rien"
+        """
+        table = self.table_for(phase)
+        drops = []
+        for _ in range(self.rolls):
+            item_id, _, (low, high), _ = table.sample(rng)
+            if item_id is not None:
+                drops.append((item_id, low if low == high else rng.between(low, high)))
+        return drops
+
+    def roll_many(self, rng, kills, phase=1):
+        """
+        Tire en masse le butin de plusieurs ennemis (simulations, hordes)
+
+        Seuls les totaux sont calculés : aucun objet ni aucune liste de tirages
+        n'est construit, et NumPy (s'il est disponible) fait tout le calcul.
+
+        Args:
+            rng (GameRandom): Générateur aléatoire
+            kills (int): Nombre d'ennemis vaincus
+            phase (int): Phase atteinte (la même pour tous)
+
+        Returns:
+            Counter: Objet du catalogue -> quantité totale
+        """
+        table = self.table_for(phase)
+        totals = Counter()
+        for entry, hits in zip(table.items, table.sample_counts(rng, kills * self.rolls)):
+            item_id, _, (low, high), _ = entry
+            if hits and item_id is not None:
+                totals[item_id] += rng.between_total(low, high, hits)
+        return totals
+
+
+class LootCatalog:
+    """Tables de butin compilées, par type et variante d'ennemi"""
+
+    # Tables déjà compilées : (type, variante) -> LootTable (None : pas de butin)
+    tables = {}
+
+    @staticmethod
+    def get_table(enemy_type, variant=None):
+        """
+        Retourne la table de butin d'un ennemi, compilée au premier appel
+
+        Args:
+            enemy_type (str): Clé de EnemyCatalog ("GOBELIN", "MORGRATH"...)
+            variant (str, optional): Variante (à défaut, la table du type)
+
+        Returns:
+            LootTable: La table, ou None si l'ennemi ne laisse aucun objet
+        """
+        key = (enemy_type, variant)
+        if key in LootCatalog.tables:
+            return LootCatalog.tables[key]
+        definition = LOOT_TABLES.get(key) or LOOT_TABLES.get((enemy_type, None))
+        table = None
+        if definition is not None:
+            rolls, entries = definition
+            table = LootTable(entries, rolls)
+        LootCatalog.tables[key] = table
+        return table
+
+    @staticmethod
+    def create_items(drops):
+        """
+        Crée les objets d'un butin
+
+        Args:
+            drops (iterable): Couples (objet du catalogue, quantité)
+
+        Returns:
+            list: Un exemplaire par unité (les consommables s'empilent en inventaire)
+        """
+        return ItemCatalog.get_items(item_id for item_id, count in drops for _ in range(count))
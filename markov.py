@@ -0,0 +1,487 @@
+"""
+markov.py - Distributions exactes des combats pour l'équilibrage de "L'Héritage des Cendres"
+Un combat est une chaîne de Markov sur les états (PV du joueur, PV de l'ennemi,
+phase, recharge de l'attaque spéciale, rounds de poison et de brûlure restants
+au joueur, étourdissement). Les probabilités de transition sont celles des
+règles de player.py, enemy.py et combat.resolve, effets des attaques spéciales
+compris ; la probabilité de victoire et le nombre de rounds attendu sont
+calculés exactement par programmation dynamique, sans bruit d'échantillonnage
+(contrairement à simulator.py).
+
+La phase des boss est dans l'état car elle ne fait qu'avancer alors que le
+drain et le soin leur rendent des PV. Seuls les états atteignables depuis un
+début de combat sont construits.
+
+Usage :
+    python markov.py --path EPEE --enemy TROLL:caverne
+    python markov.py --path MAGIE --weapon grimoire_ardenwein --morgrath
+"""
+
+import argparse
+
+from item import ItemCatalog
+from player import BURN_DAMAGE_TYPE
+from enemy import SPECIAL_POISON, SPECIAL_BURN, SPECIAL_HEAL
+from simulator import PlayerModel, EnemyModel, BALANCE_ENEMIES, PATHS
+
+
+# Tolérance des itérations pour les ennemis qui régénèrent ou se soignent (cycles dans la chaîne)
+TOLERANCE = 1e-13
+MAX_SWEEPS = 10000
+
+# Combat final contre Morgrath (voir Actions._fight_morgrath_combat)
+HIDDEN_POWER_CHANCE = 0.5
+HIDDEN_POWER_MULTIPLIER = 12
+
+# Issues du tour d'un joueur étourdi : aucune attaque (voir player_outcomes)
+STUNNED = ((1.0, None),)
+
+
+def uniform(low, high):
+    """Distribution uniforme sur les entiers de low à high : liste de (probabilité, valeur)"""
+    count = high - low + 1
+    return [(1 / count, value) for value in range(low, high + 1)]
+
+
+def merge(outcomes):
+    """Regroupe les issues identiques : liste de (probabilité, issue) -> dict issue -> probabilité"""
+    merged = {}
+    for probability, outcome in outcomes:
+        if probability:
+            merged[outcome] = merged.get(outcome, 0.0) + probability
+    return merged
+
+
+# ============================================================================
+# DISTRIBUTIONS D'UN ROUND
+# ============================================================================
+
+def player_outcomes(player, enemy, hidden_power=False):
+    """
+    Effets possibles de l'attaque du joueur sur les PV de l'ennemi
+
+    Returns:
+        list[tuple]: (probabilité, fonction PV avant -> PV après)
+    """
+    hit, proc_hit = player.hits(enemy)
+    outcomes = [(1 - player.proc_chance, player.damage, 0, hit)]
+    if player.proc_chance:
+        outcomes.append((player.proc_chance, player.proc_damage, player.proc_burn, proc_hit))
+
+    result = []
+    for probability, damage, burn, hit in outcomes:
+        if hidden_power:
+            # L'attaque amplifiée remplace l'attaque normale (combat.resolve) :
+            # type de la voie et de l'arme, brûlure en dégâts de feu
+            amplified = enemy.damage_taken(int((damage - burn) * HIDDEN_POWER_MULTIPLIER), player.damage_type)
+            if burn:
+                amplified += enemy.damage_taken(int(burn * HIDDEN_POWER_MULTIPLIER), BURN_DAMAGE_TYPE)
+            result.append((probability, lambda health, amplified=amplified: health - amplified))
+        else:
+            result.append((probability, lambda health, hit=hit: health - hit))
+    return result
+
+
+def enemy_phase(enemy, health):
+    """Phase d'un boss d'après ses PV (1 pour les ennemis sans phases)"""
+    if enemy.kind == "BOSS":
+        return 2 if health <= enemy.phase_health else 1
+    if enemy.kind == "MORGRATH":
+        return 1 + sum(1 for trigger in enemy.phase_triggers if health <= trigger)
+    return 1
+
+
+def enemy_attack(enemy, phase, cooldown):
+    """
+    Distribution des dégâts bruts de l'ennemi (règles de calculate_damage)
+
+    Args:
+        enemy (EnemyModel): L'ennemi
+        phase (int): Phase du boss
+        cooldown (int): Rounds restants avant la prochaine attaque spéciale
+
+    Returns:
+        list[tuple]: (probabilité, dégâts bruts, recharge au round suivant,
+        effet de l'attaque spéciale ou None)
+    """
+    base = enemy.base_damage
+    next_cooldown = max(0, cooldown - 1)
+
+    if enemy.kind == "GOBELIN":
+        outcomes = []
+        for probability, damage in uniform(base - 2, base + 3):
+            outcomes.append((probability * 0.2, max(1, damage - 3)))
+            outcomes.append((probability * 0.8 * 0.1, damage + 4))
+            outcomes.append((probability * 0.8 * 0.9, damage))
+        return [(p, max(1, d), 0, None) for p, d in outcomes]
+
+    if enemy.kind == "ORC":
+        rage = 0.25 if enemy.berserker else 0.0
+        outcomes = []
+        for probability, damage in uniform(base - 1, base + 2):
+            outcomes.append((probability * rage, int(damage * 1.5)))
+            outcomes.append((probability * (1 - rage), damage))
+        return [(p, max(1, d), 0, None) for p, d in outcomes]
+
+    if enemy.kind == "TROLL":
+        outcomes = [(0.3, 0)]
+        for probability, damage in uniform(base, base + 5):
+            outcomes.append((0.7 * probability * 0.15, max(1, int(damage * 1.8))))
+            outcomes.append((0.7 * probability * 0.85, max(1, damage)))
+        return [(p, d, 0, None) for p, d in outcomes]
+
+    # Boss et Morgrath : attaque spéciale possible si la recharge est terminée
+    if enemy.kind == "BOSS":
+        special_chance = 0.3
+        normal = [(p, int(d * 1.5) if phase == 2 else d) for p, d in uniform(base - 2, base + 4)]
+    else:
+        base += 8 * (phase - 1)
+        special_chance = 0.3 + phase * 0.1
+        normal = [(p, int(d * (1 + (phase - 1) * 0.25))) for p, d in uniform(base - 3, base + 8)]
+    normal = [(p, max(1, d)) for p, d in normal]
+
+    if not enemy.special_damages or cooldown > 0:
+        return [(p, d, next_cooldown, None) for p, d in normal]
+    outcomes = [(p * (1 - special_chance), d, 0, None) for p, d in normal]
+    outcomes += [(special_chance * weight, d, enemy.special_cooldown, effect)
+                 for d, weight, effect in zip(enemy.special_damages, enemy.special_weights,
+                                              enemy.special_effects)]
+    return outcomes
+
+
+# ============================================================================
+# CHAÎNE DE MARKOV D'UN COMBAT
+# ============================================================================
+
+class CombatChain:
+    """
+    Chaîne de Markov d'un combat joueur contre ennemi
+
+    L'état d'un round est le niveau de PV du joueur et un tuple (PV ennemi,
+    phase, recharge, rounds de poison restants, rounds de brûlure restants,
+    étourdi). Pour chaque état atteignable, solve() calcule :
+        - la probabilité que le joueur gagne,
+        - le nombre de rounds attendu avant la fin du combat,
+        - la probabilité que le combat se termine avec une attaque spéciale
+          encore en recharge (utile pour enchaîner deux rencontres).
+    """
+
+    def __init__(self, player, enemy, hidden_power=False):
+        """
+        Args:
+            player (PlayerModel): Paramètres du joueur
+            enemy (EnemyModel): Paramètres de l'ennemi
+            hidden_power (bool): Attaques amplifiées du pouvoir caché
+        """
+        self.player = player
+        self.enemy = enemy
+        self.cooldowns = enemy.special_cooldown + 1 if enemy.special_damages else 1
+        self.outcomes = player_outcomes(player, enemy, hidden_power)
+        # Régénération et soin à l'esquive : les PV de l'ennemi peuvent remonter
+        # sans que ceux du joueur baissent (cycles dans un niveau de PV)
+        self.cyclic = bool(enemy.regeneration) or "HEAL_50" in enemy.special_effects
+
+        # Attaque de l'ennemi pré-agrégée : (phase, recharge) -> {(dégâts subis, recharge, effet): proba}
+        self.attacks = {}
+        self.index = None # État de l'ennemi et des effets -> indice dans les tables
+        self.win = None
+        self.rounds = None
+        self.pending = None
+
+    def attack_table(self, phase, cooldown):
+        """Dégâts subis par le joueur (hors esquive) selon l'état de l'ennemi"""
+        key = (phase, cooldown)
+        table = self.attacks.get(key)
+        if table is None:
+            defense = self.player.defense
+            table = merge(
+                (probability, (max(1, damage - defense), next_cooldown, effect))
+                for probability, damage, next_cooldown, effect in enemy_attack(self.enemy, *key)
+            )
+            self.attacks[key] = list(table.items())
+        return self.attacks[key]
+
+    def regenerate(self, health):
+        """Régénération des trolls en début de round"""
+        if self.enemy.regeneration and 0 < health < self.enemy.health:
+            return min(self.enemy.health, health + self.enemy.regeneration)
+        return health
+
+    def heal(self, health, amount):
+        """PV d'un boss après un drain ou un soin (Boss.heal)"""
+        return min(self.enemy.health, health + amount)
+
+    def transitions(self, state):
+        """
+        Issues d'un round depuis un état, indépendantes des PV du joueur
+        (ordre de combat.resolve)
+
+        Returns:
+            tuple: (dégâts du poison et de la brûlure en début de round,
+            probabilité de tuer l'ennemi, dont avec une spéciale en recharge,
+            liste de (probabilité, dégâts subis, état après esquive,
+            état après coup reçu, spéciale en recharge si le joueur meurt))
+        """
+        health, phase, cooldown, poison, burn, stunned = state
+        status_damage = (SPECIAL_POISON[0] if poison else 0) + (SPECIAL_BURN[0] if burn else 0)
+        poison = max(0, poison - 1)
+        burn = max(0, burn - 1)
+
+        regenerated = self.regenerate(health)
+        kills = 0.0
+        kills_pending = 0.0
+        moves = []
+        # Étourdi, le joueur perd son attaque
+        for probability, attack in STUNNED if stunned else self.outcomes:
+            after = attack(regenerated) if attack else regenerated
+            if after <= 0:
+                kills += probability
+                if cooldown > 0:
+                    kills_pending += probability
+                continue
+            after = min(after, self.enemy.health)
+            # Les phases ne font qu'avancer, même si le boss se soigne
+            after_phase = max(phase, enemy_phase(self.enemy, after))
+            for (damage, next_cooldown, effect), chance in self.attack_table(after_phase, cooldown):
+                dodged = hit = (after, after_phase, next_cooldown, poison, burn, 0)
+                if effect == "POISON":
+                    hit = (after, after_phase, next_cooldown, SPECIAL_POISON[1], burn, 0)
+                elif effect == "BURN":
+                    hit = (after, after_phase, next_cooldown, poison, SPECIAL_BURN[1], 0)
+                elif effect == "STUN":
+                    hit = (after, after_phase, next_cooldown, poison, burn, 1)
+                elif effect == "DRAIN":
+                    hit = (self.heal(after, damage), after_phase, next_cooldown, poison, burn, 0)
+                elif effect == "HEAL_50":
+                    dodged = hit = (self.heal(after, SPECIAL_HEAL), after_phase, next_cooldown, poison, burn, 0)
+                # Si le joueur meurt ici, la fin de recharge n'a pas encore été
+                # traitée : elle ne le sera qu'au début du round suivant
+                moves.append((probability * chance, damage, dodged, hit, cooldown > 0 or next_cooldown > 0))
+        return status_damage, kills, kills_pending, moves
+
+    def solve(self):
+        """Calcule les tables de toutes les valeurs, niveau de PV du joueur par niveau"""
+        max_player = self.player.health
+        dodge = self.player.dodge_chance
+        hit = 1 - dodge
+
+        # États atteignables depuis un début de combat, à tous les PV de l'ennemi
+        # (voir state()) ; le joueur n'y subit encore aucun effet
+        found = {}
+        queue = [(health, enemy_phase(self.enemy, health), cooldown, 0, 0, 0)
+                 for health in range(1, self.enemy.health + 1) for cooldown in range(self.cooldowns)]
+        while queue:
+            state = queue.pop()
+            if state in found:
+                continue
+            found[state] = self.transitions(state)
+            for _, _, dodged, hit_state, _ in found[state][3]:
+                queue.append(dodged)
+                queue.append(hit_state)
+
+        # Gauss-Seidel par PV ennemis croissants (étourdi après non étourdi) :
+        # exact en un passage quand l'ennemi ne régénère ni ne se soigne
+        states = sorted(found, key=lambda state: (state[0], state[5]))
+        self.index = index = {state: i for i, state in enumerate(states)}
+        transitions = []
+        for state in states:
+            status_damage, kills, kills_pending, moves = found[state]
+            transitions.append((status_damage, state[2] > 0, kills, kills_pending, [
+                (probability, damage, index[dodged], index[hit_state], target_pending)
+                for probability, damage, dodged, hit_state, target_pending in moves
+            ]))
+
+        # Indice 0 : joueur mort (valeurs nulles)
+        width = len(states)
+        self.win = [[0.0] * width for _ in range(max_player + 1)]
+        self.rounds = [[0.0] * width for _ in range(max_player + 1)]
+        self.pending = [[0.0] * width for _ in range(max_player + 1)]
+
+        for player_health in range(1, max_player + 1):
+            win = self.win[player_health]
+            rounds = self.rounds[player_health]
+            pending = self.pending[player_health]
+
+            for sweep in range(MAX_SWEEPS):
+                change = 0.0
+                for state, (status_damage, cooling, kills, kills_pending, moves) in enumerate(transitions):
+                    # Poison et brûlure en début de round : le joueur peut en mourir
+                    # avant d'attaquer, sinon il continue au niveau de PV inférieur
+                    level = player_health - status_damage
+                    if level <= 0:
+                        w, r, c = 0.0, 1.0, float(cooling)
+                    else:
+                        w = kills
+                        r = 1.0
+                        c = kills_pending
+                        level_win, level_rounds, level_pending = self.win[level], self.rounds[level], self.pending[level]
+                        for probability, damage, dodged, target, target_pending in moves:
+                            # Esquive : même niveau de PV (calculé plus haut dans ce balayage
+                            # sans effet en cours, déjà calculé sinon)
+                            p = probability * dodge
+                            w += p * level_win[dodged]
+                            r += p * level_rounds[dodged]
+                            c += p * level_pending[dodged]
+                            # Coup reçu : niveau inférieur (déjà calculé) ou mort du joueur
+                            p = probability * hit
+                            remaining = level - damage
+                            if remaining > 0:
+                                w += p * self.win[remaining][target]
+                                r += p * self.rounds[remaining][target]
+                                c += p * self.pending[remaining][target]
+                            elif target_pending:
+                                c += p
+                    change = max(change, abs(w - win[state]), abs(r - rounds[state]))
+                    win[state] = w
+                    rounds[state] = r
+                    pending[state] = c
+                if change < TOLERANCE or not self.cyclic:
+                    break
+        return self
+
+    def state(self, player_health=None, enemy_health=None, cooldown=0):
+        """Indices de l'état demandé (par défaut : début de combat), le joueur sans effet en cours"""
+        if self.win is None:
+            self.solve()
+        player_health = self.player.health if player_health is None else player_health
+        enemy_health = self.enemy.health if enemy_health is None else enemy_health
+        state = (enemy_health, enemy_phase(self.enemy, enemy_health), min(cooldown, self.cooldowns - 1), 0, 0, 0)
+        return player_health, self.index[state]
+
+    def win_probability(self, player_health=None, enemy_health=None, cooldown=0):
+        """Probabilité de victoire du joueur depuis un état"""
+        level, index = self.state(player_health, enemy_health, cooldown)
+        return self.win[level][index]
+
+    def expected_rounds(self, player_health=None, enemy_health=None, cooldown=0):
+        """Nombre de rounds attendu avant la fin du combat depuis un état"""
+        level, index = self.state(player_health, enemy_health, cooldown)
+        return self.rounds[level][index]
+
+    def pending_probability(self, player_health=None, enemy_health=None, cooldown=0):
+        """Probabilité de finir le combat avec une attaque spéciale en recharge"""
+        level, index = self.state(player_health, enemy_health, cooldown)
+        return self.pending[level][index]
+
+
+# ============================================================================
+# ANALYSES
+# ============================================================================
+
+class CombatOutcome:
+    """Résultat exact d'un combat"""
+
+    def __init__(self, path, weapon_id, enemy_type, variant, win_probability, expected_rounds):
+        self.path = path
+        self.weapon_id = weapon_id
+        self.enemy_type = enemy_type
+        self.variant = variant
+        self.win_probability = win_probability
+        self.expected_rounds = expected_rounds
+
+    def summary(self):
+        """Retourne une ligne de résumé"""
+        weapon = self.weapon_id or "aucune"
+        enemy = f"{self.enemy_type}:{self.variant}"
+        return (f"{self.path:<6} {weapon:<22} {enemy:<22} "
+                f"victoire {self.win_probability * 100:8.4f}%  "
+                f"rounds {self.expected_rounds:6.2f}")
+
+
+class MorgrathOutcome(CombatOutcome):
+    """Résultat exact des deux rencontres avec Morgrath"""
+
+    def __init__(self, path, weapon_id, first_win, hidden_win, normal_win, win_probability, expected_rounds):
+        super().__init__(path, weapon_id, "MORGRATH", "normal", win_probability, expected_rounds)
+        self.first_win = first_win # Victoire à la première rencontre (sans effet sur la suite)
+        self.hidden_win = hidden_win # Victoire finale avec le pouvoir caché
+        self.normal_win = normal_win # Victoire finale sans le pouvoir caché
+
+    def summary(self):
+        return (super().summary()
+                + f"  (pouvoir caché {self.hidden_win * 100:.4f}%, sans {self.normal_win * 100:.4f}%)")
+
+
+def _models(path, weapon_id=None, armor_id=None):
+    """Construit le modèle du joueur à partir des ids du catalogue d'objets"""
+    items = ItemCatalog.get_prototypes()
+    weapon = items[weapon_id] if weapon_id else None
+    armor = items[armor_id] if armor_id else None
+    return PlayerModel(path, weapon, armor)
+
+
+def analyze(path, enemy_type, variant="normal", weapon_id=None, armor_id=None):
+    """
+    Probabilité exacte de victoire et rounds attendus d'un combat normal
+
+    Returns:
+        CombatOutcome: Le résultat
+    """
+    chain = CombatChain(_models(path, weapon_id, armor_id), EnemyModel(enemy_type, variant)).solve()
+    return CombatOutcome(path, weapon_id, enemy_type, variant,
+                         chain.win_probability(), chain.expected_rounds())
+
+
+def analyze_morgrath(path, weapon_id=None, armor_id=None):
+    """
+    Issue exacte du combat contre Morgrath en deux rencontres
+
+    La première rencontre se termine toujours par la remise à zéro des PV des
+    deux camps, de la phase de Morgrath et des effets subis par le joueur ;
+    seule une attaque spéciale encore en recharge est reportée
+    (elle bloque alors les premiers rounds de la seconde rencontre). La seconde
+    rencontre se joue avec le pouvoir caché une fois sur deux.
+
+    Returns:
+        MorgrathOutcome: Le résultat
+    """
+    player = _models(path, weapon_id, armor_id)
+    enemy = EnemyModel("MORGRATH")
+    first = CombatChain(player, enemy).solve()
+    pending = first.pending_probability()
+    carried = enemy.special_cooldown
+
+    final = {}
+    for hidden_power in (True, False):
+        chain = first if not hidden_power else CombatChain(player, enemy, hidden_power=True).solve()
+        win = (pending * chain.win_probability(cooldown=carried)
+               + (1 - pending) * chain.win_probability())
+        rounds = (pending * chain.expected_rounds(cooldown=carried)
+                  + (1 - pending) * chain.expected_rounds())
+        final[hidden_power] = (win, rounds)
+
+    hidden_win, hidden_rounds = final[True]
+    normal_win, normal_rounds = final[False]
+    win = HIDDEN_POWER_CHANCE * hidden_win + (1 - HIDDEN_POWER_CHANCE) * normal_win
+    rounds = (first.expected_rounds()
+              + HIDDEN_POWER_CHANCE * hidden_rounds + (1 - HIDDEN_POWER_CHANCE) * normal_rounds)
+    return MorgrathOutcome(path, weapon_id, first.win_probability(), hidden_win, normal_win, win, rounds)
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Issues exactes des combats d'Ashes of Alderwood")
+    parser.add_argument("--path", choices=PATHS, help="Limiter à une voie")
+    parser.add_argument("--weapon", help="Arme du catalogue (par défaut : aucune)")
+    parser.add_argument("--armor", help="Armure du catalogue (par défaut : aucune)")
+    parser.add_argument("--enemy", help="Limiter à un ennemi, ex: TROLL ou TROLL:des_forets")
+    parser.add_argument("--morgrath", action="store_true",
+                        help="Analyser les deux rencontres avec Morgrath (pouvoir caché compris)")
+    args = parser.parse_args()
+
+    paths = (args.path,) if args.path else PATHS
+    for path in paths:
+        if args.morgrath:
+            print(analyze_morgrath(path, args.weapon, args.armor).summary())
+            continue
+        enemies = BALANCE_ENEMIES
+        if args.enemy:
+            enemy_type, _, variant = args.enemy.partition(":")
+            enemies = [entry for entry in BALANCE_ENEMIES
+                       if entry[0] == enemy_type and (not variant or entry[1] == variant)]
+        for enemy_type, variant in enemies:
+            print(analyze(path, enemy_type, variant, args.weapon, args.armor).summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+modifiers.py - Effets temporaires (potions, bénédictions) pour "L'Héritage des Cendres"
+Un modificateur ajoute un bonus à une stat jusqu'à un tour d'expiration. Les
+modificateurs actifs sont rangés dans un tas trié par expiration et les totaux
+par stat sont tenus à jour à chaque ajout ou expiration : avancer l'horloge ne
+retire que les effets expirés, sans jamais recalculer toutes les stats.
+"""
+
+import heapq
+
+
+# Texte affiché quand un modificateur expire
+EXPIRED_TEXT = "⌛ L'effet de {source} se dissipe ({amount:+d} {stat})."
+
+
+class ModifierStack:
+    """
+    Modificateurs de stats actifs, expirés par une horloge en tours
+
+    L'horloge avance d'un cran par tour de jeu et par round de combat : un effet
+    de 10 tours dure 10 commandes, ou 10 rounds d'un combat, ou un mélange des deux.
+
+    Examples:
+
+    >>> modifiers = ModifierStack()
+    >>> modifiers.add("FOR", 5, 2, "Potion de Force")
+    2
+    >>> modifiers.add("FOR", 3, 4)
+    4
+    >>> modifiers.total("FOR"), modifiers.total("DEX")
+    (8, 0)
+    >>> modifiers.advance(2)
+    [('FOR', 5, 'Potion de Force')]
+    >>> modifiers.total("FOR"), len(modifiers)
+    (3, 1)
+    >>> modifiers.add("FOR", -3, 1)
+    3
+    >>> modifiers.advance(1), modifiers.total("FOR")
+    ([('FOR', -3, None)], 3)
+    """
+
+    __slots__ = ("clock", "heap", "totals", "sequence")
+
+    def __init__(self, clock=0):
+        """
+        Args:
+            clock (int): Tour de départ de l'horloge
+        """
+        self.clock = clock
+        self.heap = [] # (expiration, ordre d'ajout, stat, bonus, source), tas min
+        self.totals = {} # Stat -> bonus cumulé des modificateurs actifs
+        self.sequence = 0 # Départage les modificateurs qui expirent au même tour
+
+    def __len__(self):
+        return len(self.heap)
+
+    def total(self, stat):
+        """Bonus cumulé des modificateurs actifs sur une stat"""
+        return self.totals.get(stat, 0)
+
+    def add(self, stat, amount, duration, source=None):
+        """
+        Ajoute un modificateur (les modificateurs d'une même stat se cumulent)
+
+        Args:
+            stat (str): Stat modifiée ("FOR", "DEX"...)
+            amount (int): Bonus (négatif pour un malus)
+            duration (int): Durée en tours (au moins 1)
+            source (str, optional): Origine affichée à l'expiration (nom de la potion)
+
+        Returns:
+            int: Tour d'expiration
+        """
+        expires = self.clock + max(1, duration)
+        heapq.heappush(self.heap, (expires, self.sequence, stat, amount, source))
+        self.sequence += 1
+        self.totals[stat] = self.totals.get(stat, 0) + amount
+        return expires
+
+    def advance(self, ticks=1):
+        """
+        Avance l'horloge et retire les modificateurs expirés
+
+        Returns:
+            list[tuple]: (stat, bonus, source) des modificateurs expirés, dans l'ordre d'expiration
+        """
+        self.clock += ticks
+        heap = self.heap
+        expired = []
+        while heap and heap[0][0] <= self.clock:
+            _, _, stat, amount, source = heapq.heappop(heap)
+            # Un total nul a pu être retiré alors que d'autres modificateurs (bonus et
+            # malus qui s'annulent) restent actifs sur la stat
+            total = self.totals.get(stat, 0) - amount
+            if total:
+                self.totals[stat] = total
+            else:
+                del self.totals[stat]
+            expired.append((stat, amount, source))
+        return expired
+
+    def remaining(self):
+        """Modificateurs actifs : (stat, bonus, tours restants, source), du plus proche de l'expiration"""
+        return [
+            (stat, amount, expires - self.clock, source)
+            for expires, _, stat, amount, source in sorted(self.heap)
+        ]
+
+    def clear(self):
+        """Retire tous les modificateurs (l'horloge continue)"""
+        self.heap.clear()
+        self.totals.clear()
+
+    def dump_state(self):
+        """État sérialisable : (horloge, modificateurs (tours restants, stat, bonus, source))"""
+        return (self.clock, tuple(
+            (expires - self.clock, stat, amount, source)
+            for expires, _, stat, amount, source in sorted(self.heap)
+        ))
+
+    @staticmethod
+    def load_state(state):
+        """Recrée une pile depuis dump_state()"""
+        clock, entries = state
+        modifiers = ModifierStack(clock)
+        for duration, stat, amount, source in entries:
+            modifiers.add(stat, amount, duration, source)
+        return modifiers
@@ -0,0 +1,113 @@
+"""
+output.py - Sorties texte bufferisées pour "L'Héritage des Cendres"
+Toute la sortie d'une commande est accumulée dans un buffer puis émise en une
+seule écriture (terminal, liste en mémoire ou socket).
+"""
+
+import sys
+
+
+class OutputSink:
+    """
+    Classe de base des sorties : accumule le texte jusqu'au prochain flush().
+    Utilisée telle quelle, elle n'émet rien : flush() se contente de retourner
+    le texte (mode headless).
+    """
+
+    def __init__(self, autoflush=False):
+        """
+        Initialise la sortie
+
+        Args:
+            autoflush (bool): Si True, chaque print() est émis immédiatement
+        """
+        self.buffer = []
+        self.autoflush = autoflush
+
+    def print(self, *values, sep=" ", end="\n"):
+        """Ajoute une ligne au buffer (mêmes arguments que print)"""
+        self.buffer.append(sep.join(map(str, values)) + end)
+        if self.autoflush:
+            self.flush()
+
+    def getvalue(self):
+        """Retourne le texte en attente sans le vider"""
+        return "".join(self.buffer)
+
+    def flush(self):
+        """
+        Émet tout le texte en attente en une seule écriture
+
+        Returns:
+            str: Le texte émis
+        """
+        if not self.buffer:
+            return ""
+        text = "".join(self.buffer)
+        self.buffer.clear()
+        self.emit(text)
+        return text
+
+    def emit(self, text):
+        """Écrit le texte vers la destination (rien pour la classe de base)"""
+        pass
+
+
+class StdoutSink(OutputSink):
+    """Sortie vers un flux texte (sys.stdout par défaut)"""
+
+    def __init__(self, stream=None, autoflush=False):
+        """
+        Args:
+            stream (file-like, optional): Flux cible. Si None, sys.stdout est lu
+                à chaque écriture (compatible avec une redirection)
+            autoflush (bool): Si True, chaque print() est émis immédiatement
+        """
+        super().__init__(autoflush)
+        self.stream = stream
+
+    def emit(self, text):
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+
+
+class ListSink(OutputSink):
+    """Sortie en mémoire : chaque flush ajoute un bloc de texte à la liste"""
+
+    def __init__(self, autoflush=False):
+        super().__init__(autoflush)
+        self.chunks = []
+
+    def emit(self, text):
+        self.chunks.append(text)
+
+
+class SocketSink(OutputSink):
+    """
+    Sortie vers une socket : accepte un asyncio.StreamWriter (méthode write)
+    ou une socket bloquante (méthode sendall)
+    """
+
+    def __init__(self, writer, encoding="utf-8", autoflush=False):
+        super().__init__(autoflush)
+        self.writer = writer
+        self.encoding = encoding
+
+    def emit(self, text):
+        data = text.encode(self.encoding)
+        if hasattr(self.writer, "sendall"):
+            self.writer.sendall(data)
+        else:
+            self.writer.write(data)
+
+
+# Sortie par défaut des objets créés hors d'un Game (scripts, tests manuels)
+DEFAULT_OUTPUT = StdoutSink(autoflush=True)
+
+
+def as_sink(output):
+    """Convertit un flux texte (méthode write) en OutputSink si nécessaire"""
+    if output is None or isinstance(output, OutputSink):
+        return output
+    return StdoutSink(output)
@@ -1,10 +1,74 @@
+from output import DEFAULT_OUTPUT
+from rng import DEFAULT_RNG
+from inventory import Inventory
+from modifiers import ModifierStack
+
+
+# Type des dégâts de la brûlure magique
+BURN_DAMAGE_TYPE = "FIRE"
+
+# Icône et nom affichés des stats (effets des potions "BUFF_<stat>")
+STAT_LABELS = {
+    'FOR': ("💪", "Force"),
+    'DEX': ("🎯", "Dextérité"),
+    'INT': ("🧠", "Intelligence"),
+    'CON': ("❤️", "Constitution"),
+    'SAG': ("👁️", "Sagesse"),
+    'CHA': ("🗣️", "Charisme")
+}
+
+
+class CombatStats:
+    """
+    Caractéristiques de combat dérivées des stats (effets temporaires compris),
+    de la voie et de l'équipement. Calculées une fois puis réutilisées à chaque
+    round jusqu'à la prochaine modification du joueur (voir
+    Player.invalidate_combat_stats).
+    """
+
+    __slots__ = (
+        "damage", "damage_type", "critical_threshold", "critical_damage",
+        "burn_threshold", "burn_damage", "dodge_chance", "armor_reduction"
+    )
+
+    def __init__(self, player):
+        """
+        Args:
+            player (Player): Le joueur dont les caractéristiques sont dérivées
+        """
+        path = player.chosen_path
+        # Dégâts de base selon la voie choisie
+        if path == "MAGIE":
+            self.damage = player.calculate_magical_damage()
+        elif path == "EPEE":
+            # Bonus de dégâts constant pour les guerriers
+            self.damage = player.calculate_physical_damage() + 2
+        else:
+            self.damage = player.calculate_physical_damage()
+        # Type des dégâts : magiques pour les mages, sinon celui de l'arme
+        if path == "MAGIE":
+            self.damage_type = "MAGICAL"
+        else:
+            self.damage_type = getattr(player.equipped_weapon, 'damage_type', "PHYSICAL")
+        # Coup critique des archers : jet 1-100 <= seuil, dégâts doublés
+        self.critical_threshold = player.get_stat('DEX') if path == "ARC" else 0
+        self.critical_damage = self.damage * 2
+        # Brûlure magique : jet 1-100 <= seuil, dégâts ajoutés
+        self.burn_threshold = player.get_stat('INT') if path == "MAGIE" else 0
+        self.burn_damage = player.get_stat('INT') // 2
+        self.dodge_chance = player.calculate_dodge_chance()
+        self.armor_reduction = getattr(player.equipped_armor, 'defense_bonus', 0)
+
 # Define the Player class.
 class Player():
 
     # Define the constructor.
-    def __init__(self, name):
+    def __init__(self, name, output=None, rng=None):
         self.name = name
+        self.output = output or DEFAULT_OUTPUT # Sortie texte (fournie par le jeu)
+        self.rng = rng or DEFAULT_RNG # Générateur aléatoire (fourni par le jeu)
         self.current_room = None
+        self.world = None # Monde de la session (résout les pièces partagées)
         self.history = [] # Pour l'historique de déplacement
         
         # Stats de base pour le combat
@@ -16,6 +80,8 @@ class Player():
             'SAG': 10, # Sagesse - perception, détection pièges
             'CHA': 10 # Charisme - persuasion, prix chez marchands
         }
+        # Effets temporaires (potions) ajoutés aux stats de base
+        self.modifiers = ModifierStack()
         
         # État du joueur
         self.health = 50
@@ -23,12 +89,18 @@ class Player():
         self.gold = 0
         
         # Inventaire et équipement
-        self.inventory = {}
+        self.inventory = Inventory()
         self.equipped_weapon = None
         self.equipped_armor = None
         
         # Voie choisie (déterminée plus tard)
         self.chosen_path = None # "ARC", "EPEE", ou "MAGIE"
+        
+        # Caractéristiques de combat dérivées (None : à recalculer)
+        self.combat_stats = None
+        
+        # Effets de statut infligés par les attaques spéciales (le temps d'un combat)
+        self.clear_status_effects()
 
     # Define the move method.
     def move(self, direction):
@@ -38,19 +110,21 @@ class Player():
             
         # Get the next room from the exits dictionary of the current room.
         next_room = self.current_room.exits[direction]
+        if self.world is not None:
+            next_room = self.world.resolve(next_room)
 
         # If the next room is None, print an error message and return False.
         if next_room is None:
-            print("\nAucune porte dans cette direction !\n")
+            self.output.print("\nAucune porte dans cette direction !\n")
             return False
         
         # Set the current room to the next room.
         self.current_room = next_room
-        print(self.current_room.get_long_description())
+        self.output.print(self.current_room.get_long_description())
         
         # Afficher l'historique après chaque déplacement réussi
         if self.history:
-            print(self.get_history())
+            self.output.print(self.get_history())
             
         return True
 
@@ -72,7 +146,13 @@ class Player():
         stats_str += f"PV: {self.health}/{self.max_health} | Or: {self.gold} pièces\n\n"
         
         for stat, value in self.stats.items():
-            stats_str += f"{stat}: {value}\n"
+            bonus = self.modifiers.total(stat)
+            if bonus:
+                stats_str += f"{stat}: {value + bonus} ({value} {bonus:+d})\n"
+            else:
+                stats_str += f"{stat}: {value}\n"
+        for stat, amount, turns, source in self.modifiers.remaining():
+            stats_str += f" - {source or stat}: {amount:+d} {stat}, encore {turns} tour(s)\n"
             
         if self.chosen_path:
             stats_str += f"\nVoie: {self.chosen_path}\n"
@@ -82,42 +162,66 @@ class Player():
     def calculate_physical_damage(self):
         """Calcule les dégâts physiques basés sur la FOR et l'arme"""
         base_damage = 5
-        strength_bonus = self.stats['FOR'] * 0.2 # 20% par point de FOR
+        strength_bonus = self.get_stat('FOR') * 0.2 # 20% par point de FOR
         
-        if self.equipped_weapon:
-            weapon_bonus = self.equipped_weapon.get('damage_bonus', 0)
-        else:
-            weapon_bonus = 0
-            
+        weapon_bonus = getattr(self.equipped_weapon, 'damage_bonus', 0)
         total_damage = base_damage + strength_bonus + weapon_bonus
         return max(1, int(total_damage))
 
     def calculate_magical_damage(self):
         """Calcule les dégâts magiques basés sur l'INT"""
         base_damage = 4
-        intelligence_bonus = self.stats['INT'] * 0.25 # 25% par point d'INT
+        intelligence_bonus = self.get_stat('INT') * 0.25 # 25% par point d'INT
         
-        if self.equipped_weapon and self.equipped_weapon.get('magic_bonus', 0):
-            weapon_bonus = self.equipped_weapon['magic_bonus']
-        else:
-            weapon_bonus = 0
-            
+        weapon_bonus = getattr(self.equipped_weapon, 'magic_bonus', 0)
         total_damage = base_damage + intelligence_bonus + weapon_bonus
         return max(1, int(total_damage))
 
     def calculate_dodge_chance(self):
         """Calcule les chances d'esquive basées sur la DEX"""
         base_dodge = 10 # 10% de base
-        dexterity_bonus = self.stats['DEX'] * 1.5 # 1.5% par point de DEX
+        dexterity_bonus = self.get_stat('DEX') * 1.5 # 1.5% par point de DEX
         
-        if self.equipped_armor and self.equipped_armor.get('dodge_penalty', 0):
-            armor_penalty = self.equipped_armor['dodge_penalty']
-        else:
-            armor_penalty = 0
-            
+        armor_penalty = getattr(self.equipped_armor, 'dodge_penalty', 0)
         total_dodge = base_dodge + dexterity_bonus - armor_penalty
         return max(5, min(80, total_dodge)) # Entre 5% et 80%
 
+    def get_stat(self, stat):
+        """Valeur effective d'une stat : base et effets temporaires actifs"""
+        return self.stats[stat] + self.modifiers.total(stat)
+
+    def add_modifier(self, stat, amount, duration, source=None):
+        """Ajoute un effet temporaire sur une stat (voir ModifierStack.add)"""
+        expires = self.modifiers.add(stat, amount, duration, source)
+        self.invalidate_combat_stats()
+        return expires
+
+    def tick_modifiers(self, ticks=1):
+        """
+        Avance l'horloge des effets temporaires (un tour de jeu ou un round de combat)
+
+        Returns:
+            list[tuple]: (stat, bonus, source) des effets expirés
+        """
+        expired = self.modifiers.advance(ticks)
+        if expired:
+            self.invalidate_combat_stats()
+        return expired
+
+    def get_combat_stats(self):
+        """Retourne les caractéristiques de combat, recalculées si nécessaire"""
+        combat_stats = self.combat_stats
+        if combat_stats is None:
+            combat_stats = self.combat_stats = CombatStats(self)
+        return combat_stats
+
+    def invalidate_combat_stats(self):
+        """
+        Signale une modification des stats, de la voie ou de l'équipement :
+        les caractéristiques de combat seront recalculées au prochain round
+        """
+        self.combat_stats = None
+
     def take_damage(self, damage):
         """Applique des dégâts au joueur"""
         self.health -= damage
@@ -134,15 +238,17 @@ class Player():
 
     # Méthodes pour l'inventaire
     def add_item(self, item_name, item):
-        """Ajoute un objet à l'inventaire"""
-        self.inventory[item_name] = item
-        return True
+        """
+        Ajoute un objet à l'inventaire
+        
+        Returns:
+            str: Nom sous lequel l'objet est rangé (les consommables s'empilent)
+        """
+        return self.inventory.add(item_name, item)
 
     def remove_item(self, item_name):
-        """Retire un objet de l'inventaire"""
-        if item_name in self.inventory:
-            return self.inventory.pop(item_name)
-        return None
+        """Retire un exemplaire d'un objet de l'inventaire"""
+        return self.inventory.remove(item_name)
 
     def get_inventory_string(self):
         """Retourne une string formatée de l'inventaire"""
@@ -152,9 +258,13 @@ class Player():
         inventory_str = "Vous disposez des items suivants:\n"
         for item_name, item in self.inventory.items():
             inventory_str += f" - {item_name}"
+            if getattr(item, 'count', 1) > 1:
+                inventory_str += f" (x{item.count})"
             if hasattr(item, 'description'):
                 inventory_str += f" : {item.description}"
             inventory_str += "\n"
+        inventory_str += (f"Poids total: {self.inventory.total_weight:.1f} unités, "
+                          f"valeur totale: {self.inventory.total_value} pièces d'or\n")
         return inventory_str
 
     # Méthodes pour l'équipement
@@ -162,6 +272,7 @@ class Player():
         """Équipe une arme"""
         if weapon_name in self.inventory:
             self.equipped_weapon = self.inventory[weapon_name]
+            self.invalidate_combat_stats()
             return True
         return False
 
@@ -169,6 +280,7 @@ class Player():
         """Équipe une armure"""
         if armor_name in self.inventory:
             self.equipped_armor = self.inventory[armor_name]
+            self.invalidate_combat_stats()
             return True
         return False
 
@@ -185,85 +297,169 @@ class Player():
                 self.stats['FOR'] += 3
             elif path == "MAGIE":
                 self.stats['INT'] += 3
+            self.invalidate_combat_stats()
                 
             return True
         return False
 
     # Méthodes de combat
-    def attack(self, enemy):
-        """Le joueur attaque un ennemi"""
-        import random
+    def roll_attack(self):
+        """
+        Tire les dégâts d'une attaque selon la voie choisie (sans les appliquer)
         
-        # Calcul des dégâts selon la voie choisie
+        Returns:
+            tuple: (dégâts, coup critique, dégâts de brûlure magique)
+        """
+        combat_stats = self.get_combat_stats()
         if self.chosen_path == "ARC":
-            base_damage = self.calculate_physical_damage()
             # Chance de coup critique pour les archers
-            if random.randint(1, 100) <= self.stats['DEX']:
-                base_damage *= 2
-                print("⭐ Coup critique !")
+            if self.rng.percent(combat_stats.critical_threshold):
+                return combat_stats.critical_damage, True, 0
                 
-        elif self.chosen_path == "EPEE":
-            base_damage = self.calculate_physical_damage()
-            # Bonus de dégâts constant pour les guerriers
-            base_damage += 2
-            
         elif self.chosen_path == "MAGIE":
-            base_damage = self.calculate_magical_damage()
             # Chance de brûlure magique
-            if random.randint(1, 100) <= self.stats['INT']:
-                burn_damage = self.stats['INT'] // 2
-                base_damage += burn_damage
-                print(f"🔥 Brûlure magique ! +{burn_damage} dégâts")
-        else:
-            base_damage = self.calculate_physical_damage()
-        
-        # Application des dégâts
-        enemy.take_damage(base_damage)
+            if self.rng.percent(combat_stats.burn_threshold):
+                burn_damage = combat_stats.burn_damage
+                return combat_stats.damage + burn_damage, False, burn_damage
+        return combat_stats.damage, False, 0
+    
+    def attack(self, enemy):
+        """Le joueur attaque un ennemi"""
+        base_damage, critical, burn_damage = self.roll_attack()
+        self.deal_damage(enemy, base_damage, burn_damage)
         return base_damage
     
+    def deal_damage(self, enemy, damage, burn_damage=0):
+        """
+        Applique une attaque à l'ennemi : la brûlure est infligée en dégâts de
+        feu, le reste avec le type de dégâts de la voie et de l'arme
+        
+        Args:
+            enemy (Enemy): La cible
+            damage (int): Dégâts tirés par roll_attack (brûlure comprise)
+            burn_damage (int): Part de brûlure magique
+            
+        Returns:
+            int: Dégâts réellement subis par l'ennemi
+        """
+        dealt = enemy.take_damage(damage - burn_damage, self.get_combat_stats().damage_type)[0]
+        if burn_damage:
+            dealt += enemy.take_damage(burn_damage, BURN_DAMAGE_TYPE)[0]
+        return dealt
+    
     def defend(self, enemy_damage):
-        """Le joueur subit une attaque"""
-        import random
+        """
+        Le joueur subit une attaque
         
+        Returns:
+            int: Dégâts subis (0 uniquement si l'attaque est esquivée)
+        """
+        combat_stats = self.get_combat_stats()
         # Chance d'esquiver
-        dodge_chance = self.calculate_dodge_chance()
-        if random.randint(1, 100) <= dodge_chance:
-            print("💨 Vous esquivez l'attaque !")
+        if self.rng.percent(combat_stats.dodge_chance):
             return 0
         
         # Réduction des dégâts par l'armure
-        damage_reduction = 0
-        if self.equipped_armor:
-            damage_reduction = self.equipped_armor.defense_bonus
-        
-        final_damage = max(1, enemy_damage - damage_reduction)
+        final_damage = max(1, enemy_damage - combat_stats.armor_reduction)
         self.take_damage(final_damage)
         
         return final_damage
     
+    def apply_status_effect(self, effect_type, power=0, duration=1):
+        """
+        Applique un effet de statut au joueur (mêmes règles que pour les ennemis)
+        
+        Args:
+            effect_type (str): "POISON", "BURN" ou "STUN" (perte de la prochaine attaque)
+            power (int): Dégâts par round
+            duration (int): Durée en rounds
+        """
+        if effect_type == "POISON":
+            self.is_poisoned = True
+            self.poison_damage = power
+            self.poison_duration = duration
+        elif effect_type == "BURN":
+            self.is_burning = True
+            self.burn_damage = power
+            self.burn_duration = duration
+        elif effect_type == "STUN":
+            self.is_stunned = True
+    
+    def process_status_effects(self):
+        """
+        Traite les effets de statut au début du round
+        
+        Returns:
+            list: Couples (effet, valeur) des effets appliqués ; ("STUN", 0) : le
+            joueur perd son attaque ce round
+        """
+        effects = []
+        
+        if self.is_poisoned and self.poison_duration > 0:
+            self.take_damage(self.poison_damage)
+            self.poison_duration -= 1
+            effects.append(("POISON", self.poison_damage))
+            if self.poison_duration <= 0:
+                self.is_poisoned = False
+                
+        if self.is_burning and self.burn_duration > 0:
+            self.take_damage(self.burn_damage)
+            self.burn_duration -= 1
+            effects.append(("BURN", self.burn_damage))
+            if self.burn_duration <= 0:
+                self.is_burning = False
+                
+        if self.is_stunned:
+            effects.append(("STUN", 0))
+            self.is_stunned = False # Stun dure 1 tour
+            
+        return effects
+    
+    def clear_status_effects(self):
+        """Retire tous les effets de statut (fin de combat)"""
+        self.is_stunned = False
+        self.is_poisoned = False
+        self.poison_damage = 0
+        self.poison_duration = 0
+        self.is_burning = False
+        self.burn_damage = 0
+        self.burn_duration = 0
+    
     def use_consumable(self, item_name):
-        """Utilise un consommable de l'inventaire"""
-        if item_name in self.inventory:
-            item = self.inventory[item_name]
-            if hasattr(item, 'effect_type'):
-                if item.effect_type == "SOIN":
-                    heal_amount = self.heal(item.effect_power)
-                    print(f"💚 Vous utilisez {item_name} et récupérez {item.effect_power} PV !")
-                    self.remove_item(item_name)
-                    return True
-                elif item.effect_type == "BUFF_FOR":
-                    self.stats['FOR'] += item.effect_power
-                    print(f"💪 Vous utilisez {item_name} et gagnez +{item.effect_power} en Force !")
-                    self.remove_item(item_name)
-                    return True
-                elif item.effect_type == "BUFF_DEX":
-                    self.stats['DEX'] += item.effect_power
-                    print(f"🎯 Vous utilisez {item_name} et gagnez +{item.effect_power} en Dextérité !")
-                    self.remove_item(item_name)
-                    return True
+        """
+        Utilise un consommable de l'inventaire
+
+        Les potions de stat ("BUFF_FOR", "BUFF_DEX"...) ajoutent un effet
+        temporaire pour leur durée (permanent si la durée est nulle).
+        """
+        item = self.inventory.get(item_name)
+        effect_type = getattr(item, 'effect_type', None)
+        if effect_type == "HEAL":
+            old_health = self.health
+            self.heal(item.effect_power)
+            self.output.print(f"💚 Vous utilisez {item.name} et récupérez {self.health - old_health} PV !")
+        elif effect_type == "ANTIDOTE":
+            self.is_poisoned = False
+            self.poison_damage = 0
+            self.poison_duration = 0
+            self.output.print(f"🧪 Vous utilisez {item.name} : le poison est neutralisé.")
+        elif effect_type is not None and effect_type.startswith("BUFF_") and effect_type[5:] in self.stats:
+            stat = effect_type[5:]
+            icon, label = STAT_LABELS[stat]
+            if item.duration > 0:
+                self.add_modifier(stat, item.effect_power, item.duration, item.name)
+                self.output.print(f"{icon} Vous utilisez {item.name} et gagnez +{item.effect_power} en "
+                                  f"{label} pendant {item.duration} tours !")
+            else:
+                self.stats[stat] += item.effect_power
+                self.invalidate_combat_stats()
+                self.output.print(f"{icon} Vous utilisez {item.name} et gagnez +{item.effect_power} en {label} !")
+        else:
+            self.output.print(f"Vous ne pouvez pas utiliser {item_name}.")
+            return False
         
-        print(f"Vous ne pouvez pas utiliser {item_name}.")
-        return False
+        self.remove_item(item_name)
+        return True
 
     # Méthode pour vérifier si le joueur est en vie
     def is_alive(self):
@@ -278,13 +474,16 @@ class Player():
         self.health = 50
         self.max_health = 50
         self.gold = 0
-        self.inventory = {}
+        self.inventory = Inventory()
         self.equipped_weapon = None
         self.equipped_armor = None
         self.chosen_path = None
+        self.modifiers = ModifierStack()
         
         # Réinitialiser les stats
         for stat in self.stats:
             self.stats[stat] = 10
+        self.invalidate_combat_stats()
+        self.clear_status_effects()
             
         return True
\ No newline at end of file
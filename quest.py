@@ -2,10 +2,17 @@
 quest.py - Système de gestion des quêtes pour "L'Héritage des Cendres"
 """
 
+from output import DEFAULT_OUTPUT
+
+
 class Quest:
     """
     Classe représentant une quête du jeu.
     """
+    
+    # Sortie texte des annonces de quête (remplacée par celle du gestionnaire)
+    output = DEFAULT_OUTPUT
+    
     def __init__(self, quest_id, title, description, objectives, reward, 
                  required_item=None, next_quest=None, auto_start=False):
         """
@@ -38,11 +45,11 @@ class Quest:
         """Active la quête."""
         if not self.is_active and not self.is_completed:
             self.is_active = True
-            print(f"\n📜 Nouvelle quête : {self.title}\n{self.description}\n")
-            print("Objectifs :")
+            self.output.print(f"\n📜 Nouvelle quête : {self.title}\n{self.description}\n")
+            self.output.print("Objectifs :")
             for i, obj in enumerate(self.objectives, 1):
-                print(f"  {i}. {obj}")
-            print()
+                self.output.print(f"  {i}. {obj}")
+            self.output.print()
             return True
         return False
 
@@ -50,7 +57,7 @@ class Quest:
         """Marque un objectif comme complété."""
         if objective in self.objectives and objective not in self.completed_objectives:
             self.completed_objectives.append(objective)
-            print(f"✅ Objectif accompli : {objective}")
+            self.output.print(f"✅ Objectif accompli : {objective}")
             
             # Vérifier si tous les objectifs sont complétés
             if set(self.completed_objectives) == set(self.objectives):
@@ -63,15 +70,15 @@ class Quest:
         if not self.is_completed:
             self.is_completed = True
             self.is_active = False
-            print(f"\n🏆 Quête terminée : {self.title}")
-            print("Récompenses :")
+            self.output.print(f"\n🏆 Quête terminée : {self.title}")
+            self.output.print("Récompenses :")
             if 'xp' in self.reward:
-                print(f" - {self.reward['xp']} points d'expérience")
+                self.output.print(f" - {self.reward['xp']} points d'expérience")
             if 'gold' in self.reward:
-                print(f" - {self.reward['gold']} pièces d'or")
+                self.output.print(f" - {self.reward['gold']} pièces d'or")
             if 'item' in self.reward:
-                print(f" - Objet obtenu : {self.reward['item']}")
-            print()
+                self.output.print(f" - Objet obtenu : {self.reward['item']}")
+            self.output.print()
             return True
         return False
 
@@ -100,18 +107,65 @@ class Quest:
 class QuestManager:
     """Gestionnaire de toutes les quêtes du jeu"""
     
-    def __init__(self, player):
+    def __init__(self, player, output=None):
         """
         Initialise le gestionnaire de quêtes
         
         Args:
             player: L'objet joueur
+            output (OutputSink, optional): Sortie texte des annonces de quête
         """
         self.player = player
         self.all_quests = create_quests()
+        if output is not None:
+            for quest in self.all_quests.values():
+                quest.output = output
         self.active_quests = []
         self.completed_quests = []
         
+        # Lieux du monde (id de pièce -> nom) et index des déclencheurs :
+        # id de pièce -> liste de (quête, objectif) encore à accomplir
+        self.locations = {}
+        self.triggers = {}
+        
+    def set_locations(self, locations):
+        """
+        Enregistre les lieux du monde et recompile l'index des déclencheurs
+        
+        Args:
+            locations (dict): id de pièce -> nom affiché de la pièce
+        """
+        self.locations = dict(locations)
+        self.rebuild_triggers()
+        
+    def rebuild_triggers(self):
+        """Recompile l'index des déclencheurs pour toutes les quêtes actives"""
+        self.triggers = {}
+        for quest in self.active_quests:
+            self.index_quest(quest)
+            
+    def index_quest(self, quest):
+        """Ajoute à l'index les objectifs restants d'une quête liés à un lieu"""
+        for location_id, location_name in self.locations.items():
+            name = location_name.lower()
+            for objective in quest.objectives:
+                if name in objective.lower() and objective not in quest.completed_objectives:
+                    self.triggers.setdefault(location_id, []).append((quest, objective))
+                    
+    def unindex(self, quest, objective=None):
+        """Retire de l'index un objectif accompli (ou tous ceux d'une quête)"""
+        for location_id in list(self.triggers):
+            entries = [
+                (indexed_quest, indexed_objective)
+                for indexed_quest, indexed_objective in self.triggers[location_id]
+                if indexed_quest is not quest
+                or (objective is not None and indexed_objective != objective)
+            ]
+            if entries:
+                self.triggers[location_id] = entries
+            else:
+                del self.triggers[location_id]
+        
     def start_quest(self, quest_id):
         """Démarre une quête par son ID"""
         if quest_id in self.all_quests:
@@ -119,6 +173,7 @@ class QuestManager:
             if quest.start():
                 if quest not in self.active_quests:
                     self.active_quests.append(quest)
+                    self.index_quest(quest)
                 return True
         return False
     
@@ -127,8 +182,11 @@ class QuestManager:
         if quest_id in self.all_quests:
             quest = self.all_quests[quest_id]
             if quest.complete_objective(objective):
+                self.unindex(quest, objective)
+                
                 # Si la quête est terminée, gérer la suite
                 if quest.is_completed:
+                    self.unindex(quest)
                     self.active_quests.remove(quest)
                     self.completed_quests.append(quest)
                     
@@ -156,13 +214,19 @@ class QuestManager:
             item_name = quest.reward['item']
             self.player.add_item(item_name, f"Récompense: {item_name}")
     
-    def check_quest_triggers(self, location_name):
-        """Vérifie si l'arrivée à un lieu déclenche des objectifs de quête"""
-        for quest in self.active_quests:
-            # Vérifier les objectifs liés aux lieux
-            for objective in quest.objectives:
-                if location_name.lower() in objective.lower() and objective not in quest.completed_objectives:
-                    self.complete_objective(quest.quest_id, objective)
+    def check_quest_triggers(self, location_id):
+        """
+        Vérifie si la présence dans un lieu déclenche des objectifs de quête
+        
+        Args:
+            location_id (str): Identifiant de la pièce (clé dans game.rooms)
+        """
+        entries = self.triggers.get(location_id)
+        if not entries:
+            return
+        # Copie : compléter un objectif modifie l'index (et les quêtes actives)
+        for quest, objective in tuple(entries):
+            self.complete_objective(quest.quest_id, objective)
     
     def get_active_quests_string(self):
         """Retourne une string avec toutes les quêtes actives"""
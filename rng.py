@@ -0,0 +1,194 @@
+"""
+rng.py - Générateur aléatoire par partie pour "L'Héritage des Cendres"
+Chaque Game possède son propre GameRandom : les parties d'un même processus ne
+se perturbent plus entre elles et une graine fixe rejoue exactement la même
+partie. Les tirages du combat sont servis depuis un bloc de nombres générés
+d'avance (en masse par NumPy s'il est disponible).
+"""
+
+import random
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError: # NumPy est optionnel : il accélère seulement la génération des blocs
+    np = None
+
+
+# Nombre de tirages générés d'un coup quand le bloc est épuisé
+BATCH_SIZE = 1024
+
+
+class GameRandom(random.Random):
+    """
+    Générateur aléatoire reproductible avec tirages par blocs
+
+    Les méthodes de random.Random (randint, choice...) restent disponibles ;
+    chance(), percent(), roll(), between() et pick() consomment un bloc de
+    flottants pré-générés, beaucoup moins coûteux qu'un appel à randint par jet.
+
+    Les blocs viennent d'un second Mersenne Twister dérivé de la graine, généré
+    en masse par NumPy s'il est installé. NumPy produit exactement les mêmes
+    flottants que random.random() pour un même état : une graine donne la même
+    partie avec ou sans NumPy, quelle que soit la taille des blocs.
+
+    Examples:
+
+    >>> a, b = GameRandom(42), GameRandom(42)
+    >>> [a.roll(100) for _ in range(5)] == [b.roll(100) for _ in range(5)]
+    True
+    >>> 3 <= a.between(3, 7) <= 7
+    True
+    >>> c, d = GameRandom(42, batch_size=7), GameRandom(42, batch_size=500)
+    >>> [c.percent(30) for _ in range(20)] == [d.roll(100) <= 30 for _ in range(20)]
+    True
+    >>> state = a.getstate()
+    >>> first = [a.between(1, 6) for _ in range(2000)] + [a.randint(1, 6)]
+    >>> a.setstate(state)
+    >>> first == [a.between(1, 6) for _ in range(2000)] + [a.randint(1, 6)]
+    True
+    """
+
+    def __init__(self, seed=None, batch_size=BATCH_SIZE):
+        """
+        Initialise le générateur
+
+        Args:
+            seed (int, optional): Graine (None = graine aléatoire du système)
+            batch_size (int): Taille des blocs de tirages pré-générés
+        """
+        self.batch_size = batch_size
+        self.pool = [] # Tirages pré-générés, consommés depuis la fin
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        """Réinitialise la graine et oublie les tirages pré-générés"""
+        super().seed(a, version)
+        self.pool = []
+        # Flux des blocs, indépendant du flux de randint/choice
+        self.source = random.Random(self.getrandbits(64))
+        self.set_stream_state(self.source.getstate()[1])
+
+    def stream_state(self):
+        """
+        État du flux des blocs : les 624 mots du Mersenne Twister suivis de la
+        position, le même avec ou sans NumPy
+        """
+        if self.generator is not None:
+            state = self.generator.bit_generator.state["state"]
+            return tuple(int(word) for word in state["key"]) + (int(state["pos"]),)
+        return self.source.getstate()[1]
+
+    def set_stream_state(self, internal):
+        """Replace le flux des blocs dans un état retourné par stream_state()"""
+        self.source = random.Random()
+        self.source.setstate((3, tuple(internal), None))
+        self.generator = None
+        if np is not None:
+            # Même état que self.source, généré par NumPy
+            bit_generator = np.random.MT19937()
+            bit_generator.state = {
+                "bit_generator": "MT19937",
+                "state": {"key": np.array(internal[:-1], dtype=np.uint32), "pos": internal[-1]}
+            }
+            self.generator = np.random.Generator(bit_generator)
+
+    def getstate(self):
+        """État complet : flux de randint/choice, flux des blocs et tirages pré-générés"""
+        return (super().getstate(), self.stream_state(), tuple(self.pool))
+
+    def setstate(self, state):
+        """Restaure un état retourné par getstate()"""
+        main_state, internal, pool = state
+        super().setstate(main_state)
+        self.set_stream_state(internal)
+        self.pool = list(pool)
+
+    def floats(self, count):
+        """
+        Génère le bloc suivant de flottants uniformes dans [0, 1)
+
+        Args:
+            count (int): Nombre de tirages
+
+        Returns:
+            list[float]: Les tirages, le premier à consommer en dernier
+        """
+        if self.generator is not None:
+            return self.generator.random(count)[::-1].tolist()
+        draw = self.source.random
+        draws = [draw() for _ in repeat(None, count)]
+        draws.reverse()
+        return draws
+
+    def next_float(self):
+        """Retourne le prochain tirage du bloc (régénéré s'il est vide)"""
+        pool = self.pool
+        if not pool:
+            pool.extend(self.floats(self.batch_size))
+        return pool.pop()
+
+    # Les méthodes suivantes dépilent le bloc directement : un appel de moins par jet
+
+    def chance(self, probability):
+        """Retourne True avec la probabilité donnée"""
+        pool = self.pool
+        if not pool:
+            pool.extend(self.floats(self.batch_size))
+        return pool.pop() < probability
+
+    def percent(self, chance):
+        """Jet de pourcentage : équivalent à randint(1, 100) <= chance"""
+        pool = self.pool
+        if not pool:
+            pool.extend(self.floats(self.batch_size))
+        return int(pool.pop() * 100) + 1 <= chance
+
+    def roll(self, sides=100):
+        """Lance un dé : entier entre 1 et sides"""
+        pool = self.pool
+        if not pool:
+            pool.extend(self.floats(self.batch_size))
+        return int(pool.pop() * sides) + 1
+
+    def between(self, low, high):
+        """Entier entre low et high inclus (équivalent à randint)"""
+        pool = self.pool
+        if not pool:
+            pool.extend(self.floats(self.batch_size))
+        return low + int(pool.pop() * (high - low + 1))
+
+    def pick(self, sequence):
+        """Élément au hasard d'une séquence non vide (équivalent à choice)"""
+        pool = self.pool
+        if not pool:
+            pool.extend(self.floats(self.batch_size))
+        return sequence[int(pool.pop() * len(sequence))]
+
+    # Tirages en masse (simulations) : pris à la suite du flux, sans passer par le bloc
+
+    def uniforms(self, count):
+        """
+        Génère count flottants uniformes dans [0, 1), dans l'ordre du flux
+
+        Returns:
+            Tableau NumPy si NumPy est disponible, sinon liste (mêmes valeurs)
+        """
+        if self.generator is not None:
+            return self.generator.random(count)
+        draw = self.source.random
+        return [draw() for _ in repeat(None, count)]
+
+    def between_total(self, low, high, count):
+        """Somme de count tirages between(low, high), calculée en masse"""
+        if low == high or count <= 0:
+            return low * max(count, 0)
+        draws = self.uniforms(count)
+        span = high - low + 1
+        if self.generator is not None:
+            return low * count + int((draws * span).astype(np.int64).sum())
+        return low * count + sum([int(draw * span) for draw in draws])
+
+
+# Générateur par défaut des objets créés hors d'un Game (scripts, tests manuels)
+DEFAULT_RNG = GameRandom()
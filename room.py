@@ -1,13 +1,16 @@
 # Define the Room class.
 
+from inventory import Inventory
+
 class Room:
 
     # Define the constructor. 
     def __init__(self, name, description):
         self.name = name
         self.description = description
+        self.room_id = None # Identifiant stable (clé dans game.rooms)
         self.exits = {}
-        self.inventory = {} # Inventaire des objets dans la piÃ¨ce
+        self.inventory = Inventory() # Inventaire des objets dans la piÃ¨ce
         self.enemies = {} # Dictionnaire des ennemis dans la piÃ¨ce
         self.characters = {} # Dictionnaire des PNJ dans la piÃ¨ce
     
@@ -52,14 +55,11 @@ class Room:
     # MÃ©thodes pour gÃ©rer l'inventaire de la piÃ¨ce
     def add_item(self, item_name, item):
         """Ajoute un objet Ã  la piÃ¨ce"""
-        self.inventory[item_name] = item
-        return True
+        return self.inventory.add(item_name, item)
 
     def remove_item(self, item_name):
         """Retire un objet de la piÃ¨ce"""
-        if item_name in self.inventory:
-            return self.inventory.pop(item_name)
-        return None
+        return self.inventory.remove(item_name)
 
     def get_items_string(self):
         """Retourne une string formatÃ©e des objets dans la piÃ¨ce"""
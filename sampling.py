@@ -0,0 +1,140 @@
+"""
+sampling.py - Tirages pondérés pour "L'Héritage des Cendres"
+Table d'alias (méthode de Vose) : construite une fois à partir des poids, elle
+tire ensuite un élément en temps constant avec un seul nombre aléatoire, quel
+que soit le nombre d'éléments.
+"""
+
+try:
+    import numpy as np
+except ImportError: # NumPy est optionnel : il accélère seulement les tirages en masse
+    np = None
+
+
+class AliasTable:
+    """
+    Table d'alias de Vose pour tirer un élément selon des poids fixes
+
+    Chaque case i garde l'élément i avec la probabilité probability[i], sinon
+    l'élément alias[i]. Un tirage utilise un seul flottant : sa partie entière
+    (sur n cases) choisit la case, sa partie fractionnaire décide entre
+    l'élément et son alias. Avec des poids égaux, le tirage est identique à
+    rng.pick(items).
+
+    Examples:
+
+    >>> from rng import GameRandom
+    >>> table = AliasTable(["commun", "rare"], [3, 1])
+    >>> table.probability
+    (1.0, 0.5)
+    >>> rng = GameRandom(1)
+    >>> draws = [table.sample(rng) for _ in range(4000)]
+    >>> 0.2 < draws.count("rare") / 4000 < 0.3
+    True
+    """
+
+    __slots__ = ("items", "probability", "alias")
+
+    def __init__(self, items, weights=None):
+        """
+        Args:
+            items (sequence): Éléments à tirer (au moins un)
+            weights (sequence, optional): Poids positifs (par défaut : tous égaux)
+
+        Raises:
+            ValueError: Si la table est vide ou si un poids est négatif ou tous nuls
+        """
+        items = tuple(items)
+        count = len(items)
+        if weights is None:
+            weights = [1] * count
+        if not count or len(weights) != count:
+            raise ValueError("Une table d'alias demande autant de poids que d'éléments (au moins un).")
+        total = sum(weights)
+        if total <= 0 or min(weights) < 0:
+            raise ValueError("Les poids doivent être positifs.")
+
+        probability = [weight * count / total for weight in weights]
+        alias = list(range(count))
+        small = [index for index, value in enumerate(probability) if value < 1.0]
+        large = [index for index, value in enumerate(probability) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            alias[less] = more
+            # La case "less" est complétée par "more", qui perd d'autant
+            probability[more] = (probability[more] + probability[less]) - 1.0
+            if probability[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Restes (erreurs d'arrondi) : cases pleines
+        for index in large + small:
+            probability[index] = 1.0
+
+        self.items = items
+        self.probability = tuple(probability)
+        self.alias = tuple(alias)
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, rng):
+        """
+        Tire un élément
+
+        Args:
+            rng (GameRandom): Générateur aléatoire (un seul tirage consommé)
+
+        Returns:
+            L'élément tiré
+        """
+        position = rng.next_float() * len(self.items)
+        index = int(position)
+        if position - index < self.probability[index]:
+            return self.items[index]
+        return self.items[self.alias[index]]
+
+    def sample_counts(self, rng, count):
+        """
+        Tire count éléments d'un coup, sans construire la liste des tirages
+
+        Les flottants viennent de rng.uniforms() : le résultat est le même avec
+        ou sans NumPy, qui ne fait qu'accélérer le calcul.
+
+        Args:
+            rng (GameRandom): Générateur aléatoire (count tirages consommés)
+            count (int): Nombre de tirages
+
+        Returns:
+            list[int]: Nombre de fois où chaque élément est tiré (dans l'ordre de items)
+        """
+        size = len(self.items)
+        draws = rng.uniforms(count)
+        if np is not None and isinstance(draws, np.ndarray):
+            position = draws * size
+            index = position.astype(np.intp)
+            keep = (position - index) < np.asarray(self.probability)[index]
+            chosen = np.where(keep, index, np.asarray(self.alias)[index])
+            return np.bincount(chosen, minlength=size).tolist()
+
+        probability = self.probability
+        alias = self.alias
+        counts = [0] * size
+        for draw in draws:
+            position = draw * size
+            index = int(position)
+            if position - index < probability[index]:
+                counts[index] += 1
+            else:
+                counts[alias[index]] += 1
+        return counts
+
+    def probabilities(self):
+        """Probabilité de tirer chaque élément (dans l'ordre de items)"""
+        count = len(self.items)
+        result = [0.0] * count
+        for index in range(count):
+            result[index] += self.probability[index] / count
+            result[self.alias[index]] += (1.0 - self.probability[index]) / count
+        return result
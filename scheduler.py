@@ -0,0 +1,174 @@
+"""
+scheduler.py - Planificateur d'événements par tour pour "L'Héritage des Cendres"
+Roue temporelle hiérarchique : chaque événement (déplacement de PNJ, effet de
+statut, régénération, recharge d'attaque spéciale, événement du monde) est rangé
+dans la case de son tour d'échéance. Avancer d'un tour ne visite que la case du
+tour courant, quel que soit le nombre d'événements planifiés plus tard.
+"""
+
+
+# Nombre de bits (et donc de cases) par niveau de la roue : 64 cases
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+# Nombre de niveaux : 64^4 tours avant de repasser par le dernier niveau
+LEVELS = 4
+
+
+class Timer:
+    """Un événement planifié (à garder pour pouvoir l'annuler)"""
+
+    __slots__ = ("due", "period", "callback", "args", "cancelled")
+
+    def __init__(self, due, callback, args, period=0):
+        self.due = due # Tour d'échéance
+        self.period = period # 0 = une seule fois, sinon intervalle en tours
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class TimerWheel:
+    """
+    Roue temporelle hiérarchique indexée par numéro de tour
+
+    Le niveau 0 contient les événements des 64 prochains tours (une case par
+    tour), le niveau 1 ceux des 64*64 suivants (une case par bloc de 64 tours),
+    etc. Quand le niveau 0 fait un tour complet, la case suivante du niveau 1
+    est redistribuée dans le niveau 0.
+
+    Examples:
+
+    >>> wheel = TimerWheel()
+    >>> fired = []
+    >>> timer = wheel.every(5, fired.append, "pnj")
+    >>> _ = wheel.schedule(3, fired.append, "piège")
+    >>> for turn in range(10):
+    ...     _ = wheel.advance()
+    >>> fired
+    ['piège', 'pnj', 'pnj']
+    >>> wheel.cancel(timer)
+    >>> len(wheel)
+    0
+    """
+
+    def __init__(self, start=0):
+        """
+        Initialise la roue
+
+        Args:
+            start (int): Numéro du tour courant
+        """
+        self.current = start
+        # Les niveaux supérieurs ne sont créés qu'au premier événement lointain
+        # (un combat n'utilise que le niveau 0)
+        self.levels = [[[] for _ in range(SLOTS)]] + [None] * (LEVELS - 1)
+        self.count = 0 # Événements actifs
+
+    def __len__(self):
+        return self.count
+
+    def schedule(self, delay, callback, *args):
+        """
+        Planifie un appel unique dans `delay` tours
+
+        Args:
+            delay (int): Nombre de tours avant l'appel (au moins 1)
+            callback (callable): Fonction appelée avec *args
+
+        Returns:
+            Timer: L'événement planifié
+        """
+        timer = Timer(self.current + max(1, delay), callback, args)
+        self._insert(timer)
+        self.count += 1
+        return timer
+
+    def every(self, period, callback, *args, delay=None):
+        """
+        Planifie un appel répété tous les `period` tours
+
+        Args:
+            period (int): Intervalle en tours (au moins 1)
+            callback (callable): Fonction appelée avec *args
+            delay (int, optional): Tours avant le premier appel (par défaut : period)
+
+        Returns:
+            Timer: L'événement planifié
+        """
+        period = max(1, period)
+        first = period if delay is None else max(1, delay)
+        timer = Timer(self.current + first, callback, args, period)
+        self._insert(timer)
+        self.count += 1
+        return timer
+
+    def cancel(self, timer):
+        """Annule un événement (il est retiré de sa case lors du passage de la roue)"""
+        if timer is not None and not timer.cancelled:
+            timer.cancelled = True
+            self.count -= 1
+
+    def advance(self):
+        """
+        Passe au tour suivant et exécute les événements arrivés à échéance
+
+        Returns:
+            int: Nombre d'événements exécutés
+        """
+        self.current += 1
+        current = self.current
+
+        # Redistribuer les niveaux supérieurs quand un niveau fait un tour complet
+        level = 1
+        while level < LEVELS and current & ((1 << (SLOT_BITS * level)) - 1) == 0:
+            self._cascade(level, (current >> (SLOT_BITS * level)) & SLOT_MASK)
+            level += 1
+
+        slots = self.levels[0]
+        index = current & SLOT_MASK
+        due = slots[index]
+        if not due:
+            return 0
+        slots[index] = []
+
+        fired = 0
+        for timer in due:
+            if timer.cancelled:
+                continue
+            timer.callback(*timer.args)
+            fired += 1
+            if timer.cancelled:
+                continue
+            if timer.period:
+                timer.due = current + timer.period
+                self._insert(timer)
+            else:
+                timer.cancelled = True
+                self.count -= 1
+        return fired
+
+    def _insert(self, timer):
+        """Range un événement dans la case correspondant à son échéance"""
+        delta = timer.due - self.current
+        level = 0
+        while level < LEVELS - 1 and delta >= 1 << (SLOT_BITS * (level + 1)):
+            level += 1
+        index = (timer.due >> (SLOT_BITS * level)) & SLOT_MASK
+        slots = self.levels[level]
+        if slots is None:
+            slots = self.levels[level] = [[] for _ in range(SLOTS)]
+        slots[index].append(timer)
+
+    def _cascade(self, level, index):
+        """Redescend les événements d'une case d'un niveau supérieur"""
+        slots = self.levels[level]
+        if slots is None:
+            return
+        timers = slots[index]
+        if not timers:
+            return
+        slots[index] = []
+        for timer in timers:
+            if not timer.cancelled:
+                self._insert(timer)
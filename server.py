@@ -0,0 +1,216 @@
+"""
+server.py - Serveur TCP multi-sessions pour "L'Héritage des Cendres"
+Héberge de nombreuses parties dans une seule boucle asyncio : chaque connexion
+possède son propre Game (et donc son Player et son QuestManager).
+"""
+
+import argparse
+import asyncio
+import logging
+
+from game import Game
+from shard import ShardPool
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 4000
+
+# Taille maximale d'une ligne de commande envoyée par un client
+MAX_LINE_LENGTH = 1024
+
+# File d'attente des connexions entrantes (plusieurs centaines de joueurs)
+BACKLOG = 1024
+
+# Message envoyé au client quand sa partie échoue (erreur du jeu ou d'un worker)
+ERROR_MESSAGE = "\nUne erreur interne a interrompu votre partie. Veuillez vous reconnecter.\n"
+
+logger = logging.getLogger(__name__)
+
+
+class GameServer:
+    """Serveur asyncio qui multiplexe plusieurs joueurs sur une seule boucle"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=0, seed=None):
+        """
+        Initialise le serveur
+
+        Args:
+            host (str): Adresse d'écoute (boucle locale par défaut)
+            port (int): Port d'écoute (0 = port choisi par le système)
+            workers (int): Nombre de processus workers (0 = parties dans la boucle)
+            seed (int, optional): Graine de base : la session n reçoit seed + n,
+                ce qui rend chaque partie reproductible (None = aléatoire)
+        """
+        self.host = host
+        self.port = port
+        self.sessions = {} # id de session -> Game
+        self.next_session_id = 1
+        self.server = None
+        self.pool = ShardPool(workers) if workers > 0 else None
+        self.seed = seed
+
+    async def start(self):
+        """Démarre l'écoute et retourne le serveur asyncio"""
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port,
+            limit=MAX_LINE_LENGTH, backlog=BACKLOG
+        )
+        # Récupérer le port réel (utile si port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        """Démarre le serveur et traite les connexions jusqu'à l'arrêt"""
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self):
+        """Arrête le serveur et attend la fermeture des connexions d'écoute"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def create_session(self, player_name):
+        """
+        Crée une nouvelle partie headless
+
+        Returns:
+            tuple: (id de session, jeu, texte d'introduction)
+        """
+        session_id = self.next_session_id
+        self.next_session_id += 1
+
+        # Pas de messages de debug pour des joueurs distants
+        game = Game(player_name=player_name, seed=self.session_seed(session_id), debug=False)
+        intro = game.setup()
+        self.sessions[session_id] = game
+        return session_id, game, intro
+
+    def session_seed(self, session_id):
+        """Graine de la partie d'une session (None si le serveur n'en a pas)"""
+        if self.seed is None:
+            return None
+        return self.seed + session_id
+
+    def close_session(self, session_id):
+        """Supprime une partie terminée ou abandonnée"""
+        if self.pool is not None:
+            return self.pool.close_session(session_id)
+        return self.sessions.pop(session_id, None)
+
+    async def open_session(self, player_name):
+        """
+        Crée une partie, localement ou sur le worker le moins chargé
+
+        Returns:
+            tuple: (id de session, texte d'introduction, terminé)
+        """
+        if self.pool is None:
+            session_id, game, intro = self.create_session(player_name)
+            return session_id, intro, game.finished
+        session_id, future = self.pool.open_session(player_name, self.seed)
+        intro, finished, cost = await asyncio.wrap_future(future)
+        return session_id, intro, finished
+
+    async def step(self, session_id, command_input):
+        """
+        Exécute une commande sur la partie d'une session
+
+        Returns:
+            tuple: (sortie, terminé)
+        """
+        if self.pool is None:
+            game = self.sessions[session_id]
+            return game.step(command_input), game.finished
+        output, finished, cost = await asyncio.wrap_future(
+            self.pool.step(session_id, command_input)
+        )
+        return output, finished
+
+    async def handle_client(self, reader, writer):
+        """Gère une connexion : une partie complète par client"""
+        session_id = None
+        try:
+            writer.write("Quel est votre nom, survivant d'Alderwood ? ".encode())
+            await writer.drain()
+
+            name = await self._read_line(reader)
+            if name is None:
+                return
+
+            prompt = f"\n[{name or 'Survivant'}] > "
+            session_id, intro, finished = await self.open_session(name)
+            await self._send(writer, intro, None if finished else prompt)
+
+            while not finished:
+                command_input = await self._read_line(reader)
+                if command_input is None:
+                    break
+                output, finished = await self.step(session_id, command_input)
+                await self._send(writer, output, None if finished else prompt)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            # Erreur du jeu ou d'un worker : la partie s'arrête, le serveur continue
+            logger.exception("Erreur dans la session %s", session_id)
+            try:
+                await self._send(writer, ERROR_MESSAGE)
+            except ConnectionError:
+                pass
+        finally:
+            if session_id is not None:
+                try:
+                    self.close_session(session_id)
+                except Exception:
+                    logger.exception("Impossible de fermer la session %s", session_id)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_line(self, reader):
+        """Lit une ligne du client, ou None si la connexion est fermée"""
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # Ligne trop longue : on l'ignore plutôt que de couper la session
+            return ""
+        if not line:
+            return None
+        return line.decode(errors="replace").strip()
+
+    async def _send(self, writer, text, prompt=None):
+        """Envoie la sortie d'une commande suivie de l'invite"""
+        if prompt:
+            text += prompt
+        writer.write(text.encode())
+        await writer.drain()
+
+
+def main():
+    """Point d'entrée du serveur"""
+    parser = argparse.ArgumentParser(description="Serveur multi-joueurs Ashes of Alderwood")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Adresse d'écoute")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port d'écoute")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Nombre de processus workers (0 = tout dans la boucle asyncio)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Graine de base des parties (rejouables à l'identique)")
+    args = parser.parse_args()
+
+    server = GameServer(args.host, args.port, args.workers, args.seed)
+    print(f"Serveur en écoute sur {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nArrêt du serveur.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+shard.py - Répartition des parties sur plusieurs processus pour "L'Héritage des Cendres"
+Chaque worker est un processus qui héberge ses propres parties ; une partie reste
+toujours sur le même worker (routage collant par id de session) et les nouvelles
+parties sont envoyées au worker le moins chargé.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from game import Game
+
+
+# Coût initial estimé d'une commande (secondes CPU) avant toute mesure
+DEFAULT_STEP_COST = 0.0005
+# Poids des nouvelles mesures dans la moyenne mobile du coût
+COST_SMOOTHING = 0.2
+
+
+# ============================================================================
+# CÔTÉ WORKER (exécuté dans les processus enfants)
+# ============================================================================
+
+# Parties hébergées par le processus courant : id de session -> Game
+_sessions = {}
+
+
+def _worker_open(session_id, player_name, seed=None):
+    """Crée une partie dans ce worker et retourne (intro, terminé, coût CPU)"""
+    start = time.process_time()
+    game = Game(player_name=player_name, seed=seed, debug=False)
+    intro = game.setup()
+    _sessions[session_id] = game
+    return intro, game.finished, time.process_time() - start
+
+
+def _worker_step(session_id, command_input):
+    """Exécute une commande et retourne (sortie, terminé, coût CPU)"""
+    start = time.process_time()
+    game = _sessions.get(session_id)
+    if game is None:
+        return "\nSession inconnue.\n", True, 0.0
+    output = game.step(command_input)
+    if game.finished:
+        del _sessions[session_id]
+    return output, game.finished, time.process_time() - start
+
+
+def _worker_close(session_id):
+    """Supprime une partie du worker"""
+    return _sessions.pop(session_id, None) is not None
+
+
+# ============================================================================
+# CÔTÉ PARENT
+# ============================================================================
+
+class WorkerShard:
+    """Un processus worker et ses indicateurs de charge"""
+
+    def __init__(self, index):
+        self.index = index
+        # Un exécuteur à un seul processus : toutes les parties d'un worker
+        # restent dans le même interpréteur
+        self.executor = ProcessPoolExecutor(max_workers=1)
+        self.sessions = 0 # Parties hébergées
+        self.pending = 0 # Requêtes en cours de traitement
+        self.step_cost = DEFAULT_STEP_COST # Moyenne mobile du coût CPU d'une commande
+        self.broken = False # Processus mort : le worker n'accepte plus de requêtes
+
+    def load(self):
+        """Charge estimée : temps CPU attendu pour un tour de toutes ses parties"""
+        return (self.sessions + self.pending) * self.step_cost
+
+    def record_cost(self, cost):
+        """Met à jour la moyenne mobile du coût d'une commande"""
+        self.step_cost += COST_SMOOTHING * (cost - self.step_cost)
+
+
+class ShardPool:
+    """Pool de workers avec routage collant des sessions"""
+
+    def __init__(self, workers=None):
+        """
+        Initialise le pool
+
+        Args:
+            workers (int, optional): Nombre de processus (par défaut : nombre de cœurs)
+        """
+        workers = workers or os.cpu_count() or 1
+        self.shards = [WorkerShard(i) for i in range(workers)]
+        self.routes = {} # id de session -> WorkerShard
+        self.next_session_id = 1
+        self.lock = threading.Lock() # Les callbacks des futures arrivent d'un autre thread
+
+    def least_loaded(self):
+        """
+        Retourne le worker le moins chargé
+
+        Un worker dont le processus est mort est d'abord remplacé par un
+        nouveau (ses parties sont perdues, leurs sessions échoueront).
+        """
+        for index, shard in enumerate(self.shards):
+            if shard.broken:
+                shard.executor.shutdown(wait=False)
+                self.shards[index] = WorkerShard(shard.index)
+        return min(self.shards, key=lambda shard: (shard.load(), shard.sessions))
+
+    def open_session(self, player_name, seed=None):
+        """
+        Crée une partie sur le worker le moins chargé
+        
+        Args:
+            player_name (str): Nom du joueur
+            seed (int, optional): Graine de base (la partie reçoit seed + id de session)
+        
+        Returns:
+            tuple: (id de session, Future résolue en (intro, terminé, coût CPU))
+        """
+        with self.lock:
+            session_id = self.next_session_id
+            self.next_session_id += 1
+            shard = self.least_loaded()
+            self.routes[session_id] = shard
+            shard.sessions += 1
+        if seed is not None:
+            seed += session_id
+        try:
+            future = self._submit(shard, session_id, _worker_open, session_id, player_name, seed)
+        except Exception:
+            # La partie n'a pas été créée : aucune session à fermer plus tard
+            with self.lock:
+                if self.routes.pop(session_id, None) is not None:
+                    shard.sessions -= 1
+            raise
+        return session_id, future
+
+    def step(self, session_id, command_input):
+        """
+        Envoie une commande au worker qui héberge la partie
+
+        Returns:
+            Future: Résolue en (sortie, terminé, coût CPU)
+        """
+        with self.lock:
+            shard = self.routes[session_id]
+        return self._submit(shard, session_id, _worker_step, session_id, command_input)
+
+    def close_session(self, session_id):
+        """Ferme une partie et libère sa place sur son worker"""
+        with self.lock:
+            shard = self.routes.pop(session_id, None)
+            if shard is None:
+                return None
+            shard.sessions -= 1
+        return shard.executor.submit(_worker_close, session_id)
+
+    def get_loads(self):
+        """Retourne la charge de chaque worker (pour la supervision)"""
+        with self.lock:
+            return [
+                {
+                    "worker": shard.index,
+                    "sessions": shard.sessions,
+                    "pending": shard.pending,
+                    "step_cost": shard.step_cost,
+                    "load": shard.load()
+                }
+                for shard in self.shards
+            ]
+
+    def shutdown(self, wait=True):
+        """Arrête tous les workers"""
+        for shard in self.shards:
+            shard.executor.shutdown(wait=wait)
+
+    def _submit(self, shard, session_id, func, *args):
+        """Soumet une requête à un worker en suivant sa charge"""
+        with self.lock:
+            shard.pending += 1
+        try:
+            future = shard.executor.submit(func, *args)
+        except Exception as e:
+            with self.lock:
+                shard.pending -= 1
+                if isinstance(e, BrokenProcessPool):
+                    shard.broken = True
+            raise
+        future.add_done_callback(lambda f: self._on_done(shard, session_id, f))
+        return future
+
+    def _on_done(self, shard, session_id, future):
+        """Met à jour la charge quand un worker a répondu"""
+        with self.lock:
+            shard.pending -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                if isinstance(future.exception(), BrokenProcessPool):
+                    shard.broken = True
+                return
+            output, finished, cost = future.result()
+            shard.record_cost(cost)
+            # Une partie terminée a déjà été supprimée par le worker
+            if finished and self.routes.pop(session_id, None) is not None:
+                shard.sessions -= 1
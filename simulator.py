@@ -0,0 +1,507 @@
+"""
+simulator.py - Simulateur de combats Monte-Carlo pour l'équilibrage de "L'Héritage des Cendres"
+Reprend les règles de combat de player.py et enemy.py (dégâts, critiques,
+esquive, résistances, phases des boss, régénération des trolls) et simule des
+centaines de milliers de combats à la fois sous forme d'opérations NumPy.
+Les effets des attaques spéciales des boss (poison, brûlure, étourdissement,
+drain, soin) sont appliqués dans l'ordre de combat.resolve.
+
+NumPy est nécessaire pour ce module uniquement ; le jeu lui-même n'en dépend pas.
+
+Usage :
+    python simulator.py --fights 1000000 --seed 1
+    python simulator.py --path ARC --weapon arc_cendres --enemy MORGRATH
+"""
+
+import argparse
+import math
+
+try:
+    import numpy as np
+except ImportError: # NumPy est optionnel : seul le simulateur en a besoin
+    np = None
+
+from player import Player, BURN_DAMAGE_TYPE
+from item import ItemCatalog, Weapon, Armor
+from enemy import EnemyCatalog, Orc, Troll, Boss, Morgrath, DAMAGE_TYPE_INDEX, SPECIAL_POISON, SPECIAL_BURN, SPECIAL_HEAL
+
+
+# Voies jouables
+PATHS = ("ARC", "EPEE", "MAGIE")
+
+# Ennemis évalués par défaut : (clé du catalogue, variante)
+BALANCE_ENEMIES = (
+    ("GOBELIN", "normal"), ("GOBELIN", "archer"), ("GOBELIN", "brute"),
+    ("ORC", "soldat"), ("ORC", "berserker"), ("ORC", "chef"),
+    ("TROLL", "caverne"), ("TROLL", "des_forets"), ("TROLL", "des_montagnes"),
+    ("CHEF_GOBELIN", "normal"), ("CHEF_TROLL", "normal"), ("MORGRATH", "normal")
+)
+
+# Nombre maximum de rounds simulés (au-delà, le combat est compté comme non conclu)
+MAX_ROUNDS = 1000
+# Nombre de combats simulés par bloc de tableaux (borne la mémoire utilisée)
+CHUNK_SIZE = 250000
+
+# Recharge des attaques spéciales (voir Boss.calculate_damage et Morgrath.calculate_damage)
+BOSS_SPECIAL_COOLDOWN = 3
+MORGRATH_SPECIAL_COOLDOWN = 2
+# Attaque sans effet spécial (ennemis sans attaques spéciales, voir _enemy_attack)
+NO_SPECIAL = -1
+
+
+def require_numpy():
+    """Vérifie que NumPy est disponible"""
+    if np is None:
+        raise ImportError("Le simulateur de combats nécessite NumPy (pip install numpy).")
+
+
+def percent_chance(chance):
+    """
+    Probabilité qu'un jet 1-100 soit inférieur ou égal à `chance`
+    (règle des tests `roll(100) <= chance` du jeu)
+    """
+    return max(0, min(100, math.floor(chance))) / 100
+
+
+def get_weapons():
+    """Retourne les armes du catalogue d'objets : id -> Weapon"""
+    return {
+        item_id: item for item_id, item in ItemCatalog.get_prototypes().items()
+        if isinstance(item, Weapon)
+    }
+
+
+# ============================================================================
+# MODÈLES DE COMBAT
+# ============================================================================
+
+class PlayerModel:
+    """Paramètres de combat d'un joueur (voie, arme, armure) figés pour la simulation"""
+
+    def __init__(self, path, weapon=None, armor=None):
+        """
+        Args:
+            path (str): Voie choisie ("ARC", "EPEE", "MAGIE")
+            weapon (Weapon, optional): Arme équipée
+            armor (Armor, optional): Armure équipée
+        """
+        player = Player("Simulation")
+        player.choose_path(path)
+        for item in (weapon, armor):
+            if item is not None:
+                player.add_item(item.item_id or item.name, item)
+        if weapon is not None:
+            player.equip_weapon(weapon.item_id or weapon.name)
+        if armor is not None:
+            player.equip_armor(armor.item_id or armor.name)
+        combat_stats = player.get_combat_stats()
+
+        self.path = path
+        self.health = player.max_health
+
+        # Player.roll_attack : dégâts de base de la voie et bonus aléatoire éventuel
+        self.damage = combat_stats.damage
+        self.damage_type = combat_stats.damage_type
+        self.proc_damage = combat_stats.damage
+        self.proc_burn = 0 # Part de brûlure (dégâts de feu) dans proc_damage
+        self.proc_chance = 0 # Chance du bonus (critique ARC, brûlure MAGIE)
+        if path == "ARC":
+            self.proc_damage = combat_stats.critical_damage
+            self.proc_chance = percent_chance(combat_stats.critical_threshold)
+        elif path == "MAGIE":
+            self.proc_damage = combat_stats.damage + combat_stats.burn_damage
+            self.proc_burn = combat_stats.burn_damage
+            self.proc_chance = percent_chance(combat_stats.burn_threshold)
+
+        # Player.defend : esquive et réduction d'armure
+        self.dodge_chance = percent_chance(combat_stats.dodge_chance)
+        self.defense = combat_stats.armor_reduction
+
+    def hits(self, enemy):
+        """
+        PV retirés à l'ennemi par une attaque (règle de Player.deal_damage)
+
+        Returns:
+            tuple: (attaque normale, attaque avec bonus)
+        """
+        hit = enemy.damage_taken(self.damage, self.damage_type)
+        proc_hit = enemy.damage_taken(self.proc_damage - self.proc_burn, self.damage_type)
+        if self.proc_burn:
+            proc_hit += enemy.damage_taken(self.proc_burn, BURN_DAMAGE_TYPE)
+        return hit, proc_hit
+
+
+class EnemyModel:
+    """Paramètres de combat d'un ennemi du catalogue"""
+
+    def __init__(self, enemy_type, variant="normal"):
+        """
+        Args:
+            enemy_type (str): Clé de EnemyCatalog ("GOBELIN", "ORC", "TROLL", ...)
+            variant (str): Variante de l'ennemi
+        """
+        enemy = EnemyCatalog.create_enemy(enemy_type, variant)
+        if enemy is None:
+            raise ValueError(f"Ennemi inconnu: {enemy_type}")
+
+        self.enemy_type = enemy_type
+        self.variant = variant
+        self.name = enemy.name
+        self.health = enemy.max_health
+        self.base_damage = enemy.base_damage
+        self.multipliers = enemy.damage_multipliers
+
+        # Modèle d'attaque, par ordre de spécialisation
+        if isinstance(enemy, Morgrath):
+            self.kind = "MORGRATH"
+        elif isinstance(enemy, Boss):
+            self.kind = "BOSS"
+        elif isinstance(enemy, Troll):
+            self.kind = "TROLL"
+        elif isinstance(enemy, Orc):
+            self.kind = "ORC"
+        else:
+            self.kind = "GOBELIN"
+        self.berserker = "berserker" in enemy.name.lower()
+        self.regeneration = enemy.regeneration if isinstance(enemy, Troll) else 0
+
+        # Boss : phases et attaques spéciales
+        self.phase_health = getattr(enemy, "phase_health", 0)
+        self.phase_triggers = tuple(getattr(enemy, "phase_triggers", ()))
+        self.special_damages = tuple(special["damage"] for special in getattr(enemy, "special_attacks", ()))
+        self.special_effects = tuple(special.get("effect") for special in getattr(enemy, "special_attacks", ()))
+        # Probabilité de chaque attaque spéciale (table d'alias du boss)
+        specials = getattr(enemy, "table", None) and enemy.table.specials
+        self.special_weights = tuple(specials.probabilities()) if specials else ()
+        self.special_cooldown = MORGRATH_SPECIAL_COOLDOWN if self.kind == "MORGRATH" else BOSS_SPECIAL_COOLDOWN
+
+    def damage_taken(self, damage, damage_type="PHYSICAL"):
+        """Dégâts réellement subis (règle de Enemy.take_damage)"""
+        return max(1, int(damage * self.multipliers[DAMAGE_TYPE_INDEX[damage_type]]))
+
+
+# ============================================================================
+# RÉSULTATS
+# ============================================================================
+
+class SimulationResult:
+    """Statistiques d'une série de combats identiques"""
+
+    def __init__(self, path, weapon_id, enemy_type, variant, max_health):
+        self.path = path
+        self.weapon_id = weapon_id
+        self.enemy_type = enemy_type
+        self.variant = variant
+        self.fights = 0
+        self.wins = 0
+        self.unfinished = 0 # Combats arrêtés à MAX_ROUNDS
+        # PV restants du joueur après une victoire (index = PV)
+        self.hp_histogram = np.zeros(max_health + 1, dtype=np.int64)
+        # Nombre de rounds pour vaincre l'ennemi (index = rounds)
+        self.kill_rounds_histogram = np.zeros(MAX_ROUNDS + 1, dtype=np.int64)
+
+    @property
+    def win_rate(self):
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def mean_rounds_to_kill(self):
+        if not self.wins:
+            return float("nan")
+        rounds = np.arange(self.kill_rounds_histogram.size)
+        return float((rounds * self.kill_rounds_histogram).sum() / self.wins)
+
+    @property
+    def mean_hp_remaining(self):
+        if not self.wins:
+            return 0.0
+        hp = np.arange(self.hp_histogram.size)
+        return float((hp * self.hp_histogram).sum() / self.wins)
+
+    def merge(self, wins, unfinished, hp_remaining, kill_rounds):
+        """Ajoute les résultats d'un bloc de combats"""
+        self.fights += int(hp_remaining.size)
+        self.wins += int(wins.sum())
+        self.unfinished += int(unfinished)
+        self.hp_histogram += np.bincount(hp_remaining[wins], minlength=self.hp_histogram.size)
+        self.kill_rounds_histogram += np.bincount(kill_rounds[wins], minlength=self.kill_rounds_histogram.size)
+
+    def summary(self):
+        """Retourne une ligne de résumé"""
+        weapon = self.weapon_id or "aucune"
+        enemy = f"{self.enemy_type}:{self.variant}"
+        return (f"{self.path:<6} {weapon:<22} {enemy:<22} "
+                f"victoire {self.win_rate * 100:6.2f}%  "
+                f"rounds {self.mean_rounds_to_kill:6.2f}  "
+                f"PV restants {self.mean_hp_remaining:6.2f}")
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def _between(rng, low, high, size):
+    """Tirages entiers uniformes entre low et high inclus (tableaux acceptés)"""
+    return low + (rng.random(size) * (high - low + 1)).astype(np.int64)
+
+
+def _enemy_attack(enemy, rng, round_number, health, phase, base_damage, special_ready):
+    """
+    Dégâts bruts de l'attaque de l'ennemi pour chaque combat actif
+    (règles des méthodes calculate_damage de enemy.py)
+
+    Returns:
+        tuple: (dégâts bruts, indice de l'attaque spéciale dans
+        enemy.special_effects, NO_SPECIAL pour une attaque normale)
+    """
+    size = health.size
+
+    if enemy.kind == "GOBELIN":
+        damage = _between(rng, enemy.base_damage - 2, enemy.base_damage + 3, size)
+        weak = rng.random(size) < 0.2
+        strong = ~weak & (rng.random(size) < 0.1)
+        damage = np.where(weak, np.maximum(1, damage - 3), damage)
+        damage = np.where(strong, damage + 4, damage)
+        return np.maximum(1, damage), NO_SPECIAL
+
+    if enemy.kind == "ORC":
+        damage = _between(rng, enemy.base_damage - 1, enemy.base_damage + 2, size)
+        if enemy.berserker:
+            rage = rng.random(size) < 0.25
+            damage = np.where(rage, (damage * 1.5).astype(np.int64), damage)
+        return np.maximum(1, damage), NO_SPECIAL
+
+    if enemy.kind == "TROLL":
+        miss = rng.random(size) < 0.3
+        damage = _between(rng, enemy.base_damage, enemy.base_damage + 5, size)
+        crush = rng.random(size) < 0.15
+        damage = np.where(crush, (damage * 1.8).astype(np.int64), damage)
+        return np.where(miss, 0, np.maximum(1, damage)), NO_SPECIAL
+
+    if enemy.kind == "BOSS":
+        # Passage en phase 2 (enragé) sous le seuil de PV
+        phase[(phase == 1) & (health <= enemy.phase_health)] = 2
+        special_chance = np.full(size, 0.3)
+    else:
+        # Morgrath : chaque seuil franchi augmente la phase et les dégâts de base
+        for i, trigger in enumerate(enemy.phase_triggers):
+            crossed = (health <= trigger) & (phase < i + 2)
+            phase[crossed] = i + 2
+            base_damage[crossed] += 8
+        special_chance = 0.3 + phase * 0.1
+
+    if enemy.special_damages:
+        special = (special_ready <= round_number) & (rng.random(size) < special_chance)
+        special_ready[special] = round_number + enemy.special_cooldown + 1
+        specials = np.array(enemy.special_damages, dtype=np.int64)
+        picks = np.searchsorted(np.cumsum(enemy.special_weights), rng.random(size), side="right")
+        picks = np.minimum(picks, specials.size - 1)
+        special_damage = specials[picks]
+    else:
+        special = np.zeros(size, dtype=bool)
+        special_damage = picks = 0
+
+    if enemy.kind == "BOSS":
+        damage = _between(rng, base_damage - 2, base_damage + 4, size)
+        damage = np.where(phase == 2, (damage * 1.5).astype(np.int64), damage)
+    else:
+        damage = _between(rng, base_damage - 3, base_damage + 8, size)
+        damage = (damage * (1 + (phase - 1) * 0.25)).astype(np.int64)
+    damage = np.maximum(1, damage)
+    return np.where(special, special_damage, damage), np.where(special, picks, NO_SPECIAL)
+
+
+def _simulate_chunk(player, enemy, rng, size, max_rounds):
+    """
+    Simule `size` combats en parallèle
+
+    Returns:
+        tuple: (victoires, nombre de combats non conclus, PV restants, rounds)
+    """
+    wins = np.zeros(size, dtype=bool)
+    hp_remaining = np.zeros(size, dtype=np.int64)
+    rounds = np.zeros(size, dtype=np.int64)
+
+    # État des combats encore en cours (compressé à chaque round)
+    active = np.arange(size)
+    player_health = np.full(size, player.health, dtype=np.int64)
+    enemy_health = np.full(size, enemy.health, dtype=np.int64)
+    phase = np.ones(size, dtype=np.int64)
+    base_damage = np.full(size, enemy.base_damage, dtype=np.int64)
+    special_ready = np.zeros(size, dtype=np.int64)
+    # Effets des attaques spéciales sur le joueur : rounds restants, étourdissement
+    poison = np.zeros(size, dtype=np.int64)
+    burn = np.zeros(size, dtype=np.int64)
+    stunned = np.zeros(size, dtype=bool)
+
+    hit, proc_hit = player.hits(enemy)
+
+    for round_number in range(1, max_rounds + 1):
+        if active.size == 0:
+            break
+        count = active.size
+
+        # Régénération des trolls en début de round
+        if enemy.regeneration:
+            wounded = (enemy_health > 0) & (enemy_health < enemy.health)
+            enemy_health[wounded] = np.minimum(enemy.health, enemy_health[wounded] + enemy.regeneration)
+
+        # Poison et brûlure en début de round ; étourdi, le joueur perd son attaque
+        player_health -= np.where(poison > 0, SPECIAL_POISON[0], 0) + np.where(burn > 0, SPECIAL_BURN[0], 0)
+        np.maximum(poison - 1, 0, out=poison)
+        np.maximum(burn - 1, 0, out=burn)
+        skipped = stunned | (player_health <= 0)
+        stunned[:] = False
+
+        # Tour du joueur
+        if player.proc_chance:
+            dealt = np.where(rng.random(count) < player.proc_chance, proc_hit, hit)
+        else:
+            dealt = np.full(count, hit, dtype=np.int64)
+        enemy_health -= np.where(skipped, 0, dealt)
+        killed = enemy_health <= 0
+
+        # Tour de l'ennemi (seulement pour les combats où les deux camps sont encore en vie)
+        damage, special = _enemy_attack(enemy, rng, round_number, enemy_health, phase, base_damage, special_ready)
+        damage = np.maximum(1, damage - player.defense)
+        damage[rng.random(count) < player.dodge_chance] = 0
+        attacked = ~killed & (player_health > 0)
+        player_health -= np.where(attacked, damage, 0)
+        taken = attacked & (damage > 0)
+        for index, effect in enumerate(enemy.special_effects):
+            used = special == index
+            if effect == "POISON":
+                poison[used & taken] = SPECIAL_POISON[1]
+            elif effect == "BURN":
+                burn[used & taken] = SPECIAL_BURN[1]
+            elif effect == "STUN":
+                stunned[used & taken] = True
+            elif effect == "DRAIN":
+                drained = used & taken
+                enemy_health[drained] = np.minimum(enemy.health, enemy_health[drained] + damage[drained])
+            elif effect == "HEAL_50":
+                # Soin même si l'attaque est esquivée
+                healed = used & attacked
+                enemy_health[healed] = np.minimum(enemy.health, enemy_health[healed] + SPECIAL_HEAL)
+        dead = ~killed & (player_health <= 0)
+
+        done = killed | dead
+        if done.any():
+            finished = active[done]
+            wins[finished] = killed[done]
+            hp_remaining[finished] = np.maximum(0, player_health[done])
+            rounds[finished] = round_number
+
+            keep = ~done
+            active = active[keep]
+            player_health = player_health[keep]
+            enemy_health = enemy_health[keep]
+            phase = phase[keep]
+            base_damage = base_damage[keep]
+            special_ready = special_ready[keep]
+            poison = poison[keep]
+            burn = burn[keep]
+            stunned = stunned[keep]
+
+    return wins, active.size, hp_remaining, rounds
+
+
+def simulate(path, enemy_type, variant="normal", weapon_id=None, fights=100000,
+             seed=None, armor_id=None, max_rounds=MAX_ROUNDS, chunk_size=CHUNK_SIZE):
+    """
+    Simule une série de combats identiques
+
+    Args:
+        path (str): Voie du joueur ("ARC", "EPEE", "MAGIE")
+        enemy_type (str): Clé de EnemyCatalog
+        variant (str): Variante de l'ennemi
+        weapon_id (str, optional): Arme du catalogue d'objets (None = à mains nues)
+        fights (int): Nombre de combats
+        seed (int | numpy.random.SeedSequence, optional): Graine (reproductible)
+        armor_id (str, optional): Armure du catalogue d'objets
+        max_rounds (int): Rounds maximum par combat
+        chunk_size (int): Combats simulés par bloc
+
+    Returns:
+        SimulationResult: Statistiques de la série
+    """
+    require_numpy()
+    items = ItemCatalog.get_prototypes()
+    weapon = items[weapon_id] if weapon_id else None
+    armor = items[armor_id] if armor_id else None
+    if weapon is not None and not isinstance(weapon, Weapon):
+        raise ValueError(f"'{weapon_id}' n'est pas une arme.")
+    if armor is not None and not isinstance(armor, Armor):
+        raise ValueError(f"'{armor_id}' n'est pas une armure.")
+
+    player = PlayerModel(path, weapon, armor)
+    enemy = EnemyModel(enemy_type, variant)
+    rng = np.random.default_rng(seed)
+
+    result = SimulationResult(path, weapon_id, enemy_type, variant, player.health)
+    remaining = fights
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        result.merge(*_simulate_chunk(player, enemy, rng, size, max_rounds))
+        remaining -= size
+    return result
+
+
+def run_balance(fights=1000000, seed=None, paths=PATHS, weapon_ids=None, enemies=BALANCE_ENEMIES):
+    """
+    Simule toutes les combinaisons voie x arme x ennemi
+
+    Args:
+        fights (int): Combats par combinaison
+        seed (int, optional): Graine de base (chaque combinaison a son propre flux)
+        paths (iterable): Voies à évaluer
+        weapon_ids (iterable, optional): Armes à évaluer (par défaut : toutes, plus aucune arme)
+        enemies (iterable): Couples (clé du catalogue, variante)
+
+    Returns:
+        list[SimulationResult]: Un résultat par combinaison
+    """
+    require_numpy()
+    if weapon_ids is None:
+        weapon_ids = [None] + list(get_weapons())
+    combinations = [
+        (path, weapon_id, enemy_type, variant)
+        for path in paths
+        for weapon_id in weapon_ids
+        for enemy_type, variant in enemies
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(combinations))
+    return [
+        simulate(path, enemy_type, variant, weapon_id, fights, combination_seed)
+        for (path, weapon_id, enemy_type, variant), combination_seed in zip(combinations, seeds)
+    ]
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Simulateur de combats Ashes of Alderwood")
+    parser.add_argument("--fights", type=int, default=100000, help="Combats par combinaison")
+    parser.add_argument("--seed", type=int, default=None, help="Graine (résultats reproductibles)")
+    parser.add_argument("--path", choices=PATHS, help="Limiter à une voie")
+    parser.add_argument("--weapon", help="Limiter à une arme du catalogue ('aucune' = sans arme)")
+    parser.add_argument("--enemy", help="Limiter à un ennemi, ex: TROLL ou TROLL:des_forets")
+    args = parser.parse_args()
+
+    paths = (args.path,) if args.path else PATHS
+    weapon_ids = None
+    if args.weapon:
+        weapon_ids = [None if args.weapon == "aucune" else args.weapon]
+    enemies = BALANCE_ENEMIES
+    if args.enemy:
+        enemy_type, _, variant = args.enemy.partition(":")
+        enemies = [entry for entry in BALANCE_ENEMIES
+                   if entry[0] == enemy_type and (not variant or entry[1] == variant)]
+        if not enemies:
+            enemies = [(enemy_type, variant or "normal")]
+
+    for result in run_balance(args.fights, args.seed, paths, weapon_ids, enemies):
+        print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+snapshot.py - Sauvegarde binaire compacte de l'état d'une partie pour "L'Héritage des Cendres"
+L'état est réduit à des tuples de valeurs simples (pièces, objets, ennemis et PNJ
+référencés par leur identifiant stable) puis sérialisé avec marshal. Seules les
+pièces modifiées par la session (delta du World) sont sauvegardées.
+"""
+
+import marshal
+
+from character import get_character
+from enemy import EnemyCatalog
+from horde import Horde
+from inventory import Inventory
+from modifiers import ModifierStack
+from player import Player
+from quest import QuestManager
+from rng import GameRandom
+from world import World, get_world_template
+
+
+# En-tête des fichiers de sauvegarde
+MAGIC = b"AOA\x01"
+# Version du format des tuples (à incrémenter si leur structure change)
+FORMAT_VERSION = 1
+# Version du format marshal (fixée pour rester lisible d'une version à l'autre)
+MARSHAL_VERSION = 4
+
+# Ordre des statistiques du joueur dans la sauvegarde
+STAT_KEYS = ("FOR", "DEX", "INT", "CON", "SAG", "CHA")
+
+# Attributs d'état des ennemis (None si absent, ex: phase pour un ennemi normal)
+ENEMY_FIELDS = (
+    "health", "max_health", "base_damage",
+    "is_stunned", "is_poisoned", "poison_damage", "poison_duration",
+    "is_burning", "burn_damage", "burn_duration",
+    "phase", "special_cooldown", "enraged"
+)
+
+
+class SnapshotError(Exception):
+    """Erreur levée quand une sauvegarde est invalide ou incompatible"""
+    pass
+
+
+# ============================================================================
+# SAUVEGARDE
+# ============================================================================
+
+def dumps(game):
+    """
+    Sérialise l'état complet d'une partie
+
+    Args:
+        game (Game): La partie à sauvegarder
+
+    Returns:
+        bytes: La sauvegarde binaire
+    """
+    state = (
+        FORMAT_VERSION,
+        (game.turn_count, game.current_act, game.finished, game.rng.getstate()),
+        _dump_player(game.player),
+        tuple(_dump_room(room) for room in game.rooms.delta.values()),
+        _dump_quests(game.quest_manager)
+    )
+    return MAGIC + marshal.dumps(state, MARSHAL_VERSION)
+
+
+def _dump_item(item):
+    """Un objet est soit une simple description, soit (id catalogue, utilisé, exemplaires)"""
+    if isinstance(item, str):
+        return item
+    item_id = getattr(item, "item_id", None)
+    if item_id is None:
+        return str(item)
+    return (item_id, getattr(item, "used", False), item.count)
+
+
+def _dump_inventory(inventory):
+    return tuple((name, _dump_item(item)) for name, item in inventory.items())
+
+
+def _dump_enemy(name, enemy):
+    # Une horde est sauvegardée avec les variantes de ses membres et ses colonnes
+    if isinstance(enemy, Horde):
+        return (name, enemy.catalog_key, enemy.variants, (enemy.name, enemy.dump_state()))
+    return (name, enemy.catalog_key, enemy.variant,
+            tuple(getattr(enemy, field, None) for field in ENEMY_FIELDS))
+
+
+def _dump_room(room):
+    return (
+        room.room_id,
+        _dump_inventory(room.inventory),
+        tuple(_dump_enemy(name, enemy) for name, enemy in room.enemies.items()),
+        tuple((name, character.character_id, character.dialogue_index, character.has_met)
+              for name, character in room.characters.items())
+    )
+
+
+def _inventory_key(inventory, item):
+    """Retrouve la clé d'inventaire d'un objet équipé"""
+    if item is None:
+        return None
+    for name, candidate in inventory.items():
+        if candidate is item:
+            return name
+    return None
+
+
+def _dump_player(player):
+    return (
+        player.name,
+        player.current_room.room_id if player.current_room else None,
+        tuple(room.room_id for room in player.history),
+        tuple(player.stats[key] for key in STAT_KEYS),
+        player.health,
+        player.max_health,
+        player.gold,
+        _dump_inventory(player.inventory),
+        _inventory_key(player.inventory, player.equipped_weapon),
+        _inventory_key(player.inventory, player.equipped_armor),
+        player.chosen_path,
+        getattr(player, "morgrath_encounters", 0),
+        getattr(player, "hidden_power_active", False),
+        getattr(player, "hidden_power_multiplier", 1),
+        player.modifiers.dump_state()
+    )
+
+
+def _dump_quests(quest_manager):
+    if quest_manager is None:
+        return ((), (), ())
+    return (
+        tuple((quest.quest_id, tuple(quest.completed_objectives), quest.is_active, quest.is_completed)
+              for quest in quest_manager.all_quests.values()),
+        tuple(quest.quest_id for quest in quest_manager.active_quests),
+        tuple(quest.quest_id for quest in quest_manager.completed_quests)
+    )
+
+
+# ============================================================================
+# CHARGEMENT
+# ============================================================================
+
+def loads(game, data):
+    """
+    Restaure l'état d'une partie depuis une sauvegarde
+
+    Le monde, le joueur et les quêtes sont reconstruits à part, puis remplacent
+    ceux du jeu seulement une fois toute la sauvegarde chargée : une sauvegarde
+    invalide laisse la partie en cours intacte.
+
+    Args:
+        game (Game): La partie à restaurer
+        data (bytes): La sauvegarde produite par dumps()
+
+    Raises:
+        SnapshotError: Si la sauvegarde est invalide (le jeu n'est pas modifié)
+    """
+    state = decode(data)
+    try:
+        version, game_state, player_state, rooms_state, quests_state = state
+        turn_count, current_act, finished = game_state[:3]
+        # État du générateur (absent des sauvegardes antérieures : la suite diffère)
+        rng_state = game_state[3] if len(game_state) > 3 else None
+    except (TypeError, ValueError) as e:
+        raise SnapshotError(f"Sauvegarde corrompue: {e}")
+
+    world = World(get_world_template(), game.rng)
+    player = Player(game.player_name or "Survivant", game.output, game.rng)
+    player.world = world
+    quest_manager = QuestManager(player, game.output)
+    quest_manager.set_locations({room_id: room.name for room_id, room in world.items()})
+
+    try:
+        for room_state in rooms_state:
+            _load_room(world, room_state)
+        _load_player(player, world, player_state)
+        _load_quests(quest_manager, quests_state)
+    except (TypeError, ValueError) as e:
+        # Tuples imbriqués trop courts ou mal formés
+        raise SnapshotError(f"Sauvegarde corrompue: {e}")
+
+    if rng_state is not None:
+        # Vérifié sur un générateur à part : game.rng n'est modifié qu'une fois tout validé
+        try:
+            GameRandom(0).setstate(rng_state)
+        except (TypeError, ValueError) as e:
+            raise SnapshotError(f"Sauvegarde corrompue: {e}")
+        game.rng.setstate(rng_state)
+
+    game.rooms = world
+    game.player = player
+    game.quest_manager = quest_manager
+    game.turn_count, game.current_act, game.finished = turn_count, current_act, finished
+
+
+def decode(data):
+    """Vérifie l'en-tête et retourne les tuples de la sauvegarde"""
+    if data[:len(MAGIC)] != MAGIC:
+        raise SnapshotError("Fichier de sauvegarde invalide.")
+    try:
+        state = marshal.loads(data[len(MAGIC):])
+    except (EOFError, ValueError, TypeError) as e:
+        raise SnapshotError(f"Sauvegarde corrompue: {e}")
+    if not isinstance(state, tuple) or not state or state[0] != FORMAT_VERSION:
+        raise SnapshotError("Version de sauvegarde incompatible.")
+    return state
+
+
+def _load_item(item_state):
+    if isinstance(item_state, str):
+        return item_state
+    from item import ItemCatalog
+
+    item_id, used = item_state[:2]
+    item = ItemCatalog.get_item(item_id)
+    if item is None:
+        raise SnapshotError(f"Objet inconnu dans la sauvegarde: {item_id}")
+    if used:
+        item.used = True
+    # Nombre d'exemplaires (absent des sauvegardes antérieures aux piles)
+    if len(item_state) > 2:
+        item.count = item_state[2]
+    return item
+
+
+def _load_inventory(inventory_state):
+    return Inventory({name: _load_item(item_state) for name, item_state in inventory_state})
+
+
+def _load_room(world, room_state):
+    room_id, inventory_state, enemies_state, characters_state = room_state
+    if room_id not in world:
+        raise SnapshotError(f"Pièce inconnue dans la sauvegarde: {room_id}")
+    room = world.edit(room_id)
+
+    room.inventory = _load_inventory(inventory_state)
+
+    room.enemies = {}
+    for name, catalog_key, variant, values in enemies_state:
+        if isinstance(variant, tuple):
+            horde_name, horde_state = values
+            try:
+                enemy = Horde.load_state(catalog_key, variant, horde_state, horde_name)
+            except ValueError:
+                raise SnapshotError(f"Horde inconnue dans la sauvegarde: {catalog_key}")
+        else:
+            enemy = EnemyCatalog.create_enemy(catalog_key, variant)
+            if enemy is None:
+                raise SnapshotError(f"Ennemi inconnu dans la sauvegarde: {catalog_key}")
+            for field, value in zip(ENEMY_FIELDS, values):
+                if value is not None:
+                    setattr(enemy, field, value)
+        if world.rng is not None:
+            enemy.rng = world.rng
+        room.enemies[name] = enemy
+
+    room.characters = {}
+    for name, character_id, dialogue_index, has_met in characters_state:
+        character = get_character(character_id)
+        if character is None:
+            raise SnapshotError(f"PNJ inconnu dans la sauvegarde: {character_id}")
+        character.dialogue_index = dialogue_index
+        character.has_met = has_met
+        character.current_room = room
+        if world.rng is not None:
+            character.rng = world.rng
+        room.characters[name] = character
+
+
+def _load_player(player, rooms, player_state):
+    (name, room_id, history, stats, health, max_health, gold, inventory_state,
+     weapon_key, armor_key, chosen_path, morgrath_encounters,
+     hidden_power_active, hidden_power_multiplier) = player_state[:14]
+    # Effets temporaires (absents des sauvegardes antérieures)
+    modifiers_state = player_state[14] if len(player_state) > 14 else (0, ())
+
+    for known_id in (room_id, *history):
+        if known_id is not None and known_id not in rooms:
+            raise SnapshotError(f"Pièce inconnue dans la sauvegarde: {known_id}")
+
+    player.name = name
+    player.current_room = rooms[room_id] if room_id is not None else None
+    player.history = [rooms[history_id] for history_id in history]
+    player.stats = dict(zip(STAT_KEYS, stats))
+    player.health = health
+    player.max_health = max_health
+    player.gold = gold
+    player.inventory = _load_inventory(inventory_state)
+    player.equipped_weapon = player.inventory.get(weapon_key) if weapon_key else None
+    player.equipped_armor = player.inventory.get(armor_key) if armor_key else None
+    player.chosen_path = chosen_path
+    player.modifiers = ModifierStack.load_state(modifiers_state)
+    player.invalidate_combat_stats()
+
+    player.morgrath_encounters = morgrath_encounters
+    player.hidden_power_active = hidden_power_active
+    player.hidden_power_multiplier = hidden_power_multiplier
+
+
+def _load_quests(quest_manager, quests_state):
+    quests, active_ids, completed_ids = quests_state
+    all_quests = quest_manager.all_quests
+    for quest_id in (*(quest[0] for quest in quests), *active_ids, *completed_ids):
+        if quest_id not in all_quests:
+            raise SnapshotError(f"Quête inconnue dans la sauvegarde: {quest_id}")
+    for quest_id, completed_objectives, is_active, is_completed in quests:
+        quest = all_quests[quest_id]
+        quest.completed_objectives = list(completed_objectives)
+        quest.is_active = is_active
+        quest.is_completed = is_completed
+    quest_manager.active_quests = [all_quests[quest_id] for quest_id in active_ids]
+    quest_manager.completed_quests = [all_quests[quest_id] for quest_id in completed_ids]
+    quest_manager.rebuild_triggers()
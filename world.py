@@ -0,0 +1,304 @@
+"""
+world.py - Monde partagé et copies par session pour "L'Héritage des Cendres"
+Le graphe des pièces, leurs descriptions et leur contenu initial sont construits
+une seule fois par processus (WorldTemplate). Chaque partie n'en garde qu'un
+delta (World) : une pièce n'est copiée que lorsque la session la modifie.
+"""
+
+import copy
+from collections.abc import Mapping
+
+from room import Room
+from inventory import Inventory
+from character import get_character
+from enemy import EnemyCatalog
+
+
+class WorldTemplate:
+    """
+    Modèle du monde, partagé (en lecture seule) par toutes les sessions.
+    Ses pièces ne doivent jamais être modifiées : passer par World.edit().
+    """
+    
+    def __init__(self):
+        self.rooms = {}
+        self.build_rooms()
+        
+    def build_rooms(self):
+        """Construit les pièces, leurs sorties et leur contenu initial"""
+        # ACTE 1 - FUITE (6 pièces)
+        self.rooms["CHAMBRE_BRULANTE"] = Room(
+            "Chambre Brûlante",
+            "Votre chambre d'enfance est en flammes. La chaleur est insupportable."
+        )
+        
+        self.rooms["RUE_PRINCIPALE"] = Room(
+            "Rue Principale",
+            "La rue du village est jonchée de cadavres. Des cris résonnent au loin. "
+            "Trois chemins s'offrent à vous."
+        )
+        
+        self.rooms["TROU_MUR"] = Room(
+            "Trou dans le Mur",
+            "Vous avez trouvé une brèche dans le mur de la maison voisine. "
+            "C'est étroit mais praticable."
+        )
+        
+        self.rooms["RENCONTRE_ORC"] = Room(
+            "Rencontre Fatale",
+            "Un orc massif vous bloque le chemin. Ses yeux brûlent de haine. "
+            "Vous devez fuir pour sauver votre vie !"
+            "⚠️ INSTRUCTION: Tapez 'back' pour vous échapper !"
+        )
+        
+        self.rooms["ECOULEMENT"] = Room(
+            "Écoulement",
+            "Vous retournez à votre point de départ. Le feu gagne du terrain."
+        )
+        
+        self.rooms["FORET_FRONTIERE"] = Room(
+            "Forêt Frontière",
+            "Vous avez réussi à fuir le village. La forêt sombre s'étend devant vous. "
+            "ACTE 1 TERMINÉ - 5 ans plus tard..."
+        )
+        
+        # ACTE 2 - ENTRAÎNEMENT (4 pièces)
+        self.rooms["CAMP_MENTORS"] = Room(
+            "Camp des Mentors",
+            "5 ans ont passé. Lyra et Valerius vous ont entraîné. "
+            "Il est temps de choisir votre voie."
+        )
+        
+        self.rooms["ZONE_ENTRAINEMENT"] = Room(
+            "Zone d'Entraînement",
+            "Un terrain de pratique avec des cibles et des mannequins. "
+            "C'est ici que vous avez passé la plupart de votre temps."
+        )
+        
+        self.rooms["CLAIRIERE_ADIEU"] = Room(
+            "Clairière des Adieux",
+            "Un endroit paisible où vous avez fait la promesse "
+            "de ne jamais chercher la vengeance... une promesse brisée."
+        )
+        
+        self.rooms["CHEMIN_VALLEE_DEMONIAQUE"] = Room(
+            "Chemin de la Vallée Démoniaque",
+            "Un sentier sinueux qui s'enfonce dans les terres sombres. "
+            "L'air devient froid et suffocant. Des cris lointains résonnent "
+            "à travers la vallée. Des ombres étranges dansent entre les arbres. "
+            "Vous sentez que vous vous approchez du siège du pouvoir de Morgrath..."
+        )
+        
+        self.rooms["ANTRE_MORGRATH"] = Room(
+            "Antre de Morgrath",
+            "Vous vous trouvez enfin face à face avec votre destin. "
+            "L'antre de Morgrath s'étend devant vous, une caverne immense aux murs "
+            "de pierre noire suintant d'une énergie maléfique. Des flammes vertes "
+            "dansent sur le sol. Au loin, assis sur un trône de crânes, Morgrath "
+            "vous observe. Ses yeux rouges brillent d'une haine millénaire. "
+            "Le moment tant attendu est enfin arrivé. Votre vendetta prend fin ici. "
+            "\n\n⚔️ COMBAT FINAL IMMINENT ⚔️\n"
+            "Utilisez la commande 'fight morgrath' pour affronter le Roi Démon !"
+        )
+        
+        # Connecter les pièces de l'Acte 1
+        self.rooms["CHAMBRE_BRULANTE"].exits = {
+            "PORTE": self.rooms["RUE_PRINCIPALE"],
+            "FENETRE": None
+        }
+        
+        self.rooms["RUE_PRINCIPALE"].exits = {
+            "GAUCHE": self.rooms["TROU_MUR"],
+            "DROITE": self.rooms["RENCONTRE_ORC"],
+            "CENTRE": self.rooms["ECOULEMENT"],
+            "RETOUR": self.rooms["CHAMBRE_BRULANTE"]
+        }
+        
+        self.rooms["TROU_MUR"].exits = {
+            "CONTINUER": self.rooms["FORET_FRONTIERE"],
+            "RETOUR": self.rooms["RUE_PRINCIPALE"]
+        }
+        
+        self.rooms["RENCONTRE_ORC"].exits = {}
+        
+        self.rooms["ECOULEMENT"].exits = {
+            "RETOUR": self.rooms["RUE_PRINCIPALE"]
+        }
+        
+        self.rooms["FORET_FRONTIERE"].exits = {
+            "CONTINUER": self.rooms["CAMP_MENTORS"]
+        }
+        
+        # Connecter les pièces de l'Acte 2
+        self.rooms["CAMP_MENTORS"].exits = {
+            "ENTRAINEMENT": self.rooms["ZONE_ENTRAINEMENT"],
+            "FORET": self.rooms["CLAIRIERE_ADIEU"],
+            "VALLEE": self.rooms["CHEMIN_VALLEE_DEMONIAQUE"]
+        }
+        
+        self.rooms["ZONE_ENTRAINEMENT"].exits = {
+            "RETOUR": self.rooms["CAMP_MENTORS"]
+        }
+        
+        self.rooms["CLAIRIERE_ADIEU"].exits = {
+            "RETOUR": self.rooms["CAMP_MENTORS"],
+            "VENGEANCE": None
+        }
+        
+        self.rooms["CHEMIN_VALLEE_DEMONIAQUE"].exits = {
+            "RETOUR": self.rooms["CAMP_MENTORS"],
+            "CONTINUER": self.rooms["ANTRE_MORGRATH"]
+        }
+        
+        self.rooms["ANTRE_MORGRATH"].exits = {
+            "RETOUR": self.rooms["CHEMIN_VALLEE_DEMONIAQUE"]
+        }
+        
+        # Identifiants stables des pièces (utilisés par les sauvegardes)
+        for room_id, room in self.rooms.items():
+            room.room_id = room_id
+        
+        # Ajouter des objets dans certaines pièces
+        self.add_initial_items()
+        
+        # Ajouter des PNJ
+        self.add_initial_characters()
+        
+        # Ajouter des ennemis
+        self.add_initial_enemies()
+        
+    def add_initial_items(self):
+        """Ajoute des objets initiaux dans le monde"""
+        # Pour l'instant, on utilise des dictionnaires simples
+        # Plus tard, remplacer par des instances de Item
+        
+        # Objets dans la chambre brûlante
+        self.rooms["CHAMBRE_BRULANTE"].inventory = Inventory({
+            "journal": "Votre vieux journal, à moitié brûlé",
+            "medaillon": "Un médaillon avec le portrait de vos parents"
+        })
+        
+        # Objets dans la zone d'entraînement
+        self.rooms["ZONE_ENTRAINEMENT"].inventory = Inventory({
+            "arc": "Un arc d'entraînement en frêne",
+            "epee": "Une épée en bois pour la pratique",
+            "grimoire": "Un grimoire de sorts élémentaires"
+        })
+        
+    def add_initial_characters(self):
+        """Ajoute des PNJ initiaux dans le monde"""
+        # Créer des instances de PNJ depuis le catalogue
+        lyra = get_character("lyra")
+        if lyra:
+            lyra.current_room = self.rooms["CAMP_MENTORS"]
+            self.rooms["CAMP_MENTORS"].add_character("lyra", lyra)
+            
+        valerius = get_character("valerius")
+        if valerius:
+            valerius.current_room = self.rooms["CAMP_MENTORS"]
+            self.rooms["CAMP_MENTORS"].add_character("valerius", valerius)
+        
+        # Ajouter Morgrath dans son antre
+        morgrath = get_character("morgrath")
+        if morgrath:
+            morgrath.current_room = self.rooms["ANTRE_MORGRATH"]
+            self.rooms["ANTRE_MORGRATH"].add_character("morgrath", morgrath)
+    
+    def add_initial_enemies(self):
+        """Ajoute les ennemis initiaux dans le monde"""
+        # Ajouter Morgrath comme ennemi dans son antre
+        morgrath_enemy = EnemyCatalog.create_enemy("MORGRATH")
+        if morgrath_enemy:
+            self.rooms["ANTRE_MORGRATH"].add_enemy("morgrath", morgrath_enemy)
+
+
+# Modèle partagé par toutes les parties du processus (construit à la demande)
+_world_template = None
+
+
+def get_world_template():
+    """Retourne le modèle du monde, construit au premier appel"""
+    global _world_template
+    if _world_template is None:
+        _world_template = WorldTemplate()
+    return _world_template
+
+
+class World(Mapping):
+    """
+    Monde d'une session : id de pièce -> Room.
+    Les pièces non modifiées sont celles du modèle partagé ; la première
+    modification d'une pièce (edit) en crée une copie propre à la session.
+    """
+    
+    def __init__(self, template, rng=None):
+        """
+        Args:
+            template (WorldTemplate): Le modèle partagé
+            rng (GameRandom, optional): Générateur donné aux ennemis et PNJ copiés
+        """
+        self.template = template
+        self.rng = rng
+        self.delta = {} # Pièces copiées par cette session : id -> Room
+        
+    def __getitem__(self, room_id):
+        room = self.delta.get(room_id)
+        if room is None:
+            room = self.template.rooms[room_id]
+        return room
+    
+    def __iter__(self):
+        return iter(self.template.rooms)
+    
+    def __len__(self):
+        return len(self.template.rooms)
+    
+    def resolve(self, room):
+        """Retourne la version de la pièce propre à cette session"""
+        if room is None:
+            return None
+        return self.delta.get(room.room_id, room)
+    
+    def edit(self, room):
+        """
+        Retourne une pièce modifiable par cette session (copy-on-write)
+        
+        Args:
+            room (Room | str): La pièce ou son identifiant
+            
+        Returns:
+            Room: La copie de la session (créée à la première modification)
+        """
+        room_id = room if isinstance(room, str) else room.room_id
+        edited = self.delta.get(room_id)
+        if edited is None:
+            edited = self._copy_room(self.template.rooms[room_id])
+            self.delta[room_id] = edited
+        return edited
+    
+    def reset(self):
+        """Oublie toutes les modifications de la session"""
+        self.delta.clear()
+    
+    def _copy_room(self, shared):
+        """Copie une pièce du modèle : le graphe et les textes restent partagés"""
+        room = Room(shared.name, shared.description)
+        room.room_id = shared.room_id
+        room.exits = shared.exits # Jamais modifié, les pièces cibles sont résolues à la volée
+        
+        room.inventory = shared.inventory.copy()
+        
+        for name, enemy in shared.enemies.items():
+            enemy = copy.copy(enemy)
+            if self.rng is not None:
+                enemy.rng = self.rng
+            room.enemies[name] = enemy
+        
+        for name, character in shared.characters.items():
+            character = copy.copy(character)
+            character.current_room = room
+            if self.rng is not None:
+                character.rng = self.rng
+            room.characters[name] = character
+        
+        return room